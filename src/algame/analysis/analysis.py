@@ -14,6 +14,8 @@ import numpy as np
 from datetime import datetime
 import logging
 
+from ..strategy._stats import equity_stats
+
 logger = logging.getLogger(__name__)
 
 class PerformanceMetrics:
@@ -43,8 +45,10 @@ class PerformanceMetrics:
 
     def _calculate_returns(self):
         """Calculate return metrics."""
-        # Return series
-        self.returns = self.equity.pct_change()
+        # Return and drawdown series in one pass
+        returns, _, drawdowns = equity_stats(self.equity.to_numpy(dtype=float))
+        self.returns = pd.Series(returns, index=self.equity.index)
+        self.drawdowns = pd.Series(drawdowns, index=self.equity.index)
 
         # Total return
         self.total_return = (self.equity[-1] / self.equity[0] - 1) * 100
@@ -66,12 +70,8 @@ class PerformanceMetrics:
 
     def _calculate_drawdowns(self):
         """Calculate drawdown metrics."""
-        # Running maximum
-        running_max = self.equity.expanding().max()
-
-        # Drawdown series
-        drawdowns = (self.equity - running_max) / running_max * 100
-        self.drawdowns = drawdowns
+        # Drawdown series (computed with returns)
+        drawdowns = self.drawdowns
 
         # Maximum drawdown
         self.max_drawdown = drawdowns.min()
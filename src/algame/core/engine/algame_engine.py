@@ -1,4 +1,4 @@
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Optional, Tuple, Union
 import pandas as pd
 import numpy as np
 from datetime import datetime
@@ -13,6 +13,7 @@ from .interface import (
     TradeStats,
     EngineConfig
 )
+from ...strategy._stats import equity_stats
 
 logger = logging.getLogger(__name__)
 
@@ -352,24 +353,27 @@ class CustomEngine(BacktestEngineInterface):
         # Sort trades by time
         all_trades.sort(key=lambda x: x.entry_time)
 
+        returns, drawdowns = self._calculate_returns_drawdowns(total_equity)
+
         return BacktestResult(
             equity_curve=total_equity,
             trades=all_trades,
             positions=pd.DataFrame([vars(t) for t in all_trades]),
             metrics=self.calculate_metrics(total_equity, all_trades),
-            drawdowns=self._calculate_drawdowns(total_equity),
-            returns=total_equity.pct_change(),
+            drawdowns=drawdowns,
+            returns=returns,
             exposure=self._calculate_exposure(all_trades),
             start_date=total_equity.index[0],
             end_date=total_equity.index[-1],
             config=self.config
         )
 
-    def _calculate_drawdowns(self, equity: pd.Series) -> pd.Series:
-        """Calculate drawdown series."""
-        peak = equity.expanding().max()
-        drawdown = (equity - peak) / peak * 100
-        return drawdown
+    def _calculate_returns_drawdowns(
+            self, equity: pd.Series) -> Tuple[pd.Series, pd.Series]:
+        """Calculate return and drawdown series in one pass."""
+        returns, _, drawdowns = equity_stats(equity.to_numpy(dtype=float))
+        return (pd.Series(returns, index=equity.index),
+                pd.Series(drawdowns, index=equity.index))
 
     def _calculate_exposure(self, trades: List[TradeStats]) -> float:
         """Calculate market exposure percentage."""
@@ -0,0 +1,272 @@
+"""
+Matplotlib analysis chart component.
+
+This module provides a simple embedded matplotlib chart used by the
+results panels for:
+1. Line plots (equity, drawdown, returns)
+2. Trade markers
+3. Histograms with summary statistics
+4. Bar charts
+
+Unlike the canvas-based price chart in ``charts``, this chart draws
+through matplotlib so it can render statistical plots.
+"""
+
+from tkinter import ttk
+from typing import Dict, List, Optional, Any, Sequence, Union
+import numpy as np
+import pandas as pd
+import logging
+
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+logger = logging.getLogger(__name__)
+
+# Marker shape per marker kind
+MARKER_STYLES = {
+    'entry': '^',
+    'exit': 'v'
+}
+
+class Chart(ttk.Frame):
+    """
+    Embedded matplotlib chart.
+
+    Features:
+    - Line plots of series data, updatable in place
+    - Batched trade markers
+    - Histograms with stats box
+    - Bar charts
+
+    Each plot call replaces the previous plot.
+    """
+
+    def __init__(self, master, **kwargs):
+        """
+        Initialize chart.
+
+        Args:
+            master: Parent widget
+            **kwargs: Additional config
+        """
+        super().__init__(master)
+
+        # Figure and axes
+        self.figure = Figure(figsize=kwargs.get('figsize', (6, 4)), dpi=100)
+        self.ax = self.figure.add_subplot(111)
+
+        # Tk canvas
+        self.canvas = FigureCanvasTkAgg(self.figure, master=self)
+        self.canvas.get_tk_widget().pack(fill='both', expand=True)
+
+        # Artists kept for in-place updates
+        self._line = None
+        self._markers: List[Any] = []
+
+        # Stats box reused across plots
+        self._stats_text = self.ax.text(
+            0.98, 0.98, "",
+            transform=self.ax.transAxes,
+            ha='right', va='top',
+            bbox={'boxstyle': 'round', 'facecolor': 'white', 'alpha': 0.8},
+            visible=False
+        )
+
+    @property
+    def axes(self):
+        """Get chart axes."""
+        return self.ax
+
+    def clear(self):
+        """Clear chart."""
+        self._clear_axes()
+        self.canvas.draw_idle()
+
+    def _clear_axes(self):
+        """Clear axes and drop cached artists."""
+        self.ax.cla()
+        self._line = None
+        self._markers = []
+
+        # Keep stats box, hidden until next stats
+        self.ax.add_artist(self._stats_text)
+        self._stats_text.set_visible(False)
+
+    def _set_stats(self, stats: Optional[Dict[str, str]]):
+        """Show stats in corner box."""
+        if stats:
+            self._stats_text.set_text("\n".join(f"{k}: {v}" for k, v in stats.items()))
+            self._stats_text.set_visible(True)
+
+    def plot(self,
+            data: pd.Series,
+            title: str = "",
+            y_label: str = ""):
+        """
+        Plot series as line.
+
+        Args:
+            data: Series to plot
+            title: Chart title
+            y_label: Y-axis label
+        """
+        self._clear_axes()
+        self._line, = self.ax.plot(data.index, data.to_numpy())
+        self.ax.set_title(title)
+        self.ax.set_ylabel(y_label)
+        self.ax.grid(True, alpha=0.3)
+        self.canvas.draw_idle()
+
+    def update_data(self, data: pd.Series):
+        """
+        Replace line data, keeping title, labels and styling.
+
+        Falls back to a full plot if no line exists yet.
+
+        Args:
+            data: Series to plot
+        """
+        if self._line is None:
+            self.plot(data)
+            return
+
+        self._line.set_data(data.index, data.to_numpy())
+        self.ax.relim()
+        self.ax.autoscale_view()
+        self.canvas.draw_idle()
+
+    def clear_markers(self):
+        """Remove all markers."""
+        for markers in self._markers:
+            markers.remove()
+        self._markers = []
+        self.canvas.draw_idle()
+
+    def add_marker(self,
+                  time: Any,
+                  value: float,
+                  kind: str,
+                  color: str = 'blue'):
+        """
+        Add single marker.
+
+        Args:
+            time: Marker x position
+            value: Marker y position
+            kind: Marker kind ('entry' or 'exit')
+            color: Marker color
+        """
+        self.add_markers([time], [value], kind, [color])
+
+    def add_markers(self,
+                   times: Sequence,
+                   values: Sequence[float],
+                   kind: str,
+                   colors: Union[str, Sequence[str]]):
+        """
+        Add many markers in one call.
+
+        Args:
+            times: Marker x positions
+            values: Marker y positions
+            kind: Marker kind ('entry' or 'exit')
+            colors: Single color or one color per marker
+        """
+        if len(times) == 0:
+            return
+
+        markers = self.ax.scatter(
+            times,
+            values,
+            c=colors,
+            marker=MARKER_STYLES.get(kind, 'o'),
+            zorder=3
+        )
+        self._markers.append(markers)
+        self.canvas.draw_idle()
+
+    def plot_histogram(self,
+                      values: Union[pd.Series, np.ndarray, List[float]],
+                      title: str = "",
+                      xlabel: str = "",
+                      ylabel: str = "",
+                      stats: Optional[Dict[str, str]] = None,
+                      bins: int = 50):
+        """
+        Plot histogram.
+
+        Args:
+            values: Values to bin
+            title: Chart title
+            xlabel: X-axis label
+            ylabel: Y-axis label
+            stats: Optional stats shown in corner box
+            bins: Number of bins
+        """
+        values = np.asarray(values)
+        counts, edges = np.histogram(values[~np.isnan(values)], bins=bins)
+        self.plot_precomputed_hist(counts, edges, title, xlabel, ylabel, stats)
+
+    def plot_precomputed_hist(self,
+                             counts: np.ndarray,
+                             edges: np.ndarray,
+                             title: str = "",
+                             xlabel: str = "",
+                             ylabel: str = "",
+                             stats: Optional[Dict[str, str]] = None):
+        """
+        Plot histogram from precomputed bins.
+
+        Args:
+            counts: Count per bin
+            edges: Bin edges (one more than counts)
+            title: Chart title
+            xlabel: X-axis label
+            ylabel: Y-axis label
+            stats: Optional stats shown in corner box
+        """
+        self._clear_axes()
+        self.ax.bar(
+            edges[:-1],
+            counts,
+            width=np.diff(edges),
+            align='edge',
+            alpha=0.7
+        )
+        self.ax.set_title(title)
+        self.ax.set_xlabel(xlabel)
+        self.ax.set_ylabel(ylabel)
+
+        self._set_stats(stats)
+        self.canvas.draw_idle()
+
+    def plot_bar(self,
+                labels: List[str],
+                values: List[float],
+                title: str = "",
+                xlabel: str = "",
+                ylabel: str = "",
+                percentage: bool = False):
+        """
+        Plot bar chart.
+
+        Args:
+            labels: Bar labels
+            values: Bar heights
+            title: Chart title
+            xlabel: X-axis label
+            ylabel: Y-axis label
+            percentage: Whether values are fractions shown as percent
+        """
+        self._clear_axes()
+
+        heights = np.asarray(values, dtype=float)
+        if percentage:
+            heights = heights * 100
+
+        self.ax.bar(labels, heights)
+        self.ax.set_title(title)
+        self.ax.set_xlabel(xlabel)
+        self.ax.set_ylabel(ylabel)
+        self.canvas.draw_idle()
@@ -11,14 +11,26 @@ This panel provides:
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-from typing import Optional
+from typing import Optional, List, Tuple
+from concurrent.futures import ThreadPoolExecutor, Future
 import logging
+import threading
+import difflib
 from pathlib import Path
 
 from ...tools.converter import PineScriptConverter
 
 logger = logging.getLogger(__name__)
 
+# File I/O is done off the Tk thread with buffers of this size
+IO_CHUNK_SIZE = 1 << 20
+
+# Large previews are inserted in chunks of this size
+PREVIEW_CHUNK_SIZE = 1 << 16
+
+# Interval for checking editor modified flag
+MODIFIED_POLL_MS = 200
+
 class ConverterPanel(ttk.Frame):
     """
     PineScript converter panel.
@@ -31,21 +43,54 @@ class ConverterPanel(ttk.Frame):
     - Validation indicators
     """
 
+    # Template names shared by all panels (filled on first use)
+    _template_names: Optional[List[str]] = None
+
     def __init__(self, master):
         super().__init__(master)
 
-        # Initialize converter
-        self.converter = PineScriptConverter()
+        # Converter is created on first use or by background warmup
+        self._converter: Optional[PineScriptConverter] = None
+        self._converter_lock = threading.Lock()
 
         # State
         self.current_file: Optional[str] = None
         self.modified = False
 
+        # Cached editor/preview contents (avoids Tcl round-trips)
+        self._pine_text_cache: Optional[str] = None
+        self._last_python = ''
+        self._preview_feed_id: Optional[str] = None
+
+        # Background file I/O, polled from the Tk thread
+        self._pool = ThreadPoolExecutor(max_workers=1)
+        self._open_id: Optional[str] = None
+        self._saves: List[Tuple[str, Future]] = []
+        self._save_poll_id: Optional[str] = None
+
         # Create UI
         self._create_widgets()
         self._create_layout()
         self._bind_events()
 
+        # Warm converter off the Tk thread so first Convert is fast
+        threading.Thread(target=self._warm_converter, daemon=True).start()
+
+    @property
+    def converter(self) -> PineScriptConverter:
+        """Get converter, creating it on first access."""
+        with self._converter_lock:
+            if self._converter is None:
+                self._converter = PineScriptConverter()
+        return self._converter
+
+    def _warm_converter(self):
+        """Create converter and load its lazy dependencies."""
+        try:
+            self.converter.warmup()
+        except Exception as e:
+            logger.warning(f"Converter warmup failed: {str(e)}")
+
     def _create_widgets(self):
         """Create panel widgets."""
         # Toolbar
@@ -74,7 +119,7 @@ class ConverterPanel(ttk.Frame):
         self.template_combo = ttk.Combobox(
             self.toolbar,
             textvariable=self.template_var,
-            values=list(self.converter.templates.keys()),
+            postcommand=self._refresh_templates,
             state='readonly',
             width=20
         )
@@ -116,6 +161,23 @@ class ConverterPanel(ttk.Frame):
         # Status bar
         self.status = ttk.Label(self, text="Ready")
 
+        # File dialogs (reused across calls)
+        self._open_dialog = filedialog.Open(
+            parent=self,
+            filetypes=[
+                ("PineScript files", "*.pine"),
+                ("All files", "*.*")
+            ]
+        )
+        self._save_dialog = filedialog.SaveAs(
+            parent=self,
+            defaultextension=".py",
+            filetypes=[
+                ("Python files", "*.py"),
+                ("All files", "*.*")
+            ]
+        )
+
     def _create_layout(self):
         """Create panel layout."""
         # Toolbar at top
@@ -129,11 +191,11 @@ class ConverterPanel(ttk.Frame):
 
     def _bind_events(self):
         """Bind event handlers."""
-        # Text change events
-        self.pine_editor.bind('<<Modified>>', self._on_text_change)
+        # Text changes are picked up by polling the modified flag
+        self._poll_id = self.after(MODIFIED_POLL_MS, self._poll_modified)
 
-        # Template selection
-        self.template_var.trace('w', self._on_template_change)
+        # Template selection (user picks only, not programmatic writes)
+        self.template_combo.bind('<<ComboboxSelected>>', self._on_template_change)
 
     def _open_file(self):
         """Open PineScript file."""
@@ -144,55 +206,90 @@ class ConverterPanel(ttk.Frame):
             ):
                 return
 
-        filename = filedialog.askopenfilename(
-            filetypes=[
-                ("PineScript files", "*.pine"),
-                ("All files", "*.*")
-            ]
-        )
+        filename = self._open_dialog.show()
 
         if filename:
-            try:
-                with open(filename, 'r') as f:
-                    content = f.read()
+            self.set_status(f"Opening {filename}...")
 
-                self.pine_editor.delete('1.0', 'end')
-                self.pine_editor.insert('1.0', content)
+            # Newer open supersedes one still reading
+            if self._open_id is not None:
+                self.after_cancel(self._open_id)
 
-                self.current_file = filename
-                self.modified = False
+            # Read on worker thread, replace editor text on Tk thread
+            future = self._pool.submit(self._read_file, filename)
+            self._open_id = self.after(10, self._check_open, filename, future)
 
-                self.set_status(f"Opened {filename}")
+    def _read_file(self, filename: str) -> str:
+        """Read file contents (runs on worker thread)."""
+        with open(filename, 'r', buffering=IO_CHUNK_SIZE) as f:
+            return f.read()
 
-            except Exception as e:
-                messagebox.showerror(
-                    "Error",
-                    f"Failed to open file: {str(e)}"
-                )
+    def _check_open(self, filename: str, future: Future):
+        """Check background read, loading editor once it succeeds."""
+        if not future.done():
+            self._open_id = self.after(10, self._check_open, filename, future)
+            return
+        self._open_id = None
+
+        try:
+            content = future.result()
+        except Exception as e:
+            # Editor and current file are left untouched
+            self.set_status("Ready")
+            messagebox.showerror(
+                "Error",
+                f"Failed to open file: {str(e)}"
+            )
+            return
+
+        # Whole file read, replace old content in one call
+        self.pine_editor.replace('1.0', 'end', content)
+
+        self._pine_text_cache = None
+        self.pine_editor.edit_modified(False)
+
+        self.current_file = filename
+        self.modified = False
+
+        self.set_status(f"Opened {filename}")
 
     def _save_file(self):
         """Save converted Python code."""
-        if not self.python_preview.get('1.0', 'end').strip():
+        if not self._last_python.strip():
             messagebox.showwarning(
                 "No Code",
                 "No Python code to save."
             )
             return
 
-        filename = filedialog.asksaveasfilename(
-            defaultextension=".py",
-            filetypes=[
-                ("Python files", "*.py"),
-                ("All files", "*.*")
-            ]
-        )
+        filename = self._save_dialog.show()
 
         if filename:
-            try:
-                code = self.python_preview.get('1.0', 'end')
-                with open(filename, 'w') as f:
-                    f.write(code)
+            code = self._last_python
+            self.set_status(f"Saving to {filename}...")
+
+            # Write on worker thread
+            future = self._pool.submit(self._write_file, filename, code)
+            self._saves.append((filename, future))
+            if self._save_poll_id is None:
+                self._save_poll_id = self.after(10, self._check_saves)
+
+    def _write_file(self, filename: str, code: str):
+        """Write code to file (runs on worker thread)."""
+        # Large buffer, no newline translation and no fsync
+        with open(filename, 'w', buffering=IO_CHUNK_SIZE, newline='') as f:
+            f.write(code)
+
+    def _check_saves(self):
+        """Report finished background saves."""
+        pending = []
+        for filename, future in self._saves:
+            if not future.done():
+                pending.append((filename, future))
+                continue
 
+            try:
+                future.result()
                 self.set_status(f"Saved to {filename}")
 
             except Exception as e:
@@ -201,9 +298,12 @@ class ConverterPanel(ttk.Frame):
                     f"Failed to save file: {str(e)}"
                 )
 
+        self._saves = pending
+        self._save_poll_id = self.after(10, self._check_saves) if pending else None
+
     def _convert_code(self):
         """Convert current PineScript code."""
-        pine_code = self.pine_editor.get('1.0', 'end')
+        pine_code = self._get_pine_code()
         if not pine_code.strip():
             messagebox.showwarning(
                 "No Code",
@@ -213,19 +313,14 @@ class ConverterPanel(ttk.Frame):
 
         try:
             # Get template if selected
-            template = None
-            if self.template_var.get():
-                template = self.template_var.get()
+            template = self.template_var.get() or None
 
             # Convert code
-            result = self.converter.convert(pine_code)
+            result = self.converter.convert(pine_code, template=template)
 
             if result.success:
                 # Update preview
-                self.python_preview['state'] = 'normal'
-                self.python_preview.delete('1.0', 'end')
-                self.python_preview.insert('1.0', result.python_code)
-                self.python_preview['state'] = 'disabled'
+                self._update_preview(result.python_code)
 
                 # Show warnings if any
                 if result.warnings:
@@ -248,11 +343,89 @@ class ConverterPanel(ttk.Frame):
                 f"Conversion error: {str(e)}"
             )
 
-    def _on_text_change(self, event):
-        """Handle text changes."""
-        self.modified = True
+    def _update_preview(self, code: str):
+        """
+        Update Python preview.
+
+        Only line ranges that differ from the previous code are
+        rewritten, so small re-conversions touch little of the widget.
+        Large full rewrites are streamed in chunks between idle events.
+        """
+        old_lines = self._last_python.splitlines(keepends=True)
+        new_lines = code.splitlines(keepends=True)
+
+        if self._preview_feed_id is not None:
+            # Previous stream unfinished, widget content is partial
+            self.after_cancel(self._preview_feed_id)
+            self._preview_feed_id = None
+            old_lines = []
+
+        self._last_python = code
+
+        if not old_lines and len(code) > PREVIEW_CHUNK_SIZE:
+            chunks = [
+                code[i:i + PREVIEW_CHUNK_SIZE]
+                for i in range(0, len(code), PREVIEW_CHUNK_SIZE)
+            ]
+            self._feed_preview(chunks, 0)
+            return
+
+        self.python_preview.configure(state='normal')
+
+        if not old_lines:
+            self.python_preview.replace('1.0', 'end', code)
+        else:
+            matcher = difflib.SequenceMatcher(
+                None, old_lines, new_lines, autojunk=False)
+
+            # Apply bottom-up so earlier line indices stay valid
+            for tag, i1, i2, j1, j2 in reversed(matcher.get_opcodes()):
+                if tag == 'equal':
+                    continue
+                self.python_preview.replace(
+                    f'{i1 + 1}.0',
+                    f'{i2 + 1}.0',
+                    ''.join(new_lines[j1:j2])
+                )
 
-    def _on_template_change(self, *args):
+        self.python_preview.configure(state='disabled')
+
+    def _feed_preview(self, chunks: List[str], i: int):
+        """Insert one preview chunk and schedule the next."""
+        self.python_preview.configure(state='normal')
+        if i == 0:
+            self.python_preview.replace('1.0', 'end', chunks[0])
+        else:
+            self.python_preview.insert('end-1c', chunks[i])
+        self.python_preview.configure(state='disabled')
+
+        if i + 1 < len(chunks):
+            self._preview_feed_id = self.after_idle(self._feed_preview, chunks, i + 1)
+        else:
+            self._preview_feed_id = None
+
+    def _poll_modified(self):
+        """Check editor for changes and reschedule."""
+        self._flush_modified()
+        self._poll_id = self.after(MODIFIED_POLL_MS, self._poll_modified)
+
+    def _flush_modified(self):
+        """Mark editor dirty if its modified flag is set."""
+        if self.pine_editor.edit_modified():
+            self.modified = True
+            self._pine_text_cache = None
+
+            # Re-arm modified flag
+            self.pine_editor.edit_modified(False)
+
+    def _get_pine_code(self) -> str:
+        """Get editor contents, reading from Tk only when changed."""
+        self._flush_modified()
+        if self._pine_text_cache is None:
+            self._pine_text_cache = self.pine_editor.get('1.0', 'end-1c')
+        return self._pine_text_cache
+
+    def _on_template_change(self, event=None):
         """Handle template selection."""
         template = self.template_var.get()
         if template:
@@ -261,8 +434,7 @@ class ConverterPanel(ttk.Frame):
                 content = self.converter.get_template(template)
 
                 # Show template in editor
-                self.pine_editor.delete('1.0', 'end')
-                self.pine_editor.insert('1.0', content)
+                self.pine_editor.replace('1.0', 'end', content)
 
                 self.set_status(f"Loaded template: {template}")
 
@@ -272,6 +444,23 @@ class ConverterPanel(ttk.Frame):
                     f"Failed to load template: {str(e)}"
                 )
 
+    def _refresh_templates(self):
+        """Populate template list when dropdown opens."""
+        if ConverterPanel._template_names is None:
+            ConverterPanel._template_names = sorted(self.converter.templates.keys())
+        self.template_combo['values'] = ConverterPanel._template_names
+
     def set_status(self, message: str):
         """Set status message."""
         self.status['text'] = message
+
+    def destroy(self):
+        """Stop polling and background I/O, and destroy panel."""
+        self.after_cancel(self._poll_id)
+        for after_id in (self._preview_feed_id, self._open_id, self._save_poll_id):
+            if after_id is not None:
+                self.after_cancel(after_id)
+
+        # Running writes finish; their results are no longer reported
+        self._pool.shutdown(wait=False)
+        super().destroy()
@@ -16,17 +16,51 @@ The panel is organized into tabs for different analysis views:
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-from typing import Dict, Optional, Any, List
+from typing import Dict, Optional, Any, List, Set
 import pandas as pd
 import numpy as np
 from datetime import datetime
 import logging
 
 from ...core.engine import BacktestResult
+from ...strategy._stats import (
+    moments4,
+    mean_std,
+    sharpe_ratio,
+    sortino_ratio,
+    calmar_ratio,
+    recovery_factor,
+    max_drawdown_duration
+)
 from ..components.chart import Chart
 
 logger = logging.getLogger(__name__)
 
+# Columns of the per-results trade table
+TRADE_COLUMNS = [
+    'entry_time', 'exit_time', 'type', 'size', 'entry_price',
+    'exit_price', 'pnl', 'return_pct', 'fees'
+]
+
+# Bins in return/drawdown histograms
+HISTOGRAM_BINS = 50
+
+# Timestamp format in trade list
+TRADE_TIME_FORMAT = '%Y-%m-%d %H:%M'
+
+# Column headers used in CSV/Excel exports
+TRADE_EXPORT_HEADERS = {
+    'entry_time': 'Entry Time',
+    'exit_time': 'Exit Time',
+    'type': 'Type',
+    'size': 'Size',
+    'entry_price': 'Entry Price',
+    'exit_price': 'Exit Price',
+    'pnl': 'P&L',
+    'return_pct': 'Return %',
+    'fees': 'Fees'
+}
+
 class ResultsPanel(ttk.Frame):
     """
     Backtest results analysis panel.
@@ -49,6 +83,29 @@ class ResultsPanel(ttk.Frame):
         self.results: Optional[BacktestResult] = None
         self._current_trade = None
 
+        # Column-wise trade table built once per results
+        self._trades_df: Optional[pd.DataFrame] = None
+
+        # Formatted trade rows; only the visible window is in the tree
+        self._trade_rows: List[tuple] = []
+        self._row_offset = 0
+        self._visible_rows = 1
+        self._selected_row: Optional[int] = None
+
+        # Analysis statistics for current results
+        self._stats_cache: Dict[str, tuple] = {}
+
+        # Formatted summary text and metric labels, keyed by id(results)
+        self._summary_cache: Dict[int, str] = {}
+        self._metric_cache: Dict[int, Dict[str, str]] = {}
+
+        # Plot type currently drawn on equity chart
+        self._equity_plot_type: Optional[str] = None
+
+        # View updates coalesced until idle
+        self._pending_updates: Set[str] = set()
+        self._after_id: Optional[str] = None
+
         # Create widgets
         self._create_widgets()
         self._create_layout()
@@ -64,22 +121,34 @@ class ResultsPanel(ttk.Frame):
         # Summary tab
         self.summary_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.summary_frame, text="Summary")
-        self._create_summary_tab()
 
         # Equity tab
         self.equity_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.equity_frame, text="Equity")
-        self._create_equity_tab()
 
         # Trades tab
         self.trades_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.trades_frame, text="Trades")
-        self._create_trades_tab()
 
         # Analysis tab
         self.analysis_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.analysis_frame, text="Analysis")
-        self._create_analysis_tab()
+
+        # Tab contents are built on first selection (summary up front)
+        self._tab_builders = {
+            0: self._create_summary_tab,
+            1: self._create_equity_tab,
+            2: self._create_trades_tab,
+            3: self._create_analysis_tab
+        }
+        self._tab_updaters = {
+            0: self._update_summary,
+            1: self._update_equity_chart,
+            2: self._update_trades,
+            3: self._update_analysis
+        }
+        self._tab_built = {0: True}
+        self._create_summary_tab()
 
         # Toolbar
         self.toolbar = ttk.Frame(self)
@@ -168,6 +237,9 @@ class ResultsPanel(ttk.Frame):
             variable=self.show_trades
         ).pack(side='left', padx=10)
 
+        self.plot_type.trace('w', lambda *args: self._schedule('equity'))
+        self.show_trades.trace('w', lambda *args: self._schedule('equity'))
+
     def _create_trades_tab(self):
         """Create trades list view."""
         # Trade list
@@ -188,17 +260,16 @@ class ResultsPanel(ttk.Frame):
         self.trade_list.heading('pnl', text='P&L')
         self.trade_list.heading('return', text='Return %')
 
-        # Scrollbar
-        scrollbar = ttk.Scrollbar(
+        # Scrollbar drives the row offset, not the tree's own view
+        self.trade_scrollbar = ttk.Scrollbar(
             list_frame,
             orient='vertical',
-            command=self.trade_list.yview
+            command=self._on_trade_scroll
         )
-        self.trade_list.configure(yscrollcommand=scrollbar.set)
 
         # Layout
         self.trade_list.pack(side='left', fill='both', expand=True)
-        scrollbar.pack(side='right', fill='y')
+        self.trade_scrollbar.pack(side='right', fill='y')
 
         # Trade details
         details_frame = ttk.LabelFrame(self.trades_frame, text="Trade Details")
@@ -212,6 +283,12 @@ class ResultsPanel(ttk.Frame):
         )
         self.trade_details.pack(fill='x', padx=5, pady=5)
 
+        self.trade_list.bind('<<TreeviewSelect>>', self._on_trade_select)
+        self.trade_list.bind('<Configure>', self._on_trade_list_resize)
+        self.trade_list.bind('<MouseWheel>', self._on_trade_wheel)
+        self.trade_list.bind('<Button-4>', self._on_trade_wheel)
+        self.trade_list.bind('<Button-5>', self._on_trade_wheel)
+
     def _create_analysis_tab(self):
         """Create detailed analysis view."""
         # Metrics selection
@@ -228,6 +305,7 @@ class ResultsPanel(ttk.Frame):
                 'drawdowns',
                 'trade_pnl',
                 'win_rate',
+                'win_rate_by_hour',
                 'position_size'
             ],
             state='readonly',
@@ -238,6 +316,8 @@ class ResultsPanel(ttk.Frame):
         self.analysis_chart = Chart(self.analysis_frame)
         self.analysis_chart.pack(fill='both', expand=True, padx=5, pady=5)
 
+        self.analysis_metric.trace('w', lambda *args: self._schedule('analysis'))
+
     def _create_layout(self):
         """Create panel layout."""
         # Notebook
@@ -248,20 +328,57 @@ class ResultsPanel(ttk.Frame):
 
     def _bind_events(self):
         """Bind event handlers."""
-        self.plot_type.trace('w', lambda *args: self._update_equity_chart())
-        self.show_trades.trace('w', lambda *args: self._update_equity_chart())
-        self.analysis_metric.trace('w', lambda *args: self._update_analysis())
-        self.trade_list.bind('<<TreeviewSelect>>', self._on_trade_select)
+        # Per-tab handlers are bound when each tab is built
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
+
+    def _on_tab_changed(self, event):
+        """Build selected tab on first visit."""
+        index = self.notebook.index('current')
+        if index in self._tab_built:
+            return
+
+        self._tab_builders[index]()
+        self._tab_built[index] = True
+
+        if self.results:
+            self._tab_updaters[index]()
+
+    def _schedule(self, view: str):
+        """
+        Schedule view update for next idle time.
+
+        Repeated requests before the update runs are coalesced.
+
+        Args:
+            view: View to update ('equity' or 'analysis')
+        """
+        self._pending_updates.add(view)
+        if self._after_id is None:
+            self._after_id = self.after_idle(self._flush_updates)
+
+    def _flush_updates(self):
+        """Run pending view updates once each."""
+        self._after_id = None
+        pending, self._pending_updates = self._pending_updates, set()
+
+        if 'equity' in pending:
+            self._update_equity_chart()
+        if 'analysis' in pending:
+            self._update_analysis()
+
+    def _update_built_tabs(self):
+        """Update views of tabs that have been built."""
+        for index in self._tab_built:
+            self._tab_updaters[index]()
 
     def show_results(self, results: BacktestResult):
         """Show backtest results."""
+        self._invalidate_caches()
         self.results = results
+        self._trades_df = self._build_trades_df(results.trades)
 
-        # Update all views
-        self._update_summary()
-        self._update_equity_chart()
-        self._update_trades()
-        self._update_analysis()
+        # Update built views (others update when first shown)
+        self._update_built_tabs()
 
         # Switch to summary tab
         self.notebook.select(0)
@@ -273,32 +390,76 @@ class ResultsPanel(ttk.Frame):
         if not self.results:
             return
 
+        key = id(self.results)
+
         # Update metrics
-        for key, (label, fmt) in self.metric_labels.items():
-            value = self.results.metrics.get(key, 0)
-            label['text'] = fmt.format(value)
+        if key not in self._metric_cache:
+            self._fill_missing_metrics()
+            self._metric_cache[key] = {
+                name: fmt.format(self.results.metrics.get(name, 0))
+                for name, (label, fmt) in self.metric_labels.items()
+            }
+        for name, text in self._metric_cache[key].items():
+            self.metric_labels[name][0]['text'] = text
 
         # Update trade summary
-        self.summary_text['state'] = 'normal'
-        self.summary_text.delete('1.0', 'end')
+        if key not in self._summary_cache:
+            self._summary_cache[key] = self._generate_summary()
 
-        summary = self._generate_summary()
-        self.summary_text.insert('1.0', summary)
+        self.summary_text['state'] = 'normal'
+        self.summary_text.replace('1.0', 'end', self._summary_cache[key])
         self.summary_text['state'] = 'disabled'
 
+    def _fill_missing_metrics(self):
+        """Compute ratio metrics the engine didn't provide."""
+        metrics = self.results.metrics
+        returns = self.results.returns.to_numpy(dtype=float)
+        equity = self.results.equity_curve.to_numpy(dtype=float)
+
+        derived = {
+            'sharpe_ratio': lambda: sharpe_ratio(returns),
+            'sortino_ratio': lambda: sortino_ratio(returns),
+            'calmar_ratio': lambda: calmar_ratio(equity),
+            'recovery_factor': lambda: recovery_factor(equity),
+            'max_drawdown_duration': lambda: max_drawdown_duration(equity)
+        }
+
+        # Stored on results so other views see the same values
+        for name, compute in derived.items():
+            if metrics.get(name) is None:
+                metrics[name] = compute()
+
+    def _build_trades_df(self, trades: List[Any]) -> pd.DataFrame:
+        """Build column-wise trade table (one attribute pass over trades)."""
+        return pd.DataFrame.from_records(
+            [
+                (t.entry_time, t.exit_time, t.type, t.size, t.entry_price,
+                 t.exit_price, t.pnl, t.return_pct, t.fees)
+                for t in trades
+            ],
+            columns=TRADE_COLUMNS
+        )
+
+    def _invalidate_caches(self):
+        """Drop cached values computed from current results."""
+        if self.results is not None:
+            self._summary_cache.pop(id(self.results), None)
+            self._metric_cache.pop(id(self.results), None)
+        self._stats_cache.clear()
+
     def _generate_summary(self) -> str:
         """Generate summary text."""
         metrics = self.results.metrics
-        trades = self.results.trades
+        types = self._trades_df['type']
 
-        long_trades = len([t for t in trades if t.type == 'long'])
-        short_trades = len([t for t in trades if t.type == 'short'])
+        long_trades = int((types == 'long').sum())
+        short_trades = int((types == 'short').sum())
 
         summary = [
             f"Backtest Period: {self.results.start_date:%Y-%m-%d} to {self.results.end_date:%Y-%m-%d}",
             f"Initial Capital: ${self.results.config.initial_capital:,.2f}",
             "",
-            f"Total Trades: {len(trades)}",
+            f"Total Trades: {len(types)}",
             f"Long Trades: {long_trades}",
             f"Short Trades: {short_trades}",
             "",
@@ -308,6 +469,7 @@ class ResultsPanel(ttk.Frame):
             "",
             f"Max Drawdown: {metrics.get('max_drawdown', 0):.2f}%",
             f"Avg. Drawdown: {metrics.get('avg_drawdown', 0):.2f}%",
+            f"Max DD Duration: {metrics.get('max_drawdown_duration', 0):.0f} bars",
             f"Recovery Factor: {metrics.get('recovery_factor', 0):.2f}",
             "",
             f"Sharpe Ratio: {metrics.get('sharpe_ratio', 0):.2f}",
@@ -337,12 +499,17 @@ class ResultsPanel(ttk.Frame):
             title = "Returns"
             y_label = "Return (%)"
 
-        # Plot data
-        self.equity_chart.plot(
-            data,
-            title=title,
-            y_label=y_label
-        )
+        # Reuse line when plot type is unchanged
+        if plot_type == self._equity_plot_type:
+            self.equity_chart.update_data(data)
+            self.equity_chart.clear_markers()
+        else:
+            self.equity_chart.plot(
+                data,
+                title=title,
+                y_label=y_label
+            )
+            self._equity_plot_type = plot_type
 
         # Add trade markers if enabled
         if self.show_trades.get():
@@ -350,43 +517,134 @@ class ResultsPanel(ttk.Frame):
 
     def _add_trade_markers(self):
         """Add trade markers to equity chart."""
-        for trade in self.results.trades:
-            # Plot entry
-            self.equity_chart.add_marker(
-                trade.entry_time,
-                self.results.equity_curve[trade.entry_time],
-                'entry',
-                color='green' if trade.type == 'long' else 'red'
-            )
+        trades = self.results.trades
+        if not trades:
+            return
+
+        equity = self.results.equity_curve
+        is_long = np.fromiter(
+            (t.type == 'long' for t in trades), dtype=bool, count=len(trades)
+        )
 
-            # Plot exit
-            if trade.exit_time:
-                self.equity_chart.add_marker(
-                    trade.exit_time,
-                    self.results.equity_curve[trade.exit_time],
-                    'exit',
-                    color='red' if trade.type == 'long' else 'green'
-                )
+        # Entries (one hashed lookup for all trades)
+        entry_times = pd.DatetimeIndex([t.entry_time for t in trades])
+        self.equity_chart.add_markers(
+            entry_times,
+            equity.reindex(entry_times).to_numpy(),
+            'entry',
+            np.where(is_long, 'green', 'red')
+        )
+
+        # Exits (closed trades only)
+        closed = np.fromiter(
+            (t.exit_time is not None for t in trades), dtype=bool, count=len(trades)
+        )
+        exit_times = pd.DatetimeIndex([t.exit_time for t in trades if t.exit_time])
+        self.equity_chart.add_markers(
+            exit_times,
+            equity.reindex(exit_times).to_numpy(),
+            'exit',
+            np.where(is_long[closed], 'red', 'green')
+        )
 
     def _update_trades(self):
         """Update trades list."""
-        # Clear list
-        for item in self.trade_list.get_children():
-            self.trade_list.delete(item)
-
-        if not self.results:
-            return
+        self._trade_rows = []
+        self._row_offset = 0
+        self._selected_row = None
+
+        if self.results:
+            self._trade_rows = self._format_trade_rows()
+
+        self._reflow_visible_trades()
+
+    def _format_trade_rows(self) -> List[tuple]:
+        """Format trade table as display rows."""
+        # Format each column in one vectorized pass
+        df = self._trades_df
+        entry = pd.to_datetime(df['entry_time']).dt.strftime(TRADE_TIME_FORMAT)
+        exit_ = pd.to_datetime(df['exit_time']).dt.strftime(TRADE_TIME_FORMAT)
+        size = np.char.mod('%.2f', df['size'].to_numpy(dtype=float))
+        pnl = np.char.add('$', np.char.mod('%.2f', df['pnl'].to_numpy(dtype=float)))
+        returns = df['return_pct'].to_numpy(dtype=float)
+        ret = np.where(
+            np.isnan(returns), '-', np.char.add(np.char.mod('%.1f', returns), '%')
+        )
 
-        # Add trades
-        for trade in self.results.trades:
-            self.trade_list.insert('', 'end', values=(
-                trade.entry_time.strftime('%Y-%m-%d %H:%M'),
-                trade.exit_time.strftime('%Y-%m-%d %H:%M') if trade.exit_time else '-',
-                trade.type,
-                f"{trade.size:.2f}",
-                f"${trade.pnl:.2f}",
-                f"{trade.return_pct:.1f}%"
-            ))
+        return list(zip(
+            entry.to_numpy(),
+            exit_.fillna('-').to_numpy(),
+            df['type'].to_numpy(),
+            size.tolist(),
+            pnl.tolist(),
+            ret.tolist()
+        ))
+
+    def _reflow_visible_trades(self):
+        """Show rows of the current window in trade list."""
+        # Clear list in one call
+        self.trade_list.delete(*self.trade_list.get_children())
+
+        total = len(self._trade_rows)
+        start = self._row_offset
+        stop = min(start + self._visible_rows, total)
+
+        # Insert through Tcl directly (skips ttk option processing per row);
+        # item ids are trade indices
+        call = self.trade_list.tk.call
+        widget = self.trade_list._w
+        for index in range(start, stop):
+            call(widget, 'insert', '', 'end', '-id', index,
+                 '-values', self._trade_rows[index])
+
+        # Keep selected trade highlighted when scrolled back into view
+        selected = self._selected_row
+        if selected is not None and start <= selected < stop:
+            self.trade_list.selection_set(selected)
+
+        if total:
+            self.trade_scrollbar.set(start / total, stop / total)
+        else:
+            self.trade_scrollbar.set(0, 1)
+
+    def _set_row_offset(self, offset: int):
+        """Move visible window to offset."""
+        max_offset = max(len(self._trade_rows) - self._visible_rows, 0)
+        offset = min(max(int(offset), 0), max_offset)
+        if offset != self._row_offset:
+            self._row_offset = offset
+            self._reflow_visible_trades()
+
+    def _on_trade_scroll(self, *args):
+        """Handle trade list scrollbar."""
+        if args[0] == 'moveto':
+            self._set_row_offset(round(float(args[1]) * len(self._trade_rows)))
+        elif args[0] == 'scroll':
+            step = self._visible_rows if args[2] == 'pages' else 1
+            self._set_row_offset(self._row_offset + int(args[1]) * step)
+
+    def _on_trade_wheel(self, event):
+        """Scroll trade list with mouse wheel."""
+        if event.num == 4 or event.delta > 0:
+            self._set_row_offset(self._row_offset - 3)
+        else:
+            self._set_row_offset(self._row_offset + 3)
+        return 'break'
+
+    def _on_trade_list_resize(self, event):
+        """Fit visible window to trade list height."""
+        style = ttk.Style(self)
+        row_height = int(style.lookup('Treeview', 'rowheight') or 20)
+
+        # One row of height goes to the headings
+        visible = max(event.height // row_height - 1, 1)
+        if visible != self._visible_rows:
+            self._visible_rows = visible
+            self._row_offset = min(
+                self._row_offset,
+                max(len(self._trade_rows) - visible, 0)
+            )
+            self._reflow_visible_trades()
 
     def _on_trade_select(self, event):
         """Handle trade selection."""
@@ -394,10 +652,11 @@ class ResultsPanel(ttk.Frame):
         if not selection:
             return
 
-        # Get selected trade
-        index = self.trade_list.index(selection[0])
+        # Get selected trade (item ids are trade indices)
+        index = int(selection[0])
         trade = self.results.trades[index]
         self._current_trade = trade
+        self._selected_row = index
 
         # Update details
         self.trade_details['state'] = 'normal'
@@ -432,6 +691,8 @@ class ResultsPanel(ttk.Frame):
             self._plot_trade_analysis()
         elif metric == 'win_rate':
             self._plot_win_rate_analysis()
+        elif metric == 'win_rate_by_hour':
+            self._plot_win_rate_analysis(by='hour')
         elif metric == 'position_size':
             self._plot_position_analysis()
 
@@ -439,15 +700,16 @@ class ResultsPanel(ttk.Frame):
         """Plot return distribution analysis."""
         returns = self.results.returns.dropna()
 
-        # Calculate statistics
-        mean = returns.mean()
-        std = returns.std()
-        skew = returns.skew()
-        kurtosis = returns.kurtosis()
+        # Calculate statistics (single pass, cached per results)
+        if 'returns' not in self._stats_cache:
+            self._stats_cache['returns'] = moments4(returns.to_numpy())
+        mean, std, skew, kurtosis = self._stats_cache['returns']
 
         # Plot histogram
-        self.analysis_chart.plot_histogram(
-            returns,
+        counts, edges = self._cached_histogram('returns', returns)
+        self.analysis_chart.plot_precomputed_hist(
+            counts,
+            edges,
             title="Return Distribution",
             xlabel="Return (%)",
             ylabel="Frequency",
@@ -459,18 +721,33 @@ class ResultsPanel(ttk.Frame):
             }
         )
 
+    def _cached_histogram(self, key: str, values: pd.Series) -> tuple:
+        """Get histogram counts and edges, cached per results."""
+        key = f'{key}_hist'
+        if key not in self._stats_cache:
+            # float32 is enough for binning
+            self._stats_cache[key] = np.histogram(
+                values.to_numpy(dtype=np.float32),
+                bins=HISTOGRAM_BINS
+            )
+        return self._stats_cache[key]
+
     def _plot_drawdown_analysis(self):
         """Plot drawdown analysis."""
-        drawdowns = self.results.drawdowns
+        drawdowns = self.results.drawdowns.dropna()
 
-        # Calculate statistics
-        max_dd = drawdowns.min()
-        avg_dd = drawdowns.mean()
-        dd_std = drawdowns.std()
+        # Calculate statistics (cached per results)
+        if 'drawdowns' not in self._stats_cache:
+            values = drawdowns.to_numpy()
+            max_dd = values.min() if values.size else np.nan
+            self._stats_cache['drawdowns'] = (max_dd, *mean_std(values))
+        max_dd, avg_dd, dd_std = self._stats_cache['drawdowns']
 
         # Plot drawdown distribution
-        self.analysis_chart.plot_histogram(
-            drawdowns,
+        counts, edges = self._cached_histogram('drawdowns', drawdowns)
+        self.analysis_chart.plot_precomputed_hist(
+            counts,
+            edges,
             title="Drawdown Analysis",
             xlabel="Drawdown (%)",
             ylabel="Frequency",
@@ -483,12 +760,16 @@ class ResultsPanel(ttk.Frame):
 
     def _plot_trade_analysis(self):
         """Plot trade P&L analysis."""
-        pnls = [t.pnl for t in self.results.trades]
+        if self._trades_df.empty:
+            self.analysis_chart.clear()
+            return
+
+        pnls = self._trades_df['pnl'].to_numpy(dtype=np.float64)
 
         # Calculate statistics
-        avg_pnl = np.mean(pnls)
-        best_trade = max(pnls)
-        worst_trade = min(pnls)
+        avg_pnl = pnls.mean()
+        best_trade = pnls.max()
+        worst_trade = pnls.min()
 
         # Plot P&L distribution
         self.analysis_chart.plot_histogram(
@@ -503,46 +784,51 @@ class ResultsPanel(ttk.Frame):
             }
         )
 
-    def _plot_win_rate_analysis(self):
-        """Plot win rate analysis."""
-        trades = self.results.trades
-
-        # Calculate win rates by:
-        # - Trade type (long/short)
-        # - Time of day
-        # - Day of week
-        # - Month
-
-        # By type
-        long_trades = [t for t in trades if t.type == 'long']
-        short_trades = [t for t in trades if t.type == 'short']
-
-        long_wins = len([t for t in long_trades if t.pnl > 0])
-        short_wins = len([t for t in short_trades if t.pnl > 0])
-
-        win_rates = {
-            'Long': long_wins / len(long_trades) if long_trades else 0,
-            'Short': short_wins / len(short_trades) if short_trades else 0
-        }
+    def _plot_win_rate_analysis(self, by: str = 'type'):
+        """
+        Plot win rate analysis.
+
+        Args:
+            by: Grouping ('type' for long/short, 'hour' for entry hour)
+        """
+        df = self._trades_df
+        wins = df['pnl'] > 0
+
+        # Win rate per group in one pass
+        if by == 'hour':
+            hours = pd.to_datetime(df['entry_time']).dt.hour
+            wr = wins.groupby(hours).mean()
+            labels = [f"{int(hour):02d}:00" for hour in wr.index]
+            values = wr.tolist()
+            xlabel = "Entry Hour"
+        else:
+            wr = wins.groupby(df['type']).mean()
+            labels = ['Long', 'Short']
+            values = [wr.get('long', 0), wr.get('short', 0)]
+            xlabel = "Trade Type"
 
         # Plot win rates
         self.analysis_chart.plot_bar(
-            list(win_rates.keys()),
-            list(win_rates.values()),
+            labels,
+            values,
             title="Win Rate Analysis",
-            xlabel="Trade Type",
+            xlabel=xlabel,
             ylabel="Win Rate (%)",
             percentage=True
         )
 
     def _plot_position_analysis(self):
         """Plot position size analysis."""
-        sizes = [t.size for t in self.results.trades]
+        if self._trades_df.empty:
+            self.analysis_chart.clear()
+            return
+
+        sizes = self._trades_df['size'].to_numpy(dtype=np.float64)
 
         # Calculate statistics
-        avg_size = np.mean(sizes)
-        max_size = max(sizes)
-        min_size = min(sizes)
+        avg_size = sizes.mean()
+        max_size = sizes.max()
+        min_size = sizes.min()
 
         # Plot size distribution
         self.analysis_chart.plot_histogram(
@@ -606,82 +892,43 @@ class ResultsPanel(ttk.Frame):
     def _export_csv(self, filename: str):
         """Export results to CSV."""
         # Export trade list
-        trades_df = pd.DataFrame([
-            {
-                'Entry Time': t.entry_time,
-                'Exit Time': t.exit_time,
-                'Type': t.type,
-                'Size': t.size,
-                'Entry Price': t.entry_price,
-                'Exit Price': t.exit_price,
-                'P&L': t.pnl,
-                'Return %': t.return_pct,
-                'Fees': t.fees
-            }
-            for t in self.results.trades
-        ])
-
-        trades_df.to_csv(filename, index=False)
+        self._trades_df.rename(columns=TRADE_EXPORT_HEADERS).to_csv(
+            filename, index=False
+        )
 
     def _export_excel(self, filename: str):
         """Export results to Excel."""
-        from openpyxl import Workbook
-        from openpyxl.utils.dataframe import dataframe_to_rows
-
-        wb = Workbook()
-
-        # Summary sheet
-        ws = wb.active
-        ws.title = "Summary"
-
-        # Add metrics
-        ws['A1'] = "Metric"
-        ws['B1'] = "Value"
-
-        row = 2
-        for key, value in self.results.metrics.items():
-            ws[f'A{row}'] = key
-            ws[f'B{row}'] = value
-            row += 1
-
-        # Trade list sheet
-        ws = wb.create_sheet("Trades")
-
-        trades_df = pd.DataFrame([
-            {
-                'Entry Time': t.entry_time,
-                'Exit Time': t.exit_time,
-                'Type': t.type,
-                'Size': t.size,
-                'Entry Price': t.entry_price,
-                'Exit Price': t.exit_price,
-                'P&L': t.pnl,
-                'Return %': t.return_pct,
-                'Fees': t.fees
-            }
-            for t in self.results.trades
-        ])
-
-        for r in dataframe_to_rows(trades_df, index=False, header=True):
-            ws.append(r)
-
-        # Equity curve sheet
-        ws = wb.create_sheet("Equity")
-
-        equity_df = pd.DataFrame({
-            'Equity': self.results.equity_curve,
-            'Drawdown': self.results.drawdowns,
-            'Returns': self.results.returns
-        })
-
-        for r in dataframe_to_rows(equity_df, index=True, header=True):
-            ws.append(r)
+        with pd.ExcelWriter(filename, engine='openpyxl') as writer:
+            # Summary sheet
+            pd.DataFrame(
+                list(self.results.metrics.items()),
+                columns=['Metric', 'Value']
+            ).to_excel(writer, sheet_name='Summary', index=False)
+
+            # Trade list sheet
+            self._trades_df.rename(columns=TRADE_EXPORT_HEADERS).to_excel(
+                writer, sheet_name='Trades', index=False
+            )
 
-        wb.save(filename)
+            # Equity curve sheet
+            pd.concat({
+                'Equity': self.results.equity_curve,
+                'Drawdown': self.results.drawdowns,
+                'Returns': self.results.returns
+            }, axis=1).to_excel(writer, sheet_name='Equity')
 
     def _export_json(self, filename: str):
-        """Export results to JSON."""
-        import json
+        """
+        Export results to JSON.
+
+        Series are written column-wise (one shared index plus one array
+        per series) instead of one dict entry per timestamp.
+        """
+        series = pd.concat({
+            'equity_curve': self.results.equity_curve,
+            'drawdowns': self.results.drawdowns,
+            'returns': self.results.returns
+        }, axis=1)
 
         data = {
             'metadata': {
@@ -690,27 +937,29 @@ class ResultsPanel(ttk.Frame):
                 'config': vars(self.results.config)
             },
             'metrics': self.results.metrics,
-            'trades': [
-                {
-                    'entry_time': t.entry_time.isoformat(),
-                    'exit_time': t.exit_time.isoformat() if t.exit_time else None,
-                    'type': t.type,
-                    'size': t.size,
-                    'entry_price': t.entry_price,
-                    'exit_price': t.exit_price,
-                    'pnl': t.pnl,
-                    'return_pct': t.return_pct,
-                    'fees': t.fees
-                }
-                for t in self.results.trades
-            ],
-            'equity_curve': self.results.equity_curve.to_dict(),
-            'drawdowns': self.results.drawdowns.to_dict(),
-            'returns': self.results.returns.to_dict()
+            'trades': self._trades_df.to_dict('records'),
+            'series': {
+                'index': series.index.astype(str).tolist(),
+                **{name: series[name].to_numpy() for name in series.columns}
+            }
         }
 
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=4)
+        try:
+            # orjson encodes numpy arrays natively in C
+            import orjson
+
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(
+                    data,
+                    default=_json_default,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                ))
+
+        except ImportError:
+            import json
+
+            with open(filename, 'w') as f:
+                json.dump(data, f, indent=4, default=_json_default)
 
     def _generate_report(self):
         """Generate PDF report."""
@@ -721,10 +970,22 @@ class ResultsPanel(ttk.Frame):
 
     def reset(self):
         """Reset panel state."""
+        self._invalidate_caches()
         self.results = None
         self._current_trade = None
+        self._trades_df = None
 
         # Clear displays
-        self._update_summary()
-        self._update_trades()
-        self._update_analysis()
+        self._update_built_tabs()
+
+def _json_default(obj: Any) -> Any:
+    """Convert values JSON encoders don't handle natively."""
+    if obj is None or obj is pd.NaT:
+        return None
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return str(obj)
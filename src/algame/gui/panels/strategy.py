@@ -428,13 +428,12 @@ class StrategyPanel(ttk.Frame):
             self.param_list.delete(item)
 
         # Add parameters
-        for name, component in self.builder.components.items():
-            if component.__class__.__name__ == 'ParameterComponent':
-                self.param_list.insert('', 'end', values=(
-                    name,
-                    component.parameters['type'],
-                    component.parameters['default']
-                ))
+        for name, component in self.builder.components_of('parameter').items():
+            self.param_list.insert('', 'end', values=(
+                name,
+                component.parameters['type'],
+                component.parameters['default']
+            ))
 
     def _on_param_select(self, event):
         """Handle parameter selection."""
@@ -630,12 +629,9 @@ class StrategyPanel(ttk.Frame):
         condition = self.rule_list.item(selected[0])['values'][1]
 
         # Find matching component
-        for name, component in self.builder.components.items():
-            if (component.__class__.__name__ == 'RuleComponent' and
-                component.parameters['type'] == rule_type.lower() and
-                component.parameters['condition'] == condition):
-                self.builder.remove_component(name)
-                break
+        name = self.builder.find_rule(rule_type.lower(), condition)
+        if name is not None:
+            self.builder.remove_component(name)
 
         # Update list
         self.rule_list.delete(selected[0])
@@ -770,12 +766,11 @@ class StrategyPanel(ttk.Frame):
 
         # Update rules
         self.rule_list.delete(*self.rule_list.get_children())
-        for component in self.builder.components.values():
-            if component.__class__.__name__ == 'RuleComponent':
-                self.rule_list.insert('', 'end', values=(
-                    component.parameters['type'].title(),
-                    component.parameters['condition']
-                ))
+        for component in self.builder.components_of('rule').values():
+            self.rule_list.insert('', 'end', values=(
+                component.parameters['type'].title(),
+                component.parameters['condition']
+            ))
 
         # Update preview
         self._generate_strategy()
@@ -37,6 +37,10 @@ Usage Examples:
     MyStrategy = builder.build()
 """
 
+from functools import lru_cache
+from importlib import import_module
+from typing import Callable, Optional, Union
+
 # Version info
 __version__ = '0.1.0'
 
@@ -45,42 +49,53 @@ from .base import (
     StrategyBase,
     Position,
     Order,
-    Trade
+    Trade,
+    Side
 )
 
-# Import template components
-from .template import (
-    TrendStrategy,
-    MeanReversionStrategy,
-    BreakoutStrategy,
-)
+# Other components are imported on first access (PEP 562), so
+# importing the base classes doesn't pull in the builder GUI
+_LAZY_IMPORTS = {
+    # Templates
+    'TrendStrategy': '.template',
+    'MeanReversionStrategy': '.template',
+    'BreakoutStrategy': '.template',
 
-# Import builder components
-from .builder import (
-StrategyBuilder,
-BuilderComponent
-)
+    # Builder
+    'StrategyBuilder': '.builder',
+    'BuilderComponent': '.builder',
 
-# Import indicator components
-from .indicators import (
-    Indicator,
-    SMA,
-    EMA,
-    RSI,
-    MACD,
-    Bollinger,
-    ATR,
-    register_indicator,
-    list_indicators,
-    get_indicator
-)
+    # Indicators
+    'Indicator': '.indicators',
+    'SMA': '.indicators',
+    'EMA': '.indicators',
+    'RSI': '.indicators',
+    'MACD': '.indicators',
+    'Bollinger': '.indicators',
+    'ATR': '.indicators',
+    'register_indicator': '.indicators',
+    'list_indicators': '.indicators',
+    'get_indicator': '.indicators',
 
-# Import validation
-from .validator import (
-    StrategyValidator,
-    ValidationReport,
-    validate_strategy
-)
+    # Validation
+    'StrategyValidator': '.validator',
+    'ValidationReport': '.validator',
+    'validate_strategy': '.validator'
+}
+
+def __getattr__(name: str):
+    """Import lazily exported component on first access."""
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = import_module(_LAZY_IMPORTS[name], __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> list:
+    """List module attributes including lazy components."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
 # Default strategy configuration
 DEFAULT_CONFIG = {
@@ -93,11 +108,38 @@ DEFAULT_CONFIG = {
 # Strategy registry
 _strategy_registry = {}
 
-def register_strategy(name: str, strategy_class: type) -> None:
-    """Register strategy class."""
-    global _strategy_registry
-    _strategy_registry[name] = strategy_class
+def register_strategy(
+        name: str,
+        strategy_class: Optional[type] = None
+) -> Union[type, Callable[[type], type]]:
+    """
+    Register strategy class.
+
+    Can be called directly or used as a class decorator:
+
+        register_strategy('my_strategy', MyStrategy)
+
+        @register_strategy('my_strategy')
+        class MyStrategy(StrategyBase):
+            ...
+
+    Args:
+        name: Strategy name
+        strategy_class: Strategy class (omit to get a decorator)
+
+    Returns:
+        Registered class, or decorator if no class given
+    """
+    def decorator(cls: type) -> type:
+        _strategy_registry[name] = cls
+        get_strategy.cache_clear()
+        return cls
+
+    if strategy_class is None:
+        return decorator
+    return decorator(strategy_class)
 
+@lru_cache(maxsize=None)
 def get_strategy(name: str) -> type:
     """Get registered strategy class."""
     if name not in _strategy_registry:
@@ -115,6 +157,7 @@ __all__ = [
     'Position',
     'Order',
     'Trade',
+    'Side',
 
     # Templates
     'TrendStrategy',
@@ -0,0 +1,89 @@
+"""
+Compiled order matching loops.
+
+Kernels here work on plain arrays of pending order fields so the
+per-bar matching loop runs natively when numba is installed.
+"""
+
+import numpy as np
+
+from ._jit import njit
+
+@njit(cache=True)
+def first_triggers(prices: np.ndarray,
+                   limits: np.ndarray,
+                   sides: np.ndarray) -> np.ndarray:
+    """
+    Find first bar each order triggers on.
+
+    Args:
+        prices: Price series
+        limits: Order limit prices (NaN for market orders)
+        sides: Order sides (+1 buy, -1 sell)
+
+    Returns:
+        Trigger bar index per order (-1 if never triggered)
+    """
+    n_orders = limits.shape[0]
+    triggers = np.full(n_orders, -1, dtype=np.int64)
+    if prices.shape[0] == 0:
+        return triggers
+
+    for j in range(n_orders):
+        limit = limits[j]
+
+        # Market orders fill on first bar
+        if np.isnan(limit):
+            triggers[j] = 0
+            continue
+
+        # Side folds buy (price <= limit) and sell (price >= limit)
+        # into one comparison
+        side = sides[j]
+        threshold = side * limit
+        for i in range(prices.shape[0]):
+            if side * prices[i] <= threshold:
+                triggers[j] = i
+                break
+
+    return triggers
+
+def first_triggers_sorted(prices: np.ndarray,
+                          limits: np.ndarray,
+                          sides: np.ndarray) -> np.ndarray:
+    """
+    Find first trigger bar of each order by binary search.
+
+    Same result as ``first_triggers``, but in O(N + M log N): a buy
+    limit first triggers where the running low reaches it and a sell
+    limit where the running high does, and both running extremes are
+    monotone, so each order is one ``searchsorted``.
+
+    Args:
+        prices: Price series
+        limits: Order limit prices (NaN for market orders)
+        sides: Order sides (+1 buy, -1 sell)
+
+    Returns:
+        Trigger bar index per order (-1 if never triggered)
+    """
+    n = prices.shape[0]
+    triggers = np.full(limits.shape[0], -1, dtype=np.int64)
+    if n == 0:
+        return triggers
+
+    # NaN bars never trigger
+    missing = np.isnan(prices)
+    running_low = np.minimum.accumulate(np.where(missing, np.inf, prices))
+    running_high = np.maximum.accumulate(np.where(missing, -np.inf, prices))
+
+    market = np.isnan(limits)
+    buys = (sides > 0) & ~market
+    sells = (sides < 0) & ~market
+
+    triggers[market] = 0
+    triggers[buys] = np.searchsorted(-running_low, -limits[buys], side='left')
+    triggers[sells] = np.searchsorted(running_high, limits[sells], side='left')
+    triggers[triggers == n] = -1
+
+    return triggers
@@ -0,0 +1,33 @@
+"""
+Optional Numba JIT support.
+
+Numba is an optional performance dependency. When it is installed,
+``njit`` compiles kernels to native code; otherwise it returns the
+plain Python function so the same kernels still run (slowly).
+Callers check ``NUMBA_AVAILABLE`` and keep a vectorized NumPy/pandas
+path for installs without numba.
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit."""
+        # Used bare: @njit
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        # Used with options: @njit(cache=True)
+        def decorator(func):
+            return func
+        return decorator
+
+__all__ = ['njit', 'prange', 'NUMBA_AVAILABLE']
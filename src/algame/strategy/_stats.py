@@ -0,0 +1,355 @@
+"""
+Fused statistical kernels.
+
+Single-pass kernels used by analysis views, so summary statistics
+don't need one full pass over the data per statistic. Without numba
+the kernels would run as Python loops, so NumPy passes are used
+instead.
+"""
+
+import math
+from typing import Tuple
+import numpy as np
+
+from ._jit import njit, NUMBA_AVAILABLE
+
+@njit(cache=True, fastmath=True)
+def _central_moments(values: np.ndarray) -> Tuple[int, float, float, float, float]:
+    """
+    Compute count, mean and central moment sums in one pass.
+
+    Uses Welford-style running updates (Terriberry's extension to
+    third and fourth moments), which stay accurate on long series.
+    """
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    m3 = 0.0
+    m4 = 0.0
+
+    for x in values:
+        n1 = n
+        n += 1
+        delta = x - mean
+        delta_n = delta / n
+        delta_n2 = delta_n * delta_n
+        term1 = delta * delta_n * n1
+
+        mean += delta_n
+        m4 += (term1 * delta_n2 * (n * n - 3 * n + 3)
+               + 6 * delta_n2 * m2 - 4 * delta_n * m3)
+        m3 += term1 * delta_n * (n - 2) - 3 * delta_n * m2
+        m2 += term1
+
+    return n, mean, m2, m3, m4
+
+def _central_moments_numpy(
+        values: np.ndarray) -> Tuple[int, float, float, float, float]:
+    """NumPy version of ``_central_moments``."""
+    n = values.shape[0]
+    if n == 0:
+        return 0, 0.0, 0.0, 0.0, 0.0
+
+    mean = values.mean()
+    dev = values - mean
+    dev2 = dev * dev
+    return n, mean, dev2.sum(), (dev2 * dev).sum(), (dev2 * dev2).sum()
+
+def moments4(values: np.ndarray) -> Tuple[float, float, float, float]:
+    """
+    Compute mean, std, skewness and kurtosis in one pass.
+
+    Results match pandas: sample std (ddof=1), bias-corrected skewness
+    and bias-corrected excess kurtosis. Statistics that need more data
+    points than available are NaN.
+
+    Args:
+        values: 1-D float array without NaNs
+
+    Returns:
+        Tuple of (mean, std, skew, kurtosis)
+    """
+    values = np.ascontiguousarray(values, dtype=np.float64)
+    if NUMBA_AVAILABLE:
+        n, mean, m2, m3, m4 = _central_moments(values)
+    else:
+        n, mean, m2, m3, m4 = _central_moments_numpy(values)
+
+    if n == 0:
+        return math.nan, math.nan, math.nan, math.nan
+
+    std = math.sqrt(m2 / (n - 1)) if n > 1 else math.nan
+
+    if n < 3:
+        skew = math.nan
+    elif m2 == 0:
+        skew = 0.0
+    else:
+        skew = n * math.sqrt(n - 1) / (n - 2) * m3 / m2 ** 1.5
+
+    if n < 4:
+        kurt = math.nan
+    elif m2 == 0:
+        kurt = 0.0
+    else:
+        adj = (n - 2) * (n - 3)
+        kurt = ((n + 1) * n * (n - 1) / adj * m4 / (m2 * m2)
+                - 3 * (n - 1) ** 2 / adj)
+
+    return mean, std, skew, kurt
+
+def mean_std(values: np.ndarray) -> Tuple[float, float]:
+    """
+    Compute mean and sample std (ddof=1) in one pass.
+
+    Args:
+        values: 1-D float array without NaNs
+
+    Returns:
+        Tuple of (mean, std)
+    """
+    mean, std, _, _ = moments4(values)
+    return mean, std
+
+@njit(cache=True, error_model='numpy')
+def _equity_pass(equity: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Compute returns, running peak and drawdown in one pass."""
+    n = equity.shape[0]
+    returns = np.empty(n)
+    running_max = np.empty(n)
+    drawdowns = np.empty(n)
+
+    peak = -np.inf
+    prev = np.nan
+    for i in range(n):
+        x = equity[i]
+        returns[i] = x / prev - 1.0
+        prev = x
+
+        # NaN never becomes the peak
+        if x > peak:
+            peak = x
+        if peak == -np.inf:
+            running_max[i] = np.nan
+            drawdowns[i] = np.nan
+        else:
+            running_max[i] = peak
+            drawdowns[i] = (x - peak) / peak * 100.0
+
+    return returns, running_max, drawdowns
+
+def _equity_numpy(equity: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """NumPy version of ``_equity_pass``."""
+    returns = np.full(equity.shape[0], np.nan)
+
+    # fmax skips NaN, so NaN never becomes the peak
+    running_max = np.fmax.accumulate(equity) if equity.size else equity.copy()
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        returns[1:] = equity[1:] / equity[:-1] - 1.0
+        drawdowns = (equity - running_max) / running_max * 100.0
+
+    return returns, running_max, drawdowns
+
+def equity_stats(equity: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute return, running peak and drawdown series in one pass.
+
+    Matches ``pct_change()``, ``expanding().max()`` and
+    ``(equity - peak) / peak * 100`` on the equity curve.
+
+    Args:
+        equity: Equity values
+
+    Returns:
+        Tuple of (returns, running_max, drawdowns) arrays
+    """
+    equity = np.ascontiguousarray(equity, dtype=np.float64)
+    if NUMBA_AVAILABLE:
+        return _equity_pass(equity)
+    return _equity_numpy(equity)
+
+@njit(cache=True)
+def _excess_moments(returns: np.ndarray,
+                    rf: float) -> Tuple[int, float, float, float]:
+    """Compute count, mean, deviation and downside square sums of excess returns."""
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    down = 0.0
+
+    for r in returns:
+        if math.isnan(r):
+            continue
+        x = r - rf
+        n += 1
+        delta = x - mean
+        mean += delta / n
+        m2 += delta * (x - mean)
+        if x < 0.0:
+            down += x * x
+
+    return n, mean, m2, down
+
+def _excess_moments_numpy(returns: np.ndarray,
+                          rf: float) -> Tuple[int, float, float, float]:
+    """NumPy version of ``_excess_moments``."""
+    excess = returns[~np.isnan(returns)] - rf
+    if excess.size == 0:
+        return 0, 0.0, 0.0, 0.0
+
+    mean = excess.mean()
+    dev = excess - mean
+    down = np.minimum(excess, 0.0)
+    return excess.size, mean, dev @ dev, down @ down
+
+@njit(cache=True)
+def _drawdown_extents(equity: np.ndarray) -> Tuple[float, float, int]:
+    """Compute max drawdown (fraction and amount) and longest drawdown in bars."""
+    peak = -np.inf
+    max_dd = 0.0
+    max_dd_amount = 0.0
+    duration = 0
+    max_duration = 0
+
+    for x in equity:
+        if math.isnan(x):
+            continue
+        if x >= peak:
+            peak = x
+            duration = 0
+            continue
+
+        duration += 1
+        if duration > max_duration:
+            max_duration = duration
+        if peak - x > max_dd_amount:
+            max_dd_amount = peak - x
+        if peak > 0.0 and (peak - x) / peak > max_dd:
+            max_dd = (peak - x) / peak
+
+    return max_dd, max_dd_amount, max_duration
+
+def _drawdown_extents_numpy(equity: np.ndarray) -> Tuple[float, float, int]:
+    """NumPy version of ``_drawdown_extents``."""
+    values = equity[~np.isnan(equity)]
+    if values.size == 0:
+        return 0.0, 0.0, 0
+
+    peak = np.maximum.accumulate(values)
+    drop = peak - values
+    with np.errstate(divide='ignore', invalid='ignore'):
+        max_dd = np.where(peak > 0.0, drop / peak, 0.0).max()
+
+    # Longest run of bars below the running peak
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], drop > 0, [0]))))
+    max_duration = int((edges[1::2] - edges[::2]).max()) if edges.size else 0
+
+    return max(max_dd, 0.0), max(drop.max(), 0.0), max_duration
+
+def _drawdowns(equity: np.ndarray) -> Tuple[float, float, int]:
+    """Compute drawdown extents with kernel or NumPy."""
+    if NUMBA_AVAILABLE:
+        return _drawdown_extents(equity)
+    return _drawdown_extents_numpy(equity)
+
+def _excess(returns: np.ndarray, rf: float) -> Tuple[int, float, float, float]:
+    """Compute excess return moments with kernel or NumPy."""
+    returns = np.ascontiguousarray(returns, dtype=np.float64)
+    if NUMBA_AVAILABLE:
+        return _excess_moments(returns, rf)
+    return _excess_moments_numpy(returns, rf)
+
+def sharpe_ratio(returns: np.ndarray,
+                 risk_free_rate: float = 0.0,
+                 periods_per_year: int = 252) -> float:
+    """
+    Compute annualized Sharpe ratio.
+
+    Args:
+        returns: Periodic returns (NaN skipped)
+        risk_free_rate: Annual risk-free rate
+        periods_per_year: Return periods per year
+
+    Returns:
+        Sharpe ratio (0 if undefined)
+    """
+    n, mean, m2, _ = _excess(returns, risk_free_rate / periods_per_year)
+    if n < 2 or m2 <= 0:
+        return 0.0
+    return mean / math.sqrt(m2 / (n - 1)) * math.sqrt(periods_per_year)
+
+def sortino_ratio(returns: np.ndarray,
+                  risk_free_rate: float = 0.0,
+                  periods_per_year: int = 252) -> float:
+    """
+    Compute annualized Sortino ratio.
+
+    Args:
+        returns: Periodic returns (NaN skipped)
+        risk_free_rate: Annual risk-free rate
+        periods_per_year: Return periods per year
+
+    Returns:
+        Sortino ratio (0 if undefined)
+    """
+    n, mean, _, down = _excess(returns, risk_free_rate / periods_per_year)
+    if n == 0 or down <= 0:
+        return 0.0
+    return mean / math.sqrt(down / n) * math.sqrt(periods_per_year)
+
+def max_drawdown_duration(equity: np.ndarray) -> int:
+    """
+    Compute longest drawdown in bars.
+
+    Args:
+        equity: Equity values
+
+    Returns:
+        Most consecutive bars below the running peak
+    """
+    return int(_drawdowns(np.ascontiguousarray(equity, dtype=np.float64))[2])
+
+def calmar_ratio(equity: np.ndarray, periods_per_year: int = 252) -> float:
+    """
+    Compute Calmar ratio (annualized return over max drawdown).
+
+    Args:
+        equity: Equity values
+        periods_per_year: Bars per year
+
+    Returns:
+        Calmar ratio (0 if undefined)
+    """
+    values = np.ascontiguousarray(equity, dtype=np.float64)
+    values = values[~np.isnan(values)]
+    if values.size < 2 or values[0] <= 0 or values[-1] <= 0:
+        return 0.0
+
+    max_dd = _drawdowns(values)[0]
+    if max_dd <= 0:
+        return 0.0
+
+    exponent = periods_per_year / (values.size - 1)
+    annual_return = (values[-1] / values[0]) ** exponent - 1
+    return annual_return / max_dd
+
+def recovery_factor(equity: np.ndarray) -> float:
+    """
+    Compute recovery factor (net profit over max drawdown amount).
+
+    Args:
+        equity: Equity values
+
+    Returns:
+        Recovery factor (0 if undefined)
+    """
+    values = np.ascontiguousarray(equity, dtype=np.float64)
+    values = values[~np.isnan(values)]
+    if values.size < 2:
+        return 0.0
+
+    max_dd_amount = _drawdowns(values)[1]
+    if max_dd_amount <= 0:
+        return 0.0
+    return (values[-1] - values[0]) / max_dd_amount
@@ -1,17 +1,78 @@
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Union, Any
+from dataclasses import dataclass, field, fields, InitVar
+from typing import Dict, List, Optional, Union, Any, Tuple, TYPE_CHECKING
 from datetime import datetime
-import pandas as pd
+from collections import OrderedDict
+import weakref
 import numpy as np
 import logging
 from abc import ABC, abstractmethod
+from enum import IntEnum
+
+from ._fastloop import first_triggers, first_triggers_sorted
+
+# pandas is only needed for annotations here; skip its import cost
+if TYPE_CHECKING:
+    import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# Initial pending order capacity per position
+ORDER_CAPACITY = 16
+
+# Shared empty order arrays for positions without orders (never written)
+_NO_LIMITS = np.empty(0)
+_NO_SIDES = np.empty(0, dtype=np.int8)
+_NO_SIZES = np.empty(0)
+_NO_ACTIVE = np.empty(0, dtype=bool)
+for _array in (_NO_LIMITS, _NO_SIDES, _NO_SIZES, _NO_ACTIVE):
+    _array.flags.writeable = False
+del _array
+
+# Pending orders above which triggers are found by binary search
+# rather than scanning bars per order
+SORTED_TRIGGER_MIN_ORDERS = 8
+
+# Indicator results shared across strategy instances (LRU), keyed by
+# indicator type, parameters and input data
+INDICATOR_CACHE_SIZE = 256
+_INDICATOR_CACHE: "OrderedDict[tuple, Tuple[weakref.ref, Any]]" = OrderedDict()
+
+def _slotted(cls: type) -> type:
+    """
+    Recreate dataclass with __slots__ instead of __dict__.
+
+    Equivalent of dataclass(slots=True), which needs Python 3.10.
+    """
+    names = tuple(f.name for f in fields(cls))
+    namespace = dict(cls.__dict__)
+    namespace['__slots__'] = names
+
+    # Field defaults live in __init__; class attributes would clash with slots
+    for name in names + ('__dict__', '__weakref__'):
+        namespace.pop(name, None)
+
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+class Side(IntEnum):
+    """Order/trade direction as a sign."""
+    BUY = 1
+    SELL = -1
+
+def _type_property(buy: str, sell: str) -> property:
+    """Build ``type`` property naming ``side`` as buy or sell string."""
+    def get_type(self) -> str:
+        return buy if self.side > 0 else sell
+
+    def set_type(self, value: str) -> None:
+        self.side = Side.BUY if value == buy else Side.SELL
+
+    return property(get_type, set_type, doc=f"Side as '{buy}' or '{sell}'.")
+
+@_slotted
 @dataclass
 class Order:
     """Trading order details."""
-    type: str  # 'buy' or 'sell'
+    type: InitVar[str]  # 'buy' or 'sell', stored as side
     size: float
     price: Optional[float] = None
     stop_loss: Optional[float] = None
@@ -20,19 +81,43 @@ class Order:
     status: str = 'pending'  # pending, filled, cancelled
     id: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    side: Side = field(init=False)
+
+    def __post_init__(self, type: str):
+        """Store type as side."""
+        self.type = type
+
+    def is_triggered(self, price: float) -> bool:
+        """
+        Check if order fills at price.
+
+        Market orders (no price) fill immediately; buy limits fill at or
+        below their price, sell limits at or above.
+        """
+        if self.price is None:
+            return True
+
+        # Side folds buy (price <= limit) and sell (price >= limit)
+        return self.side * price <= self.side * self.price
 
+@_slotted
 @dataclass
 class Trade:
     """Completed trade details."""
     entry_time: datetime
     entry_price: float
     size: float
-    type: str  # 'long' or 'short'
+    type: InitVar[str]  # 'long' or 'short', stored as side
     exit_time: Optional[datetime] = None
     exit_price: Optional[float] = None
     pnl: float = 0.0
     fees: float = 0.0
     metadata: Dict[str, Any] = field(default_factory=dict)
+    side: Side = field(init=False)
+
+    def __post_init__(self, type: str):
+        """Store type as side."""
+        self.type = type
 
     @property
     def duration(self) -> Optional[float]:
@@ -48,21 +133,51 @@ class Trade:
             return ((self.exit_price - self.entry_price) / self.entry_price) * 100
         return None
 
+# type is derived from side; set after dataclass processing so the
+# properties aren't taken as InitVar defaults
+Order.type = _type_property('buy', 'sell')
+Trade.type = _type_property('long', 'short')
+
 class Position:
     """Position management."""
 
+    __slots__ = (
+        'size', 'entry_price', 'entry_time', 'last_update', 'stop_loss',
+        'take_profit', 'trades', 'pnl', 'fees', 'last_price',
+        '_orders', '_order_limits', '_order_sides', '_order_sizes',
+        '_order_active', '_order_count', '_trade_entries', '_trade_exits',
+        '_trade_sizes', '_trade_sides'
+    )
+
     def __init__(self):
         """Initialize position."""
         self.size: float = 0.0  # Current position size
         self.entry_price: Optional[float] = None  # Average entry price
+        self.entry_time: Optional[datetime] = None
         self.last_update: Optional[datetime] = None
+        self.last_price: Optional[float] = None
         self.stop_loss: Optional[float] = None
         self.take_profit: Optional[float] = None
-        self.orders: List[Order] = []  # Pending orders
         self.trades: List[Trade] = []  # Completed trades
         self.pnl: float = 0.0  # Realized P&L
         self.fees: float = 0.0  # Total fees
 
+        # Pending orders as parallel arrays; filled slots are masked out
+        # and reclaimed when the arrays fill up. Arrays start as shared
+        # empties and are allocated on first order.
+        self._orders: List[Optional[Order]] = []
+        self._order_limits = _NO_LIMITS
+        self._order_sides = _NO_SIDES
+        self._order_sizes = _NO_SIZES
+        self._order_active = _NO_ACTIVE
+        self._order_count = 0
+
+        # Per-trade columns mirroring trades, for vectorized stats
+        self._trade_entries: List[float] = []
+        self._trade_exits: List[float] = []
+        self._trade_sizes: List[float] = []
+        self._trade_sides: List[int] = []
+
     @property
     def is_long(self) -> bool:
         """Check if position is long."""
@@ -78,20 +193,190 @@ class Position:
         """Check if position is open."""
         return self.size != 0
 
+    @property
+    def orders(self) -> List[Order]:
+        """Get pending orders in placement order."""
+        return [self._orders[i] for i in self._active_slots()]
+
     def add_order(self, order: Order) -> None:
         """Add new order."""
-        self.orders.append(order)
+        if self._order_count == len(self._orders):
+            self._compact_orders()
+
+        slot = self._order_count
+        self._orders[slot] = order
+        self._order_limits[slot] = np.nan if order.price is None else order.price
+        self._order_sides[slot] = order.side
+        self._order_sizes[slot] = order.size
+        self._order_active[slot] = True
+        self._order_count += 1
+
+    def _remove_order(self, slot: int) -> None:
+        """Remove pending order in slot."""
+        self._order_active[slot] = False
+        self._orders[slot] = None
+
+    def _active_slots(self) -> np.ndarray:
+        """Get slots of pending orders."""
+        return np.flatnonzero(self._order_active[:self._order_count])
+
+    def _compact_orders(self) -> None:
+        """Drop removed orders, growing arrays if still full."""
+        slots = self._active_slots()
+        count = len(slots)
+        capacity = len(self._orders)
+        if count == capacity:
+            capacity = max(capacity * 2, ORDER_CAPACITY)
+
+        orders = [self._orders[i] for i in slots]
+        self._orders = orders + [None] * (capacity - count)
+
+        for name in ('_order_limits', '_order_sides', '_order_sizes'):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:count] = old[slots]
+            setattr(self, name, new)
+
+        self._order_active = np.zeros(capacity, dtype=bool)
+        self._order_active[:count] = True
+        self._order_count = count
 
     def update(self, current_price: float, current_time: datetime) -> None:
         """Update position state."""
         # Update last price
-        self._current_price = current_price
+        self.last_price = current_price
         self.last_update = current_time
 
+        # Fill triggered orders
+        for slot in self._active_slots():
+            order = self._orders[slot]
+            if order.is_triggered(current_price):
+                self._remove_order(slot)
+                self._process_order(order, current_price, current_time)
+
         # Check stops
         if self.should_stop_out(current_price):
             self.close(current_price, current_time)
 
+    def update_vectorized(self, prices: np.ndarray) -> np.ndarray:
+        """
+        Find bar each pending order triggers on.
+
+        Resolves all pending orders against a whole price series at
+        once, so callers only need to fill the orders that trigger
+        (see ``fill_triggered``). Each index is the bar per-bar
+        ``update`` calls would fill the order on.
+
+        Args:
+            prices: Price series
+
+        Returns:
+            Trigger bar index per pending order (-1 if never triggered),
+            aligned with ``orders``
+        """
+        slots = self._active_slots()
+
+        # Per-order scans stop at the first hit, which is cheapest for a
+        # few orders; many orders share one pass over running extremes
+        if len(slots) > SORTED_TRIGGER_MIN_ORDERS:
+            find = first_triggers_sorted
+        else:
+            find = first_triggers
+
+        return find(
+            np.ascontiguousarray(prices, dtype=np.float64),
+            self._order_limits[slots],
+            self._order_sides[slots]
+        )
+
+    def fill_triggered(self, prices: np.ndarray, times: Any) -> int:
+        """
+        Fill pending orders that trigger within a price window.
+
+        Same result as calling ``update`` on each bar: orders fill in
+        trigger-bar order at that bar's price and timestamp (data time,
+        not wall-clock time), and stops are checked on every bar from
+        each fill up to the next.
+
+        Args:
+            prices: Price series
+            times: Bar timestamps matching prices
+
+        Returns:
+            Number of orders filled
+        """
+        prices = np.ascontiguousarray(prices, dtype=np.float64)
+        if len(prices) == 0:
+            return 0
+
+        triggers = self.update_vectorized(prices)
+        slots = self._active_slots()
+
+        hit = np.flatnonzero(triggers >= 0)
+        start = 0
+        for j in hit[np.argsort(triggers[hit], kind='stable')]:
+            bar = triggers[j]
+            self._stop_out_between(prices, times, start, bar)
+            start = bar
+
+            order = self._orders[slots[j]]
+            self._remove_order(slots[j])
+            self._process_order(order, prices[bar], times[bar])
+
+        self._stop_out_between(prices, times, start, len(prices))
+        self.last_price = prices[-1]
+        self.last_update = times[-1]
+
+        return len(hit)
+
+    def _stop_out_between(self, prices: np.ndarray, times: Any,
+                          start: int, end: int) -> None:
+        """Close position on first bar in [start, end) that hits a stop."""
+        if not self.is_open or start >= end:
+            return
+
+        # Sign folds long and short stop checks, as in should_stop_out
+        window = prices[start:end]
+        direction = 1.0 if self.is_long else -1.0
+        hits = np.zeros(len(window), dtype=bool)
+        if self.stop_loss:
+            hits |= direction * window <= direction * self.stop_loss
+        if self.take_profit:
+            hits |= direction * window >= direction * self.take_profit
+
+        if hits.any():
+            bar = start + int(np.argmax(hits))
+            self.close(prices[bar], times[bar])
+
+    def _process_order(self, order: Order, price: float, time: datetime) -> None:
+        """Fill order at price."""
+        order.status = 'filled'
+        signed = order.side * order.size
+
+        # Opposite side reduces, closes or reverses position
+        if self.size and (self.size > 0) != (signed > 0):
+            closed = min(abs(signed), abs(self.size))
+            self._record_trade(closed, price, time)
+            signed += closed if signed < 0 else -closed
+
+        # Same side opens or adds at average price
+        if signed:
+            if self.size:
+                total = abs(self.size) + abs(signed)
+                self.entry_price = (
+                    self.entry_price * abs(self.size) + price * abs(signed)
+                ) / total
+            else:
+                self.entry_price = price
+                self.entry_time = time
+            self.size += signed
+
+        # Order exits apply to position
+        if order.stop_loss is not None:
+            self.stop_loss = order.stop_loss
+        if order.take_profit is not None:
+            self.take_profit = order.take_profit
+
     def should_stop_out(self, price: float) -> bool:
         """Check if position should be stopped out."""
         if not self.is_open:
@@ -116,28 +401,57 @@ class Position:
         if not self.is_open:
             return
 
+        self._record_trade(abs(self.size), price, time)
+
+    def _record_trade(self, size: float, price: float, time: datetime) -> None:
+        """Record trade closing size units of position."""
+        direction = 1 if self.is_long else -1
+
         # Create trade record
         trade = Trade(
             entry_time=self.entry_time,
             entry_price=self.entry_price,
             exit_time=time,
             exit_price=price,
-            size=abs(self.size),
+            size=size,
             type='long' if self.is_long else 'short',
-            pnl=self._calculate_pnl(price),
+            pnl=(price - self.entry_price) * size * direction,
             fees=self.fees
         )
         self.trades.append(trade)
+        self._trade_entries.append(self.entry_price)
+        self._trade_exits.append(price)
+        self._trade_sizes.append(size)
+        self._trade_sides.append(direction)
 
         # Update p&l
         self.pnl += trade.pnl
-
-        # Reset position
-        self.size = 0
-        self.entry_price = None
-        self.stop_loss = None
-        self.take_profit = None
         self.fees = 0
+        self.size -= size * direction
+
+        # Reset position once flat
+        if not self.size:
+            self.size = 0
+            self.entry_price = None
+            self.entry_time = None
+            self.stop_loss = None
+            self.take_profit = None
+
+    def pnls_array(self) -> np.ndarray:
+        """
+        Get P&L of recorded trades as array.
+
+        Computed in one pass over per-trade columns, avoiding
+        ``[t.pnl for t in trades]`` over many trades.
+
+        Returns:
+            P&L per trade, in trade order
+        """
+        entries = np.asarray(self._trade_entries, dtype=np.float64)
+        exits = np.asarray(self._trade_exits, dtype=np.float64)
+        sizes = np.asarray(self._trade_sizes, dtype=np.float64)
+        sides = np.asarray(self._trade_sides, dtype=np.float64)
+        return (exits - entries) * sizes * sides
 
     def _calculate_pnl(self, exit_price: float) -> float:
         """Calculate trade P&L."""
@@ -146,6 +460,42 @@ class Position:
         price_diff = exit_price - self.entry_price
         return price_diff * self.size
 
+def _indicator_key(indicator: Any, data: Any, dtype: Any) -> Optional[tuple]:
+    """
+    Build indicator cache key (None if not cacheable).
+
+    Only public attributes (constructor parameters) are keyed; private
+    ones hold derived constants or streaming state, which don't affect
+    ``calculate`` and would make equal instances key differently.
+    """
+    try:
+        params = tuple(sorted(
+            (name, value) for name, value in vars(indicator).items()
+            if not name.startswith('_')
+        ))
+        key = (
+            type(indicator).__module__,
+            type(indicator).__qualname__,
+            params,
+            id(data),
+            len(data),
+            np.dtype(dtype).str
+        )
+        hash(key)
+        weakref.ref(data)
+    except TypeError:
+        return None
+    return key
+
+def _as_indicator_array(values: Any, dtype: Any) -> Any:
+    """Convert indicator output to contiguous arrays for positional access."""
+    if isinstance(values, tuple):
+        return tuple(_as_indicator_array(v, dtype) for v in values)
+    # Numeric ndarray or Series
+    if getattr(getattr(values, 'dtype', None), 'kind', None) in ('i', 'u', 'f'):
+        return np.ascontiguousarray(values, dtype=dtype)
+    return values
+
 class StrategyState:
     """Strategy state container."""
 
@@ -184,6 +534,9 @@ class StrategyState:
 class StrategyBase(ABC):
     """Base class for trading strategies."""
 
+    # Indicator value dtype (float32 halves memory if precision allows)
+    indicator_dtype = np.float64
+
     def __init__(self, parameters: Optional[Dict[str, Any]] = None):
         """Initialize strategy."""
         # Initialize state
@@ -208,7 +561,7 @@ class StrategyBase(ABC):
         """Process next market update."""
         pass
 
-    def set_data(self, data: pd.DataFrame) -> None:
+    def set_data(self, data: 'pd.DataFrame') -> None:
         """Set market data."""
         self.state.data = data
         if not self._initialized:
@@ -240,22 +593,51 @@ class StrategyBase(ABC):
         return order
 
     def close(self) -> None:
-        """Close current position."""
-        if self.state.position.is_open:
-            self.state.position.close(
-                self.state.data['Close'][-1],
-                self.state._last_update
-            )
+        """Close current position at last price."""
+        position = self.state.position
+        if not position.is_open:
+            return
+
+        # Flatten directly (no order round trip); fall back to the
+        # last close when the position hasn't seen a price yet
+        price = position.last_price
+        if price is None:
+            price = self.state.data['Close'].iat[-1]
+
+        position.close(price, self.state._last_update)
 
     # Indicator management
     def add_indicator(self, name: str, indicator: Any, *args, **kwargs) -> Any:
-        """Add technical indicator."""
+        """
+        Add technical indicator.
+
+        Results are cached by indicator type, parameters and input data,
+        so strategies sharing data (e.g. during optimization) compute each
+        indicator once. Cached values are shared and shouldn't be modified
+        in place; pass ``cache=False`` for indicators that aren't
+        deterministic.
+        """
+        cache = kwargs.pop('cache', True)
+
         # Create indicator instance if needed
         if isinstance(indicator, type):
             indicator = indicator(*args, **kwargs)
 
-        # Calculate indicator
-        values = indicator.calculate(self.state.data)
+        # Calculate indicator (or reuse cached values)
+        data = self.state.data
+        key = _indicator_key(indicator, data, self.indicator_dtype) if cache else None
+        entry = _INDICATOR_CACHE.get(key) if key is not None else None
+
+        if entry is not None and entry[0]() is data:
+            _INDICATOR_CACHE.move_to_end(key)
+            values = entry[1]
+        else:
+            values = _as_indicator_array(indicator.calculate(data),
+                                         self.indicator_dtype)
+            if key is not None:
+                _INDICATOR_CACHE[key] = (weakref.ref(data), values)
+                if len(_INDICATOR_CACHE) > INDICATOR_CACHE_SIZE:
+                    _INDICATOR_CACHE.popitem(last=False)
 
         # Store instance and values
         self.state.indicators[name] = {
@@ -265,6 +647,11 @@ class StrategyBase(ABC):
 
         return values
 
+    @staticmethod
+    def clear_indicator_cache() -> None:
+        """Clear indicator results shared across strategies."""
+        _INDICATOR_CACHE.clear()
+
     def get_parameters(self) -> Dict[str, Any]:
         """Get strategy parameters."""
         return self.parameters
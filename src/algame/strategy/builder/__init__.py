@@ -14,20 +14,32 @@ The builder follows a component-based design where:
 - Code is generated from components
 """
 
+from importlib import import_module
+
 from .base import BuilderComponent, ComponentRegistry
 from .strategy import StrategyBuilder
-from .rules import RuleBuilder, RuleParser
-from .indicators import IndicatorBuilder
-from .parameters import ParameterBuilder
-from .gui import StrategyEditor
+from .rules import RuleComponent, RuleParser
+from .indicators import IndicatorComponent
+from .parameters import ParameterComponent
 
 __all__ = [
     'BuilderComponent',
     'ComponentRegistry',
     'StrategyBuilder',
-    'RuleBuilder',
+    'RuleComponent',
     'RuleParser',
-    'IndicatorBuilder',
-    'ParameterBuilder',
+    'IndicatorComponent',
+    'ParameterComponent',
     'StrategyEditor'
 ]
+
+# The editor pulls in tkinter and the indicator registry, so it is only
+# imported when first accessed
+def __getattr__(name: str):
+    """Import editor lazily on first access."""
+    if name != 'StrategyEditor':
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = import_module('.gui', __name__).StrategyEditor
+    globals()[name] = value
+    return value
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -7,6 +7,8 @@ logger = logging.getLogger(__name__)
 class BuilderComponent(ABC):
     """Base class for strategy builder components."""
 
+    __slots__ = ('name', 'parameters', 'metadata')
+
     def __init__(self, name: str):
         self.name = name
         self.parameters: Dict[str, Any] = {}
@@ -55,9 +57,25 @@ class ComponentRegistry:
 
     def get(self, name: str) -> type:
         """Get component class by name."""
-        if name not in self._components:
-            raise ValueError(f"Component not found: {name}")
-        return self._components[name]
+        try:
+            return self._components[name]
+        except KeyError:
+            raise ValueError(f"Component not found: {name}") from None
+
+    def factory(self, name: str) -> Callable[..., BuilderComponent]:
+        """
+        Get component constructor by name.
+
+        Resolve once and call the result for each new component,
+        e.g. ``make_rule = registry.factory('rule')``.
+
+        Args:
+            name: Component name
+
+        Returns:
+            Callable creating component instances
+        """
+        return self.get(name)
 
     def list_components(self) -> List[str]:
         """Get list of registered components."""
@@ -1,17 +1,26 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-from typing import Dict, Any, Optional, List
+from typing import Callable, Dict, Optional, List, Tuple, NamedTuple
 import logging
-import json
-from pathlib import Path
 
-from ..base import StrategyBase
 from ..indicators import list_indicators, get_indicator
-from .base import BuilderComponent, ComponentRegistry
+from .parameters import NUMERIC_TYPES
 from .strategy import StrategyBuilder
 
 logger = logging.getLogger(__name__)
 
+# Delay before regenerating code preview after an edit
+PREVIEW_DELAY_MS = 150
+
+class _ParamSlot(NamedTuple):
+    """Reusable widgets for one indicator parameter row."""
+    frame: ttk.Frame
+    label: ttk.Label
+    entry: ttk.Entry
+    check: ttk.Checkbutton
+    str_var: tk.StringVar
+    bool_var: tk.BooleanVar
+
 class StrategyEditor(ttk.Frame):
     """
     GUI editor for building trading strategies.
@@ -40,11 +49,25 @@ class StrategyEditor(ttk.Frame):
         # Strategy metadata
         self.strategy_name = tk.StringVar(value="MyStrategy")
         self.strategy_desc = tk.StringVar()
+        self.template_var = tk.StringVar()
 
         # Component tracking
         self.current_component: Optional[str] = None
         self.modified = False
 
+        # Last applied values, to skip redundant widget updates
+        self._last_param_type: Optional[str] = None
+        self._last_template = ""
+
+        # Preview regenerates after edits settle, only when dirty
+        self._preview_dirty = True
+        self._preview_after_id: Optional[str] = None
+
+        # Generated code and class, keyed by builder fingerprint and metadata
+        self._strategy_key: Optional[Tuple[int, str, str]] = None
+        self._strategy_code: Optional[str] = None
+        self._strategy_class: Optional[type] = None
+
         # Create and layout widgets
         self._create_widgets()
         self._layout_widgets()
@@ -59,22 +82,44 @@ class StrategyEditor(ttk.Frame):
         # Create main notebook for tabs
         self.notebook = ttk.Notebook(self)
 
-        # Create panels
-        self._create_metadata_panel()
-        self._create_template_panel()
-        self._create_parameter_panel()
-        self._create_indicator_panel()
-        self._create_rule_panel()
-        self._create_preview_panel()
+        # Create tabs; panels other than metadata are built on first view
+        self._panel_builders: Dict[str, Callable[[], None]] = {}
+        self.metadata_frame = self._add_panel("Metadata", self._create_metadata_panel)
+        self.template_frame = self._add_panel("Template", self._create_template_panel)
+        self.param_frame = self._add_panel("Parameters", self._create_parameter_panel)
+        self.indicator_frame = self._add_panel("Indicators",
+                                               self._create_indicator_panel)
+        self.rule_frame = self._add_panel("Rules", self._create_rule_panel)
+        self.preview_frame = self._add_panel("Preview", self._create_preview_panel)
+        self._build_panel(self.metadata_frame)
 
         # Create toolbar
         self._create_toolbar()
 
+    def _add_panel(self, text: str, builder: Callable[[], None]) -> ttk.Frame:
+        """Add empty notebook tab whose contents are built on demand."""
+        frame = ttk.Frame(self.notebook)
+        self.notebook.add(frame, text=text)
+        self._panel_builders[str(frame)] = builder
+        return frame
+
+    def _build_panel(self, frame: ttk.Frame) -> None:
+        """Build panel contents if not built yet."""
+        builder = self._panel_builders.pop(str(frame), None)
+        if builder is not None:
+            builder()
+
+    def _panel_built(self, frame: ttk.Frame) -> bool:
+        """Check if panel contents exist."""
+        return str(frame) not in self._panel_builders
+
+    def _on_tab_changed(self, event=None):
+        """Build newly selected panel and refresh preview."""
+        self._build_panel(self.notebook.select())
+        self._update_preview()
+
     def _create_metadata_panel(self):
         """Create strategy metadata panel."""
-        self.metadata_frame = ttk.Frame(self.notebook)
-        self.notebook.add(self.metadata_frame, text="Metadata")
-
         # Strategy name
         name_frame = ttk.LabelFrame(self.metadata_frame, text="Strategy Name")
         name_frame.pack(fill='x', padx=5, pady=5)
@@ -95,14 +140,10 @@ class StrategyEditor(ttk.Frame):
 
     def _create_template_panel(self):
         """Create template selection panel."""
-        self.template_frame = ttk.Frame(self.notebook)
-        self.notebook.add(self.template_frame, text="Template")
-
         # Template selection
         template_frame = ttk.LabelFrame(self.template_frame, text="Select Template")
         template_frame.pack(fill='x', padx=5, pady=5)
 
-        self.template_var = tk.StringVar()
         templates = [
             "Empty Strategy",
             "Trend Following",
@@ -128,9 +169,6 @@ class StrategyEditor(ttk.Frame):
 
     def _create_parameter_panel(self):
         """Create parameter configuration panel."""
-        self.param_frame = ttk.Frame(self.notebook)
-        self.notebook.add(self.param_frame, text="Parameters")
-
         # Parameter list
         list_frame = ttk.Frame(self.param_frame)
         list_frame.pack(side='left', fill='y', padx=5, pady=5)
@@ -145,6 +183,7 @@ class StrategyEditor(ttk.Frame):
         self.param_list.heading('Value', text='Value')
         self.param_list.heading('Type', text='Type')
         self.param_list.pack(fill='y')
+        self.param_list.bind('<<TreeviewSelect>>', self._on_param_select)
 
         # Parameter editor
         editor_frame = ttk.LabelFrame(self.param_frame, text="Edit Parameter")
@@ -169,6 +208,7 @@ class StrategyEditor(ttk.Frame):
             state='readonly'
         )
         self.param_type.pack(side='left', fill='x', expand=True, padx=5)
+        self.param_type.bind('<<ComboboxSelected>>', self._on_param_type_change)
 
         # Default value
         default_frame = ttk.Frame(editor_frame)
@@ -205,20 +245,26 @@ class StrategyEditor(ttk.Frame):
             command=self._delete_parameter
         ).pack(side='left', padx=5)
 
+        self._update_param_list()
+
     def _create_indicator_panel(self):
         """Create indicator selection panel."""
-        self.indicator_frame = ttk.Frame(self.notebook)
-        self.notebook.add(self.indicator_frame, text="Indicators")
-
         # Category selection
         cat_frame = ttk.LabelFrame(self.indicator_frame, text="Categories")
         cat_frame.pack(side='left', fill='y', padx=5, pady=5)
 
-        indicators = list_indicators()
-        categories = set(ind.category for ind in indicators.values())
+        # Indicator classes, looked up on first selection
+        self._indicator_classes: Dict[str, type] = {}
+
+        # Group (name, description) rows by category once
+        self._indicators_by_category: Dict[str, List[Tuple[str, str]]] = {}
+        for info in list_indicators():
+            self._indicators_by_category.setdefault(info['category'], []).append(
+                (info['name'], info['description'])
+            )
 
         self.category_var = tk.StringVar()
-        for category in sorted(categories):
+        for category in sorted(self._indicators_by_category):
             ttk.Radiobutton(
                 cat_frame,
                 text=category,
@@ -241,6 +287,7 @@ class StrategyEditor(ttk.Frame):
         self.indicator_list.heading('Name', text='Name')
         self.indicator_list.heading('Description', text='Description')
         self.indicator_list.pack(fill='both', expand=True)
+        self.indicator_list.bind('<<TreeviewSelect>>', self._on_indicator_select)
 
         # Configuration editor
         config_frame = ttk.LabelFrame(self.indicator_frame, text="Configuration")
@@ -251,9 +298,6 @@ class StrategyEditor(ttk.Frame):
 
     def _create_rule_panel(self):
         """Create trading rule panel."""
-        self.rule_frame = ttk.Frame(self.notebook)
-        self.notebook.add(self.rule_frame, text="Rules")
-
         # Rule list
         list_frame = ttk.LabelFrame(self.rule_frame, text="Rules")
         list_frame.pack(fill='x', padx=5, pady=5)
@@ -268,6 +312,7 @@ class StrategyEditor(ttk.Frame):
         self.rule_list.heading('Type', text='Type')
         self.rule_list.heading('Condition', text='Condition')
         self.rule_list.pack(fill='x')
+        self.rule_list.bind('<<TreeviewSelect>>', self._on_rule_select)
 
         # Rule editor
         editor_frame = ttk.LabelFrame(self.rule_frame, text="Edit Rule")
@@ -308,11 +353,10 @@ class StrategyEditor(ttk.Frame):
             command=self._delete_rule
         ).pack(side='left', padx=5)
 
+        self._update_rule_list()
+
     def _create_preview_panel(self):
         """Create code preview panel."""
-        self.preview_frame = ttk.Frame(self.notebook)
-        self.notebook.add(self.preview_frame, text="Preview")
-
         # Code preview
         self.code_preview = tk.Text(
             self.preview_frame,
@@ -363,18 +407,50 @@ class StrategyEditor(ttk.Frame):
         # Template selection
         self.template_var.trace('w', self._on_template_change)
 
-        # Parameter events
-        self.param_list.bind('<<TreeviewSelect>>', self._on_param_select)
-        self.param_type.bind('<<ComboboxSelected>>', self._on_param_type_change)
+        # Metadata changes alter generated code
+        self.strategy_name.trace('w', self._on_metadata_change)
+        self.strategy_desc.trace('w', self._on_metadata_change)
 
-        # Indicator events
-        self.indicator_list.bind('<<TreeviewSelect>>', self._on_indicator_select)
+        # Panel building and preview update (panel widgets bind their
+        # own events when built)
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
 
-        # Rule events
-        self.rule_list.bind('<<TreeviewSelect>>', self._on_rule_select)
+    def _on_template_change(self, *args):
+        """Handle template selection."""
+        template = self.template_var.get()
+        if template == self._last_template:
+            return
+        self._last_template = template
+
+        self._preview_dirty = True
+        self._update_preview()
+
+    def _on_metadata_change(self, *args):
+        """Handle strategy name/description edits."""
+        self._preview_dirty = True
+        self._update_preview()
+
+    def _update_preview(self, event=None):
+        """Schedule preview regeneration once edits settle."""
+        if self._preview_after_id is not None:
+            self.after_cancel(self._preview_after_id)
+        self._preview_after_id = self.after(PREVIEW_DELAY_MS, self._do_update_preview)
+
+    def _do_update_preview(self):
+        """Regenerate code preview if anything changed."""
+        self._preview_after_id = None
+        if not self._preview_dirty or not self._panel_built(self.preview_frame):
+            return
+
+        try:
+            code = self._get_strategy_code()
+        except Exception as e:
+            logger.debug(f"Preview generation failed: {e}")
+            return
 
-        # Preview update
-        self.notebook.bind('<<NotebookTabChanged>>', self._update_preview)
+        self.code_preview.delete('1.0', 'end')
+        self.code_preview.insert('1.0', code)
+        self._preview_dirty = False
 
     def _update_parameter(self):
         """Add or update parameter."""
@@ -393,7 +469,7 @@ class StrategyEditor(ttk.Frame):
             'range': [
                 self.param_min.get(),
                 self.param_max.get()
-            ] if param_type in ('int', 'float') else None
+            ] if param_type in NUMERIC_TYPES else None
         }
 
         # Add to builder
@@ -406,6 +482,7 @@ class StrategyEditor(ttk.Frame):
         # Update list
         self._update_param_list()
         self.modified = True
+        self._preview_dirty = True
 
     def _delete_parameter(self):
         """Delete selected parameter."""
@@ -414,7 +491,7 @@ class StrategyEditor(ttk.Frame):
             return
 
         # Get parameter name
-        param_name = self.param_list.item(selected[0])['values'][0]
+        param_name = selected[0]
 
         # Remove from builder
         self.builder.remove_component(param_name)
@@ -422,21 +499,23 @@ class StrategyEditor(ttk.Frame):
         # Update list
         self._update_param_list()
         self.modified = True
+        self._preview_dirty = True
 
     def _update_param_list(self):
         """Update parameter list display."""
+        if not self._panel_built(self.param_frame):
+            return
+
         # Clear list
-        for item in self.param_list.get_children():
-            self.param_list.delete(item)
+        self.param_list.delete(*self.param_list.get_children())
 
         # Add parameters
-        for name, component in self.builder.components.items():
-            if component.__class__.__name__ == 'ParameterComponent':
-                self.param_list.insert('', 'end', values=(
-                    name,
-                    component.parameters['type'],
-                    component.parameters['default']
-                ))
+        for name, component in self.builder.components_of('parameter').items():
+            self.param_list.insert('', 'end', iid=name, values=(
+                name,
+                component.parameters['type'],
+                component.parameters['default']
+            ))
 
     def _on_param_select(self, event):
         """Handle parameter selection."""
@@ -445,7 +524,7 @@ class StrategyEditor(ttk.Frame):
             return
 
         # Get parameter details
-        param_name = self.param_list.item(selected[0])['values'][0]
+        param_name = selected[0]
         component = self.builder.components.get(param_name)
         if not component:
             return
@@ -455,6 +534,7 @@ class StrategyEditor(ttk.Frame):
         self.param_name.insert(0, param_name)
 
         self.param_type.set(component.parameters['type'])
+        self._on_param_type_change()
 
         self.param_default.delete(0, 'end')
         self.param_default.insert(0, component.parameters['default'])
@@ -465,31 +545,27 @@ class StrategyEditor(ttk.Frame):
             self.param_max.delete(0, 'end')
             self.param_max.insert(0, component.parameters['range'][1])
 
-    def _on_param_type_change(self, event):
+    def _on_param_type_change(self, event=None):
         """Handle parameter type change."""
         param_type = self.param_type.get()
+        if param_type == self._last_param_type:
+            return
+        self._last_param_type = param_type
 
         # Enable/disable range fields for numeric types
-        state = 'normal' if param_type in ('int', 'float') else 'disabled'
+        state = 'normal' if param_type in NUMERIC_TYPES else 'disabled'
         self.param_min.configure(state=state)
         self.param_max.configure(state=state)
 
     def _update_indicator_list(self):
         """Update indicator list based on selected category."""
         # Clear list
-        for item in self.indicator_list.get_children():
-            self.indicator_list.delete(item)
+        self.indicator_list.delete(*self.indicator_list.get_children())
 
-        # Get indicators for category
+        # Add indicators for category
         category = self.category_var.get()
-        indicators = list_indicators()
-
-        for name, metadata in indicators.items():
-            if metadata.category == category:
-                self.indicator_list.insert('', 'end', values=(
-                    name,
-                    metadata.description
-                ))
+        for values in self._indicators_by_category.get(category, ()):
+            self.indicator_list.insert('', 'end', iid=values[0], values=values)
 
     def _on_indicator_select(self, event):
         """Handle indicator selection."""
@@ -498,8 +574,11 @@ class StrategyEditor(ttk.Frame):
             return
 
         # Get indicator details
-        indicator_name = self.indicator_list.item(selected[0])['values'][0]
-        indicator = get_indicator(indicator_name)
+        indicator_name = selected[0]
+        indicator = self._indicator_classes.get(indicator_name)
+        if indicator is None:
+            indicator = get_indicator(indicator_name)
+            self._indicator_classes[indicator_name] = indicator
 
         # Update configuration panel
         self._update_indicator_config(indicator)
@@ -510,6 +589,10 @@ class StrategyEditor(ttk.Frame):
         self.ind_params = ttk.LabelFrame(parent, text="Parameters")
         self.ind_params.pack(fill='x', padx=5, pady=5)
 
+        # Parameter widgets, pooled across indicator selections
+        self._param_slots: List[_ParamSlot] = []
+        self.ind_config: Dict[str, tk.Variable] = {}
+
         # Input selection
         input_frame = ttk.Frame(parent)
         input_frame.pack(fill='x', padx=5, pady=5)
@@ -531,28 +614,49 @@ class StrategyEditor(ttk.Frame):
 
     def _update_indicator_config(self, indicator):
         """Update indicator configuration panel."""
-        # Clear existing parameters
-        for widget in self.ind_params.winfo_children():
-            widget.destroy()
-
-        # Add parameter fields
+        # Fill parameter slots, reusing widgets from earlier selections
         self.ind_config = {}
-        for name, meta in indicator.get_parameters().items():
-            frame = ttk.Frame(self.ind_params)
-            frame.pack(fill='x', padx=5, pady=2)
-
-            ttk.Label(frame, text=f"{name}:").pack(side='left')
+        parameters = indicator.get_parameters()
+        for i, (name, meta) in enumerate(parameters.items()):
+            slot = self._param_slot(i)
+            slot.label.configure(text=f"{name}:")
 
             if meta['type'] == 'bool':
-                var = tk.BooleanVar(value=meta['default'])
-                widget = ttk.Checkbutton(frame, variable=var)
+                var, shown, hidden = slot.bool_var, slot.check, slot.entry
+                var.set(bool(meta['default']))
             else:
-                var = tk.StringVar(value=str(meta['default']))
-                widget = ttk.Entry(frame, textvariable=var)
+                var, shown, hidden = slot.str_var, slot.entry, slot.check
+                var.set(str(meta['default']))
 
-            widget.pack(side='left', fill='x', expand=True, padx=5)
+            hidden.pack_forget()
+            shown.pack(side='left', fill='x', expand=True, padx=5)
+            slot.frame.pack(fill='x', padx=5, pady=2)
             self.ind_config[name] = var
 
+        # Hide unused slots
+        for slot in self._param_slots[len(parameters):]:
+            slot.frame.pack_forget()
+
+    def _param_slot(self, index: int) -> '_ParamSlot':
+        """Get indicator parameter slot, creating it if needed."""
+        while len(self._param_slots) <= index:
+            frame = ttk.Frame(self.ind_params)
+            label = ttk.Label(frame)
+            label.pack(side='left')
+
+            str_var = tk.StringVar()
+            bool_var = tk.BooleanVar()
+            self._param_slots.append(_ParamSlot(
+                frame,
+                label,
+                ttk.Entry(frame, textvariable=str_var),
+                ttk.Checkbutton(frame, variable=bool_var),
+                str_var,
+                bool_var
+            ))
+
+        return self._param_slots[index]
+
     def _add_indicator(self):
         """Add indicator to strategy."""
         selected = self.indicator_list.selection()
@@ -561,7 +665,7 @@ class StrategyEditor(ttk.Frame):
             return
 
         # Get indicator details
-        indicator_name = self.indicator_list.item(selected[0])['values'][0]
+        indicator_name = selected[0]
 
         # Get configuration
         params = {
@@ -581,6 +685,7 @@ class StrategyEditor(ttk.Frame):
                 }
             )
             self.modified = True
+            self._preview_dirty = True
             messagebox.showinfo("Success", "Indicator added")
 
         except Exception as e:
@@ -598,11 +703,18 @@ class StrategyEditor(ttk.Frame):
             messagebox.showerror("Error", "Enter rule condition")
             return
 
+        # Unique rule name, also used as list item id
+        index = len(self.rule_list.get_children())
+        name = f"{rule_type.lower()}_rule_{index}"
+        while name in self.builder.components:
+            index += 1
+            name = f"{rule_type.lower()}_rule_{index}"
+
         # Add to builder
         try:
             self.builder.add_component(
                 'rule',
-                f"{rule_type.lower()}_rule_{len(self.rule_list.get_children())}",
+                name,
                 {
                     'type': rule_type.lower(),
                     'condition': condition
@@ -610,12 +722,13 @@ class StrategyEditor(ttk.Frame):
             )
 
             # Update list
-            self.rule_list.insert('', 'end', values=(
+            self.rule_list.insert('', 'end', iid=name, values=(
                 rule_type,
                 condition
             ))
 
             self.modified = True
+            self._preview_dirty = True
             self.condition.delete('1.0', 'end')
 
         except Exception as e:
@@ -627,21 +740,25 @@ class StrategyEditor(ttk.Frame):
         if not selected:
             return
 
-        # Get rule details
-        rule_type = self.rule_list.item(selected[0])['values'][0]
-        condition = self.rule_list.item(selected[0])['values'][1]
-
-        # Find matching component
-        for name, component in self.builder.components.items():
-            if (component.__class__.__name__ == 'RuleComponent' and
-                component.parameters['type'] == rule_type.lower() and
-                component.parameters['condition'] == condition):
-                self.builder.remove_component(name)
-                break
+        # Remove component (item ids are rule names)
+        self.builder.remove_component(selected[0])
 
         # Update list
         self.rule_list.delete(selected[0])
         self.modified = True
+        self._preview_dirty = True
+
+    def _update_rule_list(self):
+        """Update rule list display."""
+        if not self._panel_built(self.rule_frame):
+            return
+
+        self.rule_list.delete(*self.rule_list.get_children())
+        for name, component in self.builder.components_of('rule').items():
+            self.rule_list.insert('', 'end', iid=name, values=(
+                component.parameters['type'].title(),
+                component.parameters['condition']
+            ))
 
     def _on_rule_select(self, event):
         """Handle rule selection."""
@@ -650,13 +767,14 @@ class StrategyEditor(ttk.Frame):
             return
 
         # Get rule details
-        rule_type = self.rule_list.item(selected[0])['values'][0]
-        condition = self.rule_list.item(selected[0])['values'][1]
+        component = self.builder.components.get(selected[0])
+        if not component:
+            return
 
         # Update editor
-        self.rule_type.set(rule_type)
+        self.rule_type.set(component.parameters['type'].title())
         self.condition.delete('1.0', 'end')
-        self.condition.insert('1.0', condition)
+        self.condition.insert('1.0', component.parameters['condition'])
 
     def _new_strategy(self):
         """Create new strategy."""
@@ -676,9 +794,10 @@ class StrategyEditor(ttk.Frame):
         self.template_var.set("")
 
         self._update_param_list()
-        self.rule_list.delete(*self.rule_list.get_children())
+        self._update_rule_list()
 
         self.modified = False
+        self._preview_dirty = True
 
     def _load_strategy(self):
         """Load strategy configuration."""
@@ -699,6 +818,7 @@ class StrategyEditor(ttk.Frame):
                 self.builder.load(filename)
                 self._update_ui_from_builder()
                 self.modified = False
+                self._preview_dirty = True
 
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to load strategy: {e}")
@@ -723,14 +843,18 @@ class StrategyEditor(ttk.Frame):
     def _generate_strategy(self):
         """Generate strategy code."""
         try:
-            strategy_class = self.builder.generate_strategy(
-                self.strategy_name.get()
-            )
+            code = self._get_strategy_code()
+            if self._strategy_class is None:
+                self._strategy_class = self.builder.generate_strategy(
+                    self.strategy_name.get(),
+                    self.strategy_desc.get()
+                )
 
             # Show preview
-            code = self._get_strategy_code(strategy_class)
+            self._build_panel(self.preview_frame)
             self.code_preview.delete('1.0', 'end')
             self.code_preview.insert('1.0', code)
+            self._preview_dirty = False
 
             self.notebook.select(self.preview_frame)
 
@@ -750,20 +874,17 @@ class StrategyEditor(ttk.Frame):
         except Exception as e:
             messagebox.showerror("Error", f"Failed to test strategy: {e}")
 
-    def _get_strategy_code(self, strategy_class: type) -> str:
-        """Get formatted strategy code."""
-        import inspect
-        code = inspect.getsource(strategy_class)
-
-        # Add imports
-        imports = [
-            "from algame.strategy import StrategyBase",
-            "from algame.strategy.indicators import *",
-            "import pandas as pd",
-            "import numpy as np"
-        ]
+    def _get_strategy_code(self) -> str:
+        """Get generated strategy code, regenerating only after edits."""
+        name = self.strategy_name.get()
+        description = self.strategy_desc.get()
+        key = (self.builder.fingerprint(), name, description)
 
-        return "\n".join(imports + ["", code])
+        if key != self._strategy_key:
+            self._strategy_code = self.builder.generate_code(name, description)
+            self._strategy_class = None
+            self._strategy_key = key
+        return self._strategy_code
 
     def _update_ui_from_builder(self):
         """Update UI from builder state."""
@@ -771,13 +892,7 @@ class StrategyEditor(ttk.Frame):
         self._update_param_list()
 
         # Update rules
-        self.rule_list.delete(*self.rule_list.get_children())
-        for component in self.builder.components.values():
-            if component.__class__.__name__ == 'RuleComponent':
-                self.rule_list.insert('', 'end', values=(
-                    component.parameters['type'].title(),
-                    component.parameters['condition']
-                ))
+        self._update_rule_list()
 
         # Update preview
         self._generate_strategy()
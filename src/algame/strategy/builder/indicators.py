@@ -1,11 +1,41 @@
+from typing import Callable, Dict, Optional
+import inspect
+import re
+
 from .base import BuilderComponent
+from .kernels import KERNELS
+
+# Kernel source per indicator type, with the function name as {func}
+_KERNEL_SOURCES: Dict[str, str] = {}
+
+def kernel_source(ind_type: str, func: str) -> str:
+    """
+    Get source of indicator kernel as function ``func``.
+
+    Args:
+        ind_type: Indicator type with a kernel in ``KERNELS``
+        func: Function name to define
+
+    Returns:
+        Kernel source, decorated with njit
+    """
+    source = _KERNEL_SOURCES.get(ind_type)
+    if source is None:
+        kernel = KERNELS[ind_type]
+        source = inspect.getsource(getattr(kernel, 'py_func', kernel))
+        source = re.sub(r'def \w+\(', 'def {func}(', source, count=1)
+        _KERNEL_SOURCES[ind_type] = source
+    return "\n" + source.format(func=func)
 
 class IndicatorComponent(BuilderComponent):
     """Technical indicator component."""
 
+    __slots__ = ()
+
+    _REQUIRED = frozenset({'type', 'inputs', 'parameters'})
+
     def validate(self) -> bool:
-        required = ['type', 'inputs', 'parameters']
-        if not all(k in self.parameters for k in required):
+        if not self._REQUIRED <= self.parameters.keys():
             return False
 
         # Validate indicator exists
@@ -17,12 +47,46 @@ class IndicatorComponent(BuilderComponent):
 
         return True
 
+    @property
+    def kernel_name(self) -> str:
+        """Name of generated kernel function."""
+        return f"_ind_{self.name}"
+
+    @property
+    def has_kernel(self) -> bool:
+        """Whether indicator has a kernel form."""
+        return (self.parameters['type'] in KERNELS and
+                self.parameters['parameters'].keys() <= {'period'})
+
+    def generate_kernel(self) -> Optional[str]:
+        """
+        Generate module-level njit kernel for indicator.
+
+        Returns:
+            Kernel source, or None if indicator has no kernel form
+        """
+        if not self.has_kernel:
+            return None
+        return kernel_source(self.parameters['type'], self.kernel_name)
+
+    @property
+    def kernel(self) -> Optional[Callable]:
+        """Compiled kernel for indicator, or None if it has none."""
+        return KERNELS[self.parameters['type']] if self.has_kernel else None
+
     def generate_code(self) -> str:
         ind_type = self.parameters['type']
         inputs = self.parameters['inputs']
         params = self.parameters['parameters']
 
+        # Call kernel on full input column
+        if self.has_kernel:
+            column = inputs[0] if isinstance(inputs, (list, tuple)) else inputs
+            values = f"self.state.data[{column!r}].to_numpy(dtype=np.float64)"
+            period = params.get('period', 14)
+            return f"self.{self.name} = {self.kernel_name}({values}, {period})"
+
         # Format parameters
-        param_str = ", ".join(f"{k}={v}" for k,v in params.items())
+        args = ', '.join(f"{k}={v}" for k, v in params.items())
 
-        return f"self.{self.name} = self.add_indicator('{ind_type}', {inputs}, {param_str})"
+        return f"self.{self.name} = self.add_indicator({ind_type!r}, {inputs}, {args})"
@@ -0,0 +1,98 @@
+"""
+Compiled indicator kernels for built strategies.
+
+Each kernel takes a float64 array and integer period and returns a
+float64 array matching the corresponding Indicator class. Kernels are
+module-level so numba can cache them; their source is also emitted
+into generated strategy code.
+"""
+
+import numpy as np
+
+from .._jit import njit
+
+@njit(cache=True)
+def sma(values, period):
+    n = len(values)
+    out = np.full(n, np.nan)
+    total = 0.0
+    last_nan = -period
+    for i in range(n):
+        # NaNs stay out of the sum; windows containing one are NaN
+        if values[i] != values[i]:
+            last_nan = i
+        else:
+            total += values[i]
+        if i >= period and values[i - period] == values[i - period]:
+            total -= values[i - period]
+        if i >= period - 1 and i - last_nan >= period:
+            out[i] = total / period
+    return out
+
+@njit(cache=True)
+def ema(values, period):
+    n = len(values)
+    out = np.empty(n)
+    alpha = 2.0 / (period + 1)
+    mean = np.nan
+    old_wt = 1.0
+    for i in range(n):
+        # Start at first valid value; NaNs carry the mean and decay
+        # its weight, as pandas ewm(adjust=False)
+        value = values[i]
+        if mean != mean:
+            mean = value
+        else:
+            old_wt *= 1.0 - alpha
+            if value == value:
+                if value != mean:
+                    mean = (old_wt * mean + alpha * value) / (old_wt + alpha)
+                old_wt = 1.0
+        out[i] = mean
+    return out
+
+@njit(cache=True)
+def wma(values, period):
+    n = len(values)
+    out = np.full(n, np.nan)
+    weight_sum = period * (period + 1) / 2.0
+    for i in range(period - 1, n):
+        total = 0.0
+        for j in range(period):
+            total += values[i - period + 1 + j] * (j + 1)
+        out[i] = total / weight_sum
+    return out
+
+@njit(cache=True)
+def rsi(values, period):
+    n = len(values)
+    out = np.full(n, np.nan)
+    if n <= period:
+        return out
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, n):
+        change = values[i] - values[i - 1]
+        gain = change if change > 0 else 0.0
+        loss = -change if change < 0 else 0.0
+        if i <= period:
+            avg_gain += gain / period
+            avg_loss += loss / period
+            if i < period:
+                continue
+        else:
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+        if avg_loss == 0.0:
+            out[i] = 100.0
+        else:
+            out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    return out
+
+# Kernel per indicator type
+KERNELS = {
+    'SMA': sma,
+    'EMA': ema,
+    'WMA': wma,
+    'RSI': rsi
+}
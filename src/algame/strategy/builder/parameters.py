@@ -1,20 +1,46 @@
+from typing import Any
+
 from .base import BuilderComponent
 
+# Parameter types, and those taking a numeric range
+PARAMETER_TYPES = frozenset({'int', 'float', 'bool', 'str'})
+NUMERIC_TYPES = frozenset({'int', 'float'})
+
+# Conversion of default values per parameter type
+_CASTS = {
+    'int': int,
+    'float': float,
+    'bool': lambda v: (v.strip().lower() in ('1', 'true', 'yes')
+                       if isinstance(v, str) else bool(v)),
+    'str': str
+}
+
 class ParameterComponent(BuilderComponent):
     """Strategy parameter component."""
 
+    __slots__ = ()
+
+    _REQUIRED = frozenset({'type', 'default'})
+
     def validate(self) -> bool:
-        required = ['type', 'default']
-        if not all(k in self.parameters for k in required):
+        if not self._REQUIRED <= self.parameters.keys():
             return False
 
         # Validate type
-        if self.parameters['type'] not in ['int', 'float', 'bool', 'str']:
+        if self.parameters['type'] not in PARAMETER_TYPES:
+            return False
+
+        # Validate default converts to type
+        try:
+            self.default_value()
+        except (TypeError, ValueError):
             return False
 
         return True
 
+    def default_value(self) -> Any:
+        """Get default converted to parameter type."""
+        return _CASTS[self.parameters['type']](self.parameters['default'])
+
     def generate_code(self) -> str:
-        param_type = self.parameters['type']
-        default = self.parameters['default']
-        return f"{self.name}: {param_type} = {default}"
+        return f"self.parameters.setdefault({self.name!r}, {self.default_value()!r})"
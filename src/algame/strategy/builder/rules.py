@@ -1,25 +1,72 @@
+from functools import lru_cache
+from types import CodeType
+from typing import Optional
+
 from .base import BuilderComponent
 
+@lru_cache(maxsize=1024)
+def _compile_rule(source: str) -> Optional[CodeType]:
+    """
+    Compile parsed rule condition, shared across components.
+
+    Rebuilt strategies (e.g. in parameter sweeps) create fresh rule
+    components with the same conditions, so they reuse code objects
+    here instead of recompiling.
+
+    Returns:
+        Condition code, or None if it doesn't compile
+    """
+    try:
+        return compile(source, '<rule>', 'eval')
+    except (SyntaxError, ValueError):
+        return None
+
 class RuleComponent(BuilderComponent):
     """Trading rule component."""
 
+    __slots__ = ('_parsed_src', '_parsed', '_parsed_code')
+
+    def __init__(self, name: str):
+        super().__init__(name)
+
+        # Last parsed condition, its parsed form and compiled code
+        # (None if it doesn't compile)
+        self._parsed_src: Optional[str] = None
+        self._parsed: Optional[str] = None
+        self._parsed_code: Optional[CodeType] = None
+
+    def _parse(self) -> str:
+        """Parse condition, reusing result while condition is unchanged."""
+        condition = self.parameters['condition']
+        if condition != self._parsed_src:
+            self._parsed = _PARSER.parse(condition)
+            self._parsed_code = _compile_rule(self._parsed)
+            self._parsed_src = condition
+        return self._parsed
+
     def validate(self) -> bool:
         if 'condition' not in self.parameters:
             return False
 
         # Validate rule syntax
-        try:
-            condition = self.parameters['condition']
-            compile(condition, '<string>', 'eval')
-        except:
-            return False
+        self._parse()
+        return self._parsed_code is not None
 
-        return True
+    @property
+    def condition_code(self) -> Optional[CodeType]:
+        """Compiled condition, or None if it doesn't compile."""
+        self._parse()
+        return self._parsed_code
+
+    @property
+    def is_entry(self) -> bool:
+        """Whether rule buys (entry) rather than sells."""
+        return self.parameters.get('type') == 'entry'
 
     def generate_code(self) -> str:
-        condition = self.parameters['condition']
+        condition = self._parse()
 
-        if self.parameters.get('type') == 'entry':
+        if self.is_entry:
             return f"if {condition}:\n    self.buy()"
         else:
             return f"if {condition}:\n    self.sell()"
@@ -38,3 +85,6 @@ class RuleParser:
         """
         # TODO: Implement rule parsing
         return condition
+
+# Shared parser for rule components
+_PARSER = RuleParser()
@@ -1,7 +1,13 @@
-from typing import Dict, List, Optional, Any ,Type
+from typing import Dict, List, Optional, Any ,Type, Tuple, DefaultDict, Hashable
+from collections import defaultdict, OrderedDict
+from types import CodeType
+import builtins
 import logging
 from pathlib import Path
 import json
+import textwrap
+
+import numpy as np
 
 from .parameters import ParameterComponent
 from .indicators import IndicatorComponent
@@ -11,16 +17,111 @@ from ..base import StrategyBase
 
 logger = logging.getLogger(__name__)
 
+# Compiled strategy classes keyed by name, description and component
+# specs, least recently used first
+_COMPILED_STRATEGIES: 'OrderedDict[Hashable, Type[StrategyBase]]' = OrderedDict()
+
+# Max cached strategy classes
+COMPILED_CACHE_SIZE = 256
+
+# Component kind per component class
+COMPONENT_KINDS = (
+    (ParameterComponent, 'parameter'),
+    (IndicatorComponent, 'indicator'),
+    (RuleComponent, 'rule')
+)
+
+# Component class per serialized type name
+COMPONENT_TYPES: Dict[str, Type[BuilderComponent]] = {
+    component_class.__name__: component_class
+    for component_class, _ in COMPONENT_KINDS
+}
+
+# Kind per exact class; subclasses are resolved once and added
+_KIND_BY_CLASS: Dict[type, Optional[str]] = dict(COMPONENT_KINDS)
+
+def component_kind(component: BuilderComponent) -> Optional[str]:
+    """Get kind of component ('parameter', 'indicator' or 'rule')."""
+    component_class = type(component)
+    try:
+        return _KIND_BY_CLASS[component_class]
+    except KeyError:
+        pass
+
+    kind = None
+    for base_class, base_kind in COMPONENT_KINDS:
+        if isinstance(component, base_class):
+            kind = base_kind
+            break
+    _KIND_BY_CLASS[component_class] = kind
+    return kind
+
+def _make_strategy_class(name: str,
+                         description: str,
+                         defaults: List[Tuple[str, Any]],
+                         setup: List[CodeType],
+                         rules: List[Tuple[CodeType, bool]],
+                         namespace: Dict[str, Any]) -> Type[StrategyBase]:
+    """
+    Build strategy class from precompiled component code.
+
+    Methods are closures over the component lists, so no class source
+    is generated or exec'd.
+
+    Args:
+        name: Strategy class name
+        description: Strategy docstring
+        defaults: (name, default) per parameter
+        setup: Indicator statements run in ``initialize``
+        rules: (condition, is_entry) per rule, checked in ``next``
+        namespace: Globals for component code
+
+    Returns:
+        Strategy class
+    """
+    def __init__(self, parameters: Optional[Dict[str, Any]] = None):
+        StrategyBase.__init__(self, parameters)
+        for key, value in defaults:
+            self.parameters.setdefault(key, value)
+
+    def initialize(self) -> None:
+        local = {'self': self}
+        for code in setup:
+            exec(code, namespace, local)
+
+    def next(self) -> None:
+        local = {'self': self}
+        for condition, is_entry in rules:
+            if eval(condition, namespace, local):
+                if is_entry:
+                    self.buy()
+                else:
+                    self.sell()
+
+    return type(name, (StrategyBase,), {
+        '__doc__': description,
+        '__module__': __name__,
+        '__init__': __init__,
+        'initialize': initialize,
+        'next': next
+    })
+
 class StrategyBuilder:
     """Main strategy builder class."""
 
     def __init__(self):
         self.components: Dict[str, BuilderComponent] = {}
+
+        # Components indexed by kind, and rule names by (type, condition)
+        self._by_type: DefaultDict[str, Dict[str, BuilderComponent]] = defaultdict(dict)
+        self._rule_index: Dict[Tuple[str, str], str] = {}
         self._template_code = """
 from typing import Dict, Any, Optional
+import numpy as np
 from algame.strategy import StrategyBase
-from algame.indicators import *
-
+from algame.strategy._jit import njit
+from algame.strategy.indicators import *
+{kernel_code}
 class {strategy_name}(StrategyBase):
     \"""
     {strategy_desc}
@@ -28,84 +129,228 @@ class {strategy_name}(StrategyBase):
 
     def __init__(self, parameters: Optional[Dict[str, Any]] = None):
         super().__init__(parameters)
-        {init_code}
+{init_code}
 
     def initialize(self) -> None:
-        {initialize_code}
+{initialize_code}
 
     def next(self) -> None:
-        {next_code}
+{next_code}
 """
 
     def add_component(self, component: BuilderComponent) -> None:
         """Add component to strategy."""
         if not component.validate():
             raise ValueError(f"Invalid component: {component.name}")
-        self.components[component.name] = component
+        self._index(component)
 
     def remove_component(self, name: str) -> None:
         """Remove component."""
-        if name in self.components:
-            del self.components[name]
+        component = self.components.pop(name, None)
+        if component is None:
+            return
 
-    def generate_strategy(self, name: str, description: str = "") -> Type[StrategyBase]:
-        """Generate strategy class."""
-        # Collect components by type
-        parameters = [c for c in self.components.values() if isinstance(c, ParameterComponent)]
-        indicators = [c for c in self.components.values() if isinstance(c, IndicatorComponent)]
-        rules = [c for c in self.components.values() if isinstance(c, RuleComponent)]
+        kind = component_kind(component)
+        self._by_type[kind].pop(name, None)
+        if kind == 'rule':
+            self._rule_index.pop(self._rule_key(component), None)
+
+    def _index(self, component: BuilderComponent) -> None:
+        """Store component and index it by kind."""
+        # Replacing a component drops its old index entries
+        self.remove_component(component.name)
+
+        kind = component_kind(component)
+        self.components[component.name] = component
+        self._by_type[kind][component.name] = component
+        if kind == 'rule':
+            self._rule_index[self._rule_key(component)] = component.name
+
+    @staticmethod
+    def _rule_key(rule: BuilderComponent) -> Tuple[str, str]:
+        """Get rule lookup key."""
+        return (rule.parameters.get('type', ''), rule.parameters.get('condition', ''))
+
+    def components_of(self, kind: str) -> Dict[str, BuilderComponent]:
+        """
+        Get components of one kind.
 
-        # Generate initialization code
-        init_code = "\n        ".join(p.generate_code() for p in parameters)
+        Args:
+            kind: Component kind ('parameter', 'indicator' or 'rule')
 
-        # Generate indicators code
-        initialize_code = "\n        ".join(i.generate_code() for i in indicators)
+        Returns:
+            Components by name (don't modify)
+        """
+        return self._by_type[kind]
 
-        # Generate trading rules code
-        next_code = "\n        ".join(r.generate_code() for r in rules)
+    def find_rule(self, rule_type: str, condition: str) -> Optional[str]:
+        """
+        Find rule by type and condition.
+
+        Args:
+            rule_type: Rule type ('entry' or 'exit')
+            condition: Rule condition
+
+        Returns:
+            Rule component name, or None if not found
+        """
+        return self._rule_index.get((rule_type, condition))
+
+    def _spec(self) -> Tuple[Tuple[str, str, str], ...]:
+        """Get (name, type, parameters JSON) per component."""
+        return tuple(
+            (name, type(component).__name__,
+             json.dumps(component.parameters, sort_keys=True, default=str))
+            for name, component in self.components.items()
+        )
+
+    def fingerprint(self) -> int:
+        """
+        Get hash of current components and their parameters.
+
+        Equal fingerprints generate the same code, so callers can reuse
+        code or classes generated for an earlier fingerprint.
+        """
+        return hash(self._spec())
+
+    def generate_code(self, name: str, description: str = "") -> str:
+        """
+        Generate strategy source code.
+
+        Component code is inlined into straight-line method bodies.
+        Indicators with a kernel form are emitted as module-level njit
+        functions, called once on the full history in ``initialize``.
+
+        Args:
+            name: Strategy class name
+            description: Strategy docstring
+
+        Returns:
+            Python source defining the strategy class
+        """
+        # Collect components by kind
+        parameters = self._by_type['parameter'].values()
+        indicators = self._by_type['indicator'].values()
+        rules = self._by_type['rule'].values()
 
         # Fill template
-        code = self._template_code.format(
+        return self._template_code.format(
+            kernel_code="".join(
+                filter(None, (i.generate_kernel() for i in indicators))),
             strategy_name=name,
             strategy_desc=description,
-            init_code=init_code,
-            initialize_code=initialize_code,
-            next_code=next_code
+            init_code=self._method_body(p.generate_code() for p in parameters),
+            initialize_code=self._method_body(i.generate_code() for i in indicators),
+            next_code=self._method_body(r.generate_code() for r in rules)
         )
 
-        # Create class
-        namespace = {}
-        exec(code, globals(), namespace)
-        strategy_class = namespace[name]
+    @staticmethod
+    def _method_body(blocks) -> str:
+        """Indent component code blocks as method body."""
+        body = "\n".join(blocks) or "pass"
+        return textwrap.indent(body, " " * 8)
+
+    def compile(self, name: str, description: str = "") -> Type[StrategyBase]:
+        """
+        Compile components into strategy class.
+
+        The class is assembled from closures over precompiled component
+        code rather than by exec'ing generated source, and indicator
+        kernels are the cached module-level functions in ``kernels``.
+        Classes are cached by component specs, so rebuilding an
+        unchanged strategy (e.g. across optimization runs) reuses the
+        compiled class. The cache keeps the ``COMPILED_CACHE_SIZE`` most
+        recently used classes, so sweeps over indicator settings don't
+        grow it without bound.
+
+        Args:
+            name: Strategy class name
+            description: Strategy docstring
+
+        Returns:
+            Generated strategy class
+        """
+        key = (name, description, self._spec())
+        strategy_class = _COMPILED_STRATEGIES.get(key)
+        if strategy_class is not None:
+            _COMPILED_STRATEGIES.move_to_end(key)
+            return strategy_class
 
+        namespace: Dict[str, Any] = {'__builtins__': builtins, 'np': np}
+
+        defaults = [(p.name, p.default_value())
+                    for p in self._by_type['parameter'].values()]
+
+        setup = []
+        for indicator in self._by_type['indicator'].values():
+            if indicator.kernel is not None:
+                namespace[indicator.kernel_name] = indicator.kernel
+            setup.append(compile(indicator.generate_code(),
+                                 f"<indicator {indicator.name}>", "exec"))
+
+        rules = []
+        for rule in self._by_type['rule'].values():
+            if rule.condition_code is None:
+                raise ValueError(f"Invalid rule condition: {rule.name}")
+            rules.append((rule.condition_code, rule.is_entry))
+
+        strategy_class = _make_strategy_class(name, description, defaults, setup,
+                                              rules, namespace)
+        _COMPILED_STRATEGIES[key] = strategy_class
+        if len(_COMPILED_STRATEGIES) > COMPILED_CACHE_SIZE:
+            _COMPILED_STRATEGIES.popitem(last=False)
         return strategy_class
 
+    def generate_strategy(self, name: str, description: str = "") -> Type[StrategyBase]:
+        """Generate strategy class."""
+        return self.compile(name, description)
+
     def save(self, file_path: str) -> None:
         """Save strategy configuration."""
-        import json
         config = {
             'components': {
                 name: component.to_dict()
                 for name, component in self.components.items()
             }
         }
-        with open(file_path, 'w') as f:
-            json.dump(config, f, indent=4)
+
+        try:
+            # orjson serializes in C, straight to bytes
+            import orjson
+
+            with open(file_path, 'wb') as f:
+                f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+
+        except ImportError:
+            with open(file_path, 'w') as f:
+                json.dump(config, f, indent=4)
 
     def load(self, file_path: str) -> None:
         """Load strategy configuration."""
-        import json
-        with open(file_path, 'r') as f:
-            config = json.load(f)
+        with open(file_path, 'rb') as f:
+            content = f.read()
 
-        # Clear current components
-        self.components.clear()
+        try:
+            import orjson
+            config = orjson.loads(content)
+        except ImportError:
+            config = json.loads(content)
 
-        # Load components
+        # Build components first so unknown types leave builder unchanged
+        components = []
         for name, data in config['components'].items():
-            component_type = globals()[data['type']]
-            component = component_type.from_dict(data)
-            self.components[name] = component
+            type_name = data.get('type')
+            component_type = COMPONENT_TYPES.get(type_name)
+            if component_type is None:
+                raise ValueError(f"Unknown component type for {name}: {type_name!r}")
+            components.append(component_type.from_dict(data))
+
+        # Replace current components
+        self.components.clear()
+        self._by_type.clear()
+        self._rule_index.clear()
+        for component in components:
+            self._index(component)
 
     def validate(self) -> bool:
         """Validate complete strategy configuration."""
@@ -115,8 +360,8 @@ class {strategy_name}(StrategyBase):
                 return False
 
         # Validate component relationships
-        indicators = [c for c in self.components.values() if isinstance(c, IndicatorComponent)]
-        rules = [c for c in self.components.values() if isinstance(c, RuleComponent)]
+        indicators = self._by_type['indicator'].values()
+        rules = self._by_type['rule'].values()
 
         # Ensure rules only reference existing indicators
         for rule in rules:
@@ -15,137 +15,112 @@ Features:
 """
 
 from typing import Dict, List, Optional, Union, Any
-import numpy as np
-import pandas as pd
+import importlib
 
 # Import base indicator
 from .base import (
     Indicator,
     IndicatorMetadata,
+    IndicatorEntry,
     register_indicator
 )
 
-# Import built-in indicators
-from .trend import (
-    SMA,
-    EMA,
-    TEMA,
-    DEMA,
-    WMA
-)
-
-from .momentum import (
-    RSI,
-    MACD,
-    Stochastic,
-    ROC,
-    MFI
-)
-
-from .volatility import (
-    ATR,
-    Bollinger,
-    Keltner,
-    StandardDev,
-    ParabolicSAR
-)
-
-from .volume import (
-    OBV,
-    ADL,
-    CMF,
-    VWAP,
-    VolumeProfile
-)
-
-from .pattern import (
-    CandlePattern,
-    PricePattern,
-    ChartPattern
-)
+# Built-in indicators: name -> (module, category)
+#
+# Indicator modules are imported on first use (attribute access or
+# registry lookup), so importing this package stays cheap.
+_BUILT_IN_INDICATORS: Dict[str, tuple] = {
+    # Trend
+    'SMA': ('trend', 'Trend'),
+    'EMA': ('trend', 'Trend'),
+    'TEMA': ('trend', 'Trend'),
+    'DEMA': ('trend', 'Trend'),
+    'WMA': ('trend', 'Trend'),
+
+    # Momentum
+    'RSI': ('momentum', 'Momentum'),
+    'MACD': ('momentum', 'Momentum'),
+    'Stochastic': ('momentum', 'Momentum'),
+    'ROC': ('momentum', 'Momentum'),
+    'MFI': ('momentum', 'Momentum'),
+
+    # Volatility
+    'ATR': ('volatility', 'Volatility'),
+    'Bollinger': ('volatility', 'Volatility'),
+    'Keltner': ('volatility', 'Volatility'),
+    'StandardDev': ('volatility', 'Volatility'),
+    'ParabolicSAR': ('volatility', 'Volatility')
+}
 
 # Indicator registry
-_indicator_registry: Dict[str, type] = {}
+_indicator_registry: Dict[str, IndicatorEntry] = {}
+
+def __getattr__(name: str) -> type:
+    """Import built-in indicator class on first access."""
+    if name not in _BUILT_IN_INDICATORS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(f".{_BUILT_IN_INDICATORS[name][0]}", __name__)
+    indicator_class = getattr(module, name)
+
+    # Cache so later access skips __getattr__
+    globals()[name] = indicator_class
+    return indicator_class
+
+def _register_built_in(name: str) -> None:
+    """Register built-in indicator, importing its module."""
+    indicator_class = globals().get(name) or __getattr__(name)
+    metadata = IndicatorMetadata(
+        name=name,
+        category=_BUILT_IN_INDICATORS[name][1],
+        version='1.0.0',
+        description=indicator_class.__doc__
+    )
+    register_indicator(name, indicator_class, metadata)
 
 def register_built_in_indicators() -> None:
-    """Register built-in indicators."""
-    indicators = [
-        # Trend
-        ('SMA', SMA, 'Trend'),
-        ('EMA', EMA, 'Trend'),
-        ('TEMA', TEMA, 'Trend'),
-        ('DEMA', DEMA, 'Trend'),
-        ('WMA', WMA, 'Trend'),
-
-        # Momentum
-        ('RSI', RSI, 'Momentum'),
-        ('MACD', MACD, 'Momentum'),
-        ('Stochastic', Stochastic, 'Momentum'),
-        ('ROC', ROC, 'Momentum'),
-        ('MFI', MFI, 'Momentum'),
-
-        # Volatility
-        ('ATR', ATR, 'Volatility'),
-        ('Bollinger', Bollinger, 'Volatility'),
-        ('Keltner', Keltner, 'Volatility'),
-        ('StandardDev', StandardDev, 'Volatility'),
-        ('ParabolicSAR', ParabolicSAR, 'Volatility'),
-
-        # Volume
-        ('OBV', OBV, 'Volume'),
-        ('ADL', ADL, 'Volume'),
-        ('CMF', CMF, 'Volume'),
-        ('VWAP', VWAP, 'Volume'),
-        ('VolumeProfile', VolumeProfile, 'Volume'),
-
-        # Pattern
-        ('CandlePattern', CandlePattern, 'Pattern'),
-        ('PricePattern', PricePattern, 'Pattern'),
-        ('ChartPattern', ChartPattern, 'Pattern')
-    ]
-
-    for name, indicator_class, category in indicators:
-        metadata = IndicatorMetadata(
-            name=name,
-            category=category,
-            version='1.0.0',
-            description=indicator_class.__doc__
-        )
-        register_indicator(name, indicator_class, metadata)
+    """Register built-in indicators not yet in registry."""
+    for name in _BUILT_IN_INDICATORS:
+        if name not in _indicator_registry:
+            _register_built_in(name)
+
+def _lookup(name: str) -> IndicatorEntry:
+    """Get registry entry, registering built-in indicator on demand."""
+    if name not in _indicator_registry and name in _BUILT_IN_INDICATORS:
+        _register_built_in(name)
+    try:
+        return _indicator_registry[name]
+    except KeyError:
+        raise ValueError(f"Indicator not found: {name}") from None
 
 def get_indicator(name: str) -> type:
     """Get indicator class by name."""
-    if name not in _indicator_registry:
-        raise ValueError(f"Indicator not found: {name}")
-    return _indicator_registry[name]['class']
+    return _lookup(name).indicator_class
 
 def get_indicator_metadata(name: str) -> IndicatorMetadata:
     """Get indicator metadata."""
-    if name not in _indicator_registry:
-        raise ValueError(f"Indicator not found: {name}")
-    return _indicator_registry[name]['metadata']
+    return _lookup(name).metadata
 
 def list_indicators() -> List[Dict[str, Any]]:
     """Get list of registered indicators."""
+    register_built_in_indicators()
     return [
         {
             'name': name,
-            'category': meta['metadata'].category,
-            'description': meta['metadata'].description
+            'category': entry.metadata.category,
+            'description': entry.metadata.description
         }
-        for name, meta in _indicator_registry.items()
+        for name, entry in _indicator_registry.items()
     ]
 
 def list_indicator_categories() -> List[str]:
     """Get list of indicator categories."""
+    register_built_in_indicators()
     categories = set()
-    for meta in _indicator_registry.values():
-        categories.add(meta['metadata'].category)
+    for entry in _indicator_registry.values():
+        categories.add(entry.metadata.category)
     return sorted(categories)
 
-# Register built-in indicators
-register_built_in_indicators()
-
 # Export public interface
 __all__ = [
     # Base classes
@@ -157,8 +132,6 @@ __all__ = [
     'SMA', 'EMA', 'TEMA', 'DEMA', 'WMA',  # Trend
     'RSI', 'MACD', 'Stochastic', 'ROC', 'MFI',  # Momentum
     'ATR', 'Bollinger', 'Keltner', 'StandardDev', 'ParabolicSAR',  # Volatility
-    'OBV', 'ADL', 'CMF', 'VWAP', 'VolumeProfile',  # Volume
-    'CandlePattern', 'PricePattern', 'ChartPattern',  # Pattern
 
     # Registry functions
     'get_indicator',
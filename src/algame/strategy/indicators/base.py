@@ -1,15 +1,102 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Optional, Union, Any
-from dataclasses import dataclass
+from typing import Dict, NamedTuple, Optional, Union, Any
 import pandas as pd
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 import logging
 
+from .._jit import njit, NUMBA_AVAILABLE
+
+# Optional C moving-window functions
+try:
+    import bottleneck as bn
+except ImportError:
+    bn = None
+
 logger = logging.getLogger(__name__)
 
-@dataclass
-class IndicatorMetadata:
-    """Metadata for technical indicators."""
+# Widest window reduced over a strided view; each window costs O(W),
+# so wider windows use pandas' running-window algorithms instead
+STRIDED_MAX_WINDOW = 32
+
+# Windows reduced per strided block, bounding temporary arrays
+_STRIDED_BLOCK = 1 << 14
+
+def _rolling(values: np.ndarray, window: int, reduce: str, **kwargs) -> np.ndarray:
+    """
+    Apply reduction ('min', 'max', 'mean', 'sum' or 'std') over trailing
+    windows. Extra keyword arguments (e.g. ``ddof``) go to the reduction.
+
+    Uses bottleneck's moving-window functions when installed. Otherwise
+    windows up to ``STRIDED_MAX_WINDOW`` reduce a strided view of
+    ``values`` blockwise into the output, with no per-window copies;
+    wider windows use pandas ``rolling``.
+
+    Returns:
+        Array matching ``values`` (NaN until first full window or for
+        windows containing NaN)
+    """
+    if len(values) < window:
+        return np.full(len(values), np.nan)
+
+    if bn is not None:
+        return getattr(bn, 'move_' + reduce)(values, window, min_count=window, **kwargs)
+
+    if window > STRIDED_MAX_WINDOW:
+        rolled = getattr(pd.Series(values).rolling(window), reduce)(**kwargs)
+        return rolled.to_numpy(dtype=np.float64, copy=True)
+
+    out = np.full(len(values), np.nan)
+    windows = sliding_window_view(values, window)
+    func = getattr(np, reduce)
+    for start in range(0, len(windows), _STRIDED_BLOCK):
+        stop = start + _STRIDED_BLOCK
+        func(windows[start:stop], axis=1,
+             out=out[window - 1 + start:window - 1 + stop], **kwargs)
+    return out
+
+@njit(cache=True)
+def _ewm_kernel(values: np.ndarray, alpha: float) -> np.ndarray:
+    """Compiled ``ewm(adjust=False).mean()`` over a float64 array."""
+    n = values.shape[0]
+    out = np.empty(n)
+    mean = np.nan
+    old_wt = 1.0
+    for i in range(n):
+        value = values[i]
+        if mean != mean:
+            # Not started
+            mean = value
+        else:
+            old_wt *= 1.0 - alpha
+            if value == value:
+                if value != mean:
+                    mean = (old_wt * mean + alpha * value) / (old_wt + alpha)
+                old_wt = 1.0
+        out[i] = mean
+    return out
+
+def _ewm(values: np.ndarray, alpha: float) -> np.ndarray:
+    """
+    Exponentially weighted mean, matching pandas ``ewm(adjust=False)``.
+
+    Starts at the first valid value; NaN values are carried over, with
+    the gap decaying the old mean's weight as pandas does. Uses the
+    compiled kernel when numba is installed, otherwise pandas.
+
+    Args:
+        values: Input series
+        alpha: Smoothing factor (2 / (span + 1) for a span)
+
+    Returns:
+        Weighted means (NaN before first valid value)
+    """
+    if NUMBA_AVAILABLE:
+        return _ewm_kernel(values, alpha)
+    return pd.Series(values).ewm(alpha=alpha, adjust=False).mean().to_numpy(copy=True)
+
+class IndicatorMetadata(NamedTuple):
+    """Metadata for technical indicators (immutable)."""
     name: str
     category: str
     version: str
@@ -17,6 +104,11 @@ class IndicatorMetadata:
     inputs: Optional[Dict[str, str]] = None
     parameters: Optional[Dict[str, Dict[str, Any]]] = None
 
+class IndicatorEntry(NamedTuple):
+    """Indicator registry entry."""
+    indicator_class: type
+    metadata: IndicatorMetadata
+
 class Indicator(ABC):
     """
     Base class for technical indicators.
@@ -64,6 +156,30 @@ class Indicator(ABC):
         """
         pass
 
+    def update(self, *args) -> Union[float, tuple]:
+        """
+        Update indicator with newest bar.
+
+        Streaming counterpart to ``calculate``: each call does O(1)
+        work and returns the value ``calculate`` would give for the
+        latest bar of the data seen so far.
+
+        Args:
+            *args: Newest bar values (indicator specific)
+
+        Returns:
+            Indicator value(s) for newest bar
+
+        Raises:
+            NotImplementedError: If indicator has no streaming form
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support streaming updates")
+
+    def reset(self) -> None:
+        """Reset streaming state."""
+        pass
+
     def validate_data(self,
                      data: Union[pd.Series, pd.DataFrame, np.ndarray],
                      required_columns: Optional[list] = None) -> None:
@@ -160,8 +276,33 @@ class Indicator(ABC):
             elif method == 'drop':
                 return data[~np.isnan(data)]
             elif method == 'interpolate':
-                return pd.Series(data).interpolate().values
+                return self._interpolate(data)
+
+        return data
+
+    @staticmethod
+    def _interpolate(data: np.ndarray) -> np.ndarray:
+        """
+        Linearly interpolate NaNs in 1D array.
 
+        Matches pandas ``interpolate()``: leading NaNs stay NaN and
+        trailing NaNs take the last valid value.
+        """
+        data = np.asarray(data, dtype=np.float64)
+        mask = np.isnan(data)
+        if not mask.any():
+            return data
+
+        valid = np.flatnonzero(~mask)
+        if valid.size == 0:
+            return data
+
+        # Only fill after first valid value
+        mask[:valid[0]] = False
+        missing = np.flatnonzero(mask)
+
+        data = data.copy()
+        data[missing] = np.interp(missing, valid, data[valid])
         return data
 
     @classmethod
@@ -209,10 +350,7 @@ def register_indicator(name: str,
         metadata = indicator_class.get_metadata()
 
     # Add to registry
-    _indicator_registry[name] = {
-        'class': indicator_class,
-        'metadata': metadata
-    }
+    _indicator_registry[name] = IndicatorEntry(indicator_class, metadata)
 
     logger.debug(f"Registered indicator: {name}")
 
@@ -234,7 +372,7 @@ def get_indicator(name: str) -> type:
     if name not in _indicator_registry:
         raise ValueError(f"Indicator not found: {name}")
 
-    return _indicator_registry[name]['class']
+    return _indicator_registry[name].indicator_class
 
 def list_indicators() -> Dict[str, IndicatorMetadata]:
     """
@@ -246,6 +384,6 @@ def list_indicators() -> Dict[str, IndicatorMetadata]:
     from . import _indicator_registry
 
     return {
-        name: meta['metadata']
-        for name, meta in _indicator_registry.items()
+        name: entry.metadata
+        for name, entry in _indicator_registry.items()
     }
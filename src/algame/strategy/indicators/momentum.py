@@ -1,42 +1,407 @@
 from typing import Optional, Union, Tuple
+from collections import deque
+import math
 import numpy as np
 import pandas as pd
 
-from .base import Indicator
+from .base import Indicator, _rolling, _ewm
+from .._jit import njit, prange, NUMBA_AVAILABLE
+
+@njit(cache=True)
+def _rsi_wilder(prices: np.ndarray, period: int, out: np.ndarray) -> np.ndarray:
+    """
+    Compute RSI with Wilder smoothing in one pass.
+
+    Average gain/loss are seeded with the mean of the first ``period``
+    changes, then updated as ``avg = (avg * (period - 1) + x) / period``.
+
+    Args:
+        prices: Price series
+        period: Smoothing period
+        out: Output array, same length as prices
+
+    Returns:
+        ``out`` with RSI values (NaN for the first ``period`` bars)
+    """
+    n = prices.shape[0]
+    out[:period] = np.nan
+    if n <= period:
+        return out
+
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, n):
+        change = prices[i] - prices[i - 1]
+        gain = change if change > 0 else 0.0
+        loss = -change if change < 0 else 0.0
+
+        if i <= period:
+            # Seed with simple average of first changes
+            avg_gain += gain / period
+            avg_loss += loss / period
+            if i < period:
+                continue
+        else:
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+
+        if avg_loss == 0.0:
+            out[i] = 100.0
+        else:
+            out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+    return out
+
+def _rsi_numpy(prices: np.ndarray, period: int, out: np.ndarray) -> np.ndarray:
+    """NumPy version of ``_rsi_wilder``, used without numba."""
+    n = prices.shape[0]
+    out[:period] = np.nan
+    if n <= period:
+        return out
+
+    change = np.diff(prices)
+    gain = np.where(change > 0, change, 0.0)
+    loss = np.where(change < 0, -change, 0.0)
+
+    # Wilder smoothing is an EMA (alpha 1 / period) seeded with the
+    # mean of the first changes
+    alpha = 1.0 / period
+    avg_gain = _ewm(np.concatenate(([gain[:period].mean()], gain[period:])), alpha)
+    avg_loss = _ewm(np.concatenate(([loss[:period].mean()], loss[period:])), alpha)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rsi = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    out[period:] = np.where(avg_loss == 0.0, 100.0, rsi)
+
+    return out
+
+@njit(cache=True)
+def _macd(prices: np.ndarray,
+          fast_alpha: float,
+          slow_alpha: float,
+          signal_alpha: float,
+          macd: np.ndarray,
+          signal: np.ndarray,
+          hist: np.ndarray) -> None:
+    """
+    Compute MACD line, signal and histogram in one pass.
+
+    EMAs start at the first valid price (signal at 0) and carry forward
+    over NaN prices.
+
+    Args:
+        prices: Price series
+        fast_alpha: Fast EMA smoothing factor
+        slow_alpha: Slow EMA smoothing factor
+        signal_alpha: Signal EMA smoothing factor
+        macd, signal, hist: Output arrays, same length as prices, filled
+            with values (NaN before first valid price)
+    """
+    n = prices.shape[0]
+
+    started = False
+    fast = 0.0
+    slow = 0.0
+    sig = 0.0
+    for i in range(n):
+        price = prices[i]
+        if price != price:
+            if not started:
+                macd[i] = signal[i] = hist[i] = np.nan
+                continue
+        elif not started:
+            fast = price
+            slow = price
+            started = True
+        else:
+            fast += fast_alpha * (price - fast)
+            slow += slow_alpha * (price - slow)
+            sig += signal_alpha * ((fast - slow) - sig)
+
+        macd[i] = fast - slow
+        signal[i] = sig
+        hist[i] = fast - slow - sig
+
+def _macd_numpy(prices: np.ndarray,
+                fast_alpha: float,
+                slow_alpha: float,
+                signal_alpha: float,
+                macd: np.ndarray,
+                signal: np.ndarray,
+                hist: np.ndarray) -> None:
+    """NumPy version of ``_macd``, used without numba."""
+    valid = ~np.isnan(prices)
+    values = prices[valid]
+    line = _ewm(values, fast_alpha) - _ewm(values, slow_alpha)
+    sig = _ewm(line, signal_alpha)
+
+    # Each bar takes the last valid price's values (none before the first)
+    last = np.cumsum(valid) - 1
+    started = last >= 0
+    for src, dst in ((line, macd), (sig, signal), (line - sig, hist)):
+        dst[~started] = np.nan
+        dst[started] = src[last[started]]
+
+@njit(cache=True)
+def _mfi(high: np.ndarray,
+         low: np.ndarray,
+         close: np.ndarray,
+         volume: np.ndarray,
+         period: int,
+         out: np.ndarray) -> np.ndarray:
+    """
+    Compute MFI in one pass with ring-buffered money flow sums.
+
+    Args:
+        high: High prices
+        low: Low prices
+        close: Close prices
+        volume: Volumes
+        period: Lookback period
+        out: Output array, same length as prices
+
+    Returns:
+        ``out`` with MFI values (NaN until first full window or for
+        windows with NaN money flow)
+    """
+    n = close.shape[0]
+
+    # Positive/negative money flow in window, oldest at i % period
+    pos = np.zeros(period)
+    neg = np.zeros(period)
+    pos_sum = 0.0
+    neg_sum = 0.0
+    nans = 0
+
+    prev_tp = np.nan
+    for i in range(n):
+        tp = (high[i] + low[i] + close[i]) / 3.0
+        mf = tp * volume[i]
+        pmf = mf if tp > prev_tp else 0.0
+        nmf = mf if tp < prev_tp else 0.0
+        prev_tp = tp
+
+        # Replace oldest flow in window
+        j = i % period
+        if pos[j] != pos[j] or neg[j] != neg[j]:
+            nans -= 1
+        else:
+            pos_sum -= pos[j]
+            neg_sum -= neg[j]
+        pos[j] = pmf
+        neg[j] = nmf
+        if pmf != pmf or nmf != nmf:
+            nans += 1
+        else:
+            pos_sum += pmf
+            neg_sum += nmf
+
+        if i < period - 1 or nans:
+            out[i] = np.nan
+        elif neg_sum != 0.0:
+            out[i] = 100.0 - 100.0 / (1.0 + pos_sum / neg_sum)
+        elif pos_sum != 0.0:
+            out[i] = 100.0
+        else:
+            out[i] = np.nan
+
+    return out
+
+def _mfi_numpy(high: np.ndarray,
+               low: np.ndarray,
+               close: np.ndarray,
+               volume: np.ndarray,
+               period: int,
+               out: np.ndarray) -> np.ndarray:
+    """NumPy version of ``_mfi``, used without numba."""
+    tp = (high + low + close) / 3.0
+    mf = tp * volume
+    prev_tp = np.empty_like(tp)
+    prev_tp[:1] = np.nan
+    prev_tp[1:] = tp[:-1]
+
+    pos_sum = _rolling(np.where(tp > prev_tp, mf, 0.0), period, 'sum')
+    neg_sum = _rolling(np.where(tp < prev_tp, mf, 0.0), period, 'sum')
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mfi = 100.0 - 100.0 / (1.0 + pos_sum / neg_sum)
+    out[:] = np.where(neg_sum != 0.0, mfi, np.where(pos_sum != 0.0, 100.0, np.nan))
+
+    return out
+
+@njit(parallel=True, cache=True)
+def _rsi_batch(prices: np.ndarray, period: int, out: np.ndarray) -> np.ndarray:
+    """Compute RSI per column (symbol) of 2D prices into out in parallel."""
+    for j in prange(prices.shape[1]):
+        _rsi_wilder(prices[:, j], period, out[:, j])
+    return out
+
+@njit(parallel=True, cache=True)
+def _macd_batch(prices: np.ndarray,
+                fast_alpha: float,
+                slow_alpha: float,
+                signal_alpha: float,
+                macd: np.ndarray,
+                signal: np.ndarray,
+                hist: np.ndarray) -> None:
+    """Compute MACD per column (symbol) of 2D prices into outputs in parallel."""
+    for j in prange(prices.shape[1]):
+        _macd(prices[:, j], fast_alpha, slow_alpha, signal_alpha,
+              macd[:, j], signal[:, j], hist[:, j])
+
+def _as_columns(data: np.ndarray) -> np.ndarray:
+    """Get 2D prices (bars x symbols) as float64 with contiguous columns."""
+    return np.asfortranarray(data, dtype=np.float64)
+
+def _output(out: Optional[np.ndarray], shape: Tuple[int, ...],
+            order: str = 'C') -> np.ndarray:
+    """
+    Get output array, allocating one if ``out`` is None.
+
+    Raises:
+        ValueError: If ``out`` is not a float64 array of ``shape``
+    """
+    if out is None:
+        return np.empty(shape, order=order)
+    if not isinstance(out, np.ndarray) or out.shape != shape or out.dtype != np.float64:
+        raise ValueError(f"out must be a float64 array of shape {shape}")
+    return out
+
+def _columns(data: pd.DataFrame, *names: str) -> Tuple[np.ndarray, ...]:
+    """Get columns as contiguous float64 arrays."""
+    return tuple(data[name].to_numpy(dtype=np.float64) for name in names)
+
+class _RollingSum:
+    """Fixed-window running sum for streaming updates."""
+
+    __slots__ = ('window', 'values', 'total', 'nans')
+
+    def __init__(self, window: int):
+        self.window = window
+        self.values = deque()
+        self.total = 0.0
+        self.nans = 0  # NaNs in window
+
+    def push(self, value: float) -> float:
+        """Add value, returning window sum (NaN until full or with NaNs)."""
+        if len(self.values) == self.window:
+            old = self.values.popleft()
+            if math.isnan(old):
+                self.nans -= 1
+            else:
+                self.total -= old
+
+        self.values.append(value)
+        if math.isnan(value):
+            self.nans += 1
+        else:
+            self.total += value
+
+        if len(self.values) < self.window or self.nans:
+            return np.nan
+        return self.total
+
+class _RollingExtreme:
+    """Windowed max (or min) via monotonic deque, amortized O(1)."""
+
+    __slots__ = ('window', 'sign', 'items', 'count')
+
+    def __init__(self, window: int, maximum: bool = True):
+        self.window = window
+        self.sign = 1.0 if maximum else -1.0
+        self.items = deque()  # (index, value), extremes first
+        self.count = 0
+
+    def push(self, value: float) -> float:
+        """Add value, returning window extreme (NaN until full)."""
+        index = self.count
+        self.count += 1
+
+        # Drop values that can no longer be the extreme
+        key = value * self.sign
+        while self.items and self.items[-1][1] * self.sign <= key:
+            self.items.pop()
+        self.items.append((index, value))
+
+        # Drop values outside window
+        if self.items[0][0] <= index - self.window:
+            self.items.popleft()
+
+        return self.items[0][1] if self.count >= self.window else np.nan
 
 class RSI(Indicator):
     """
     Relative Strength Index (RSI).
 
     Formula: RSI = 100 - (100 / (1 + RS))
-    where RS = avg_gain / avg_loss
+    where RS = avg_gain / avg_loss, Wilder-smoothed over period
     """
 
     def __init__(self, period: int = 14):
         self.period = period
 
-    def calculate(self, data: Union[pd.Series, np.ndarray]) -> np.ndarray:
-        """Calculate RSI values."""
-        if isinstance(data, pd.Series):
-            data = data.values
-
-        # Calculate price changes
-        changes = np.diff(data)
-
-        # Calculate gains and losses
-        gains = np.where(changes > 0, changes, 0)
-        losses = np.where(changes < 0, -changes, 0)
-
-        # Calculate average gains and losses
-        avg_gains = pd.Series(gains).rolling(window=self.period).mean()
-        avg_losses = pd.Series(losses).rolling(window=self.period).mean()
-
-        # Calculate RS and RSI
-        rs = avg_gains / avg_losses
-        rsi = 100 - (100 / (1 + rs))
-
-        # Add nan for first value
-        return np.append(np.nan, rsi.values)
+        # Wilder smoothing weights for old average and new change
+        self._keep = (period - 1) / period
+        self._new = 1.0 / period
+
+        self.reset()
+
+    def calculate(self,
+                 data: Union[pd.Series, pd.DataFrame, np.ndarray],
+                 out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Calculate RSI values.
+
+        2D input (bars x symbols, e.g. a DataFrame of closes) is
+        calculated per symbol in parallel. Pass ``out`` (float64, same
+        shape as data) to reuse an output buffer across calls.
+        """
+        if np.ndim(data) == 2:
+            data = _as_columns(data)
+            out = _output(out, data.shape, 'F')
+            if NUMBA_AVAILABLE:
+                return _rsi_batch(data, self.period, out)
+            for j in range(data.shape[1]):
+                _rsi_numpy(data[:, j], self.period, out[:, j])
+            return out
+
+        data = np.ascontiguousarray(data, dtype=np.float64)
+        rsi = _rsi_wilder if NUMBA_AVAILABLE else _rsi_numpy
+        return rsi(data, self.period, _output(out, data.shape))
+
+    def reset(self) -> None:
+        """Reset streaming state."""
+        self._prev_price: Optional[float] = None
+        self._changes = 0
+        self._avg_gain = 0.0
+        self._avg_loss = 0.0
+
+    def update(self, price: float) -> float:
+        """Update RSI with newest price."""
+        prev, self._prev_price = self._prev_price, price
+        if prev is None:
+            return np.nan
+
+        change = price - prev
+        gain = change if change > 0 else 0.0
+        loss = -change if change < 0 else 0.0
+        new = self._new
+
+        self._changes += 1
+        if self._changes <= self.period:
+            # Seed with simple average of first changes
+            self._avg_gain += gain * new
+            self._avg_loss += loss * new
+            if self._changes < self.period:
+                return np.nan
+        else:
+            keep = self._keep
+            self._avg_gain = self._avg_gain * keep + gain * new
+            self._avg_loss = self._avg_loss * keep + loss * new
+
+        if self._avg_loss == 0.0:
+            return 100.0
+        return 100.0 - 100.0 / (1.0 + self._avg_gain / self._avg_loss)
 
 class MACD(Indicator):
     """
@@ -58,25 +423,69 @@ class MACD(Indicator):
         self.slow_period = slow_period
         self.signal_period = signal_period
 
-    def calculate(self, data: Union[pd.Series, np.ndarray]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
-        """Calculate MACD values."""
-        if isinstance(data, pd.Series):
-            data = data.values
-
-        # Calculate fast and slow EMAs
-        fast_ema = pd.Series(data).ewm(span=self.fast_period, adjust=False).mean()
-        slow_ema = pd.Series(data).ewm(span=self.slow_period, adjust=False).mean()
-
-        # Calculate MACD line
-        macd_line = fast_ema - slow_ema
-
-        # Calculate signal line
-        signal_line = macd_line.ewm(span=self.signal_period, adjust=False).mean()
-
-        # Calculate histogram
-        histogram = macd_line - signal_line
-
-        return macd_line.values, signal_line.values, histogram.values
+        # EMA smoothing factors
+        self._fast_alpha = 2.0 / (fast_period + 1)
+        self._slow_alpha = 2.0 / (slow_period + 1)
+        self._signal_alpha = 2.0 / (signal_period + 1)
+
+        self.reset()
+
+    def calculate(self,
+                 data: Union[pd.Series, pd.DataFrame, np.ndarray],
+                 out: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+                 ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Calculate MACD values.
+
+        2D input (bars x symbols, e.g. a DataFrame of closes) is
+        calculated per symbol in parallel. Pass ``out`` (three float64
+        arrays, same shape as data) to reuse output buffers across calls.
+        """
+        batch = np.ndim(data) == 2
+        if batch:
+            data = _as_columns(data)
+            order = 'F'
+        else:
+            data = np.ascontiguousarray(data, dtype=np.float64)
+            order = 'C'
+
+        outputs = tuple(
+            _output(buffer, data.shape, order)
+            for buffer in (out if out is not None else (None, None, None))
+        )
+        alphas = (self._fast_alpha, self._slow_alpha, self._signal_alpha)
+        if batch and NUMBA_AVAILABLE:
+            _macd_batch(data, *alphas, *outputs)
+        elif batch:
+            for j in range(data.shape[1]):
+                _macd_numpy(data[:, j], *alphas, *(output[:, j] for output in outputs))
+        elif NUMBA_AVAILABLE:
+            _macd(data, *alphas, *outputs)
+        else:
+            _macd_numpy(data, *alphas, *outputs)
+
+        return outputs
+
+    def reset(self) -> None:
+        """Reset streaming state."""
+        self._fast_ema: Optional[float] = None
+        self._slow_ema = 0.0
+        self._signal = 0.0
+
+    def update(self, price: float) -> Tuple[float, float, float]:
+        """Update MACD with newest price."""
+        if self._fast_ema is None:
+            # EMAs start at first value
+            self._fast_ema = self._slow_ema = price
+            self._signal = 0.0
+            return 0.0, 0.0, 0.0
+
+        self._fast_ema += self._fast_alpha * (price - self._fast_ema)
+        self._slow_ema += self._slow_alpha * (price - self._slow_ema)
+        macd = self._fast_ema - self._slow_ema
+        self._signal += self._signal_alpha * (macd - self._signal)
+
+        return macd, self._signal, macd - self._signal
 
 class Stochastic(Indicator):
     """
@@ -97,27 +506,55 @@ class Stochastic(Indicator):
         self.d_period = d_period
         self.slowing = slowing
 
+        # Reciprocal window lengths for streaming means
+        self._inv_slowing = 1.0 / slowing
+        self._inv_d_period = 1.0 / d_period
+
+        self.reset()
+
     def calculate(self, data: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
         """Calculate Stochastic values."""
-        # Get high, low, close
-        high = data['High'].values
-        low = data['Low'].values
-        close = data['Close'].values
+        high, low, close = _columns(data, 'High', 'Low', 'Close')
 
         # Calculate %K
-        low_min = pd.Series(low).rolling(window=self.k_period).min()
-        high_max = pd.Series(high).rolling(window=self.k_period).max()
+        low_min = _rolling(low, self.k_period, 'min')
+        high_max = _rolling(high, self.k_period, 'max')
 
-        k = ((close - low_min) / (high_max - low_min)) * 100
+        with np.errstate(divide='ignore', invalid='ignore'):
+            k = ((close - low_min) / (high_max - low_min)) * 100
 
         # Apply slowing period
         if self.slowing > 1:
-            k = pd.Series(k).rolling(window=self.slowing).mean()
+            k = _rolling(k, self.slowing, 'mean')
 
         # Calculate %D
-        d = pd.Series(k).rolling(window=self.d_period).mean()
+        d = _rolling(k, self.d_period, 'mean')
+
+        return k, d
+
+    def reset(self) -> None:
+        """Reset streaming state."""
+        self._high_max = _RollingExtreme(self.k_period, maximum=True)
+        self._low_min = _RollingExtreme(self.k_period, maximum=False)
+        self._k_sum = _RollingSum(self.slowing) if self.slowing > 1 else None
+        self._d_sum = _RollingSum(self.d_period)
+
+    def update(self, high: float, low: float, close: float) -> Tuple[float, float]:
+        """Update Stochastic with newest bar."""
+        high_max = self._high_max.push(high)
+        low_min = self._low_min.push(low)
+
+        if high_max != low_min:
+            k = (close - low_min) / (high_max - low_min) * 100
+        else:
+            k = np.nan
+
+        # Apply slowing period
+        if self._k_sum is not None:
+            k = self._k_sum.push(k) * self._inv_slowing
 
-        return k.values, d.values
+        d = self._d_sum.push(k) * self._inv_d_period
+        return k, d
 
 class ROC(Indicator):
     """
@@ -128,22 +565,49 @@ class ROC(Indicator):
 
     def __init__(self, period: int = 14):
         self.period = period
+        self.reset()
+
+    def calculate(self,
+                 data: Union[pd.Series, pd.DataFrame, np.ndarray],
+                 out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Calculate ROC values.
+
+        2D input (bars x symbols) is calculated per symbol in one
+        vectorized pass. Pass ``out`` (float64, same shape as data) to
+        reuse an output buffer across calls.
+        """
+        data = np.asarray(data, dtype=np.float64)
+        roc = _output(out, data.shape)
+        roc[:self.period] = np.nan
+        if len(data) <= self.period:
+            return roc
+
+        # Compare against price period bars back, leaving zero prices as nan
+        prev = data[:-self.period]
+        zero = prev == 0
+        tail = roc[self.period:]
+        np.subtract(data[self.period:], prev, out=tail)
+        np.divide(tail, prev, out=tail, where=~zero)
+        tail[zero] = np.nan
+        tail *= 100
 
-    def calculate(self, data: Union[pd.Series, np.ndarray]) -> np.ndarray:
-        """Calculate ROC values."""
-        if isinstance(data, pd.Series):
-            data = data.values
+        return roc
 
-        # Calculate ROC
-        roc = ((data - np.roll(data, self.period)) / np.roll(data, self.period)) * 100
+    def reset(self) -> None:
+        """Reset streaming state."""
+        self._prices = deque(maxlen=self.period + 1)
 
-        # Replace inf and -inf with nan
-        roc = np.where(np.isinf(roc), np.nan, roc)
+    def update(self, price: float) -> float:
+        """Update ROC with newest price."""
+        self._prices.append(price)
+        if len(self._prices) <= self.period:
+            return np.nan
 
-        # Set initial values to nan
-        roc[:self.period] = np.nan
-
-        return roc
+        old = self._prices[0]
+        if old == 0:
+            return np.nan
+        return (price - old) / old * 100
 
 class MFI(Indicator):
     """
@@ -158,21 +622,40 @@ class MFI(Indicator):
 
     def __init__(self, period: int = 14):
         self.period = period
-
-    def calculate(self, data: pd.DataFrame) -> np.ndarray:
-        """Calculate MFI values."""
-        # Calculate typical price
-        tp = (data['High'] + data['Low'] + data['Close']) / 3
-
-        # Calculate money flow
-        mf = tp * data['Volume']
-
-        # Get positive and negative money flow
-        pmf = pd.Series(np.where(tp > tp.shift(1), mf, 0)).rolling(window=self.period).sum()
-        nmf = pd.Series(np.where(tp < tp.shift(1), mf, 0)).rolling(window=self.period).sum()
-
-        # Calculate money flow ratio and MFI
-        mfr = pmf / nmf
-        mfi = 100 - (100 / (1 + mfr))
-
-        return mfi.values
+        self.reset()
+
+    def calculate(self, data: pd.DataFrame,
+                  out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Calculate MFI values.
+
+        Pass ``out`` (float64, one value per bar) to reuse an output
+        buffer across calls.
+        """
+        columns = _columns(data, 'High', 'Low', 'Close', 'Volume')
+        mfi = _mfi if NUMBA_AVAILABLE else _mfi_numpy
+        return mfi(*columns, self.period, _output(out, (len(data),)))
+
+    def reset(self) -> None:
+        """Reset streaming state."""
+        self._prev_tp: Optional[float] = None
+        self._pmf = _RollingSum(self.period)
+        self._nmf = _RollingSum(self.period)
+
+    def update(self, high: float, low: float, close: float, volume: float) -> float:
+        """Update MFI with newest bar."""
+        tp = (high + low + close) / 3
+        mf = tp * volume
+
+        prev, self._prev_tp = self._prev_tp, tp
+        rising = prev is not None and tp > prev
+        falling = prev is not None and tp < prev
+
+        pmf = self._pmf.push(mf if rising else 0.0)
+        nmf = self._nmf.push(mf if falling else 0.0)
+
+        if math.isnan(pmf) or (pmf == 0 and nmf == 0):
+            return np.nan
+        if nmf == 0:
+            return 100.0
+        return 100 - 100 / (1 + pmf / nmf)
@@ -2,7 +2,7 @@ from typing import Optional, Union
 import numpy as np
 import pandas as pd
 
-from .base import Indicator
+from .base import Indicator, _rolling, _ewm
 
 class SMA(Indicator):
     """
@@ -17,9 +17,7 @@ class SMA(Indicator):
 
     def calculate(self, data: Union[pd.Series, np.ndarray]) -> np.ndarray:
         """Calculate SMA values."""
-        if isinstance(data, pd.Series):
-            data = data.values
-        return pd.Series(data).rolling(window=self.period).mean().values
+        return _rolling(np.asarray(data, dtype=np.float64), self.period, 'mean')
 
 class EMA(Indicator):
     """
@@ -34,9 +32,8 @@ class EMA(Indicator):
 
     def calculate(self, data: Union[pd.Series, np.ndarray]) -> np.ndarray:
         """Calculate EMA values."""
-        if isinstance(data, pd.Series):
-            data = data.values
-        return pd.Series(data).ewm(span=self.period, adjust=False).mean().values
+        values = np.ascontiguousarray(data, dtype=np.float64)
+        return _ewm(values, 2.0 / (self.period + 1))
 
 class TEMA(Indicator):
     """
@@ -51,22 +48,19 @@ class TEMA(Indicator):
 
     def calculate(self, data: Union[pd.Series, np.ndarray]) -> np.ndarray:
         """Calculate TEMA values."""
-        if isinstance(data, pd.Series):
-            data = data.values
+        alpha = 2.0 / (self.period + 1)
 
         # Calculate first EMA
-        ema1 = pd.Series(data).ewm(span=self.period, adjust=False).mean()
+        ema1 = _ewm(np.ascontiguousarray(data, dtype=np.float64), alpha)
 
         # Calculate second EMA
-        ema2 = ema1.ewm(span=self.period, adjust=False).mean()
+        ema2 = _ewm(ema1, alpha)
 
         # Calculate third EMA
-        ema3 = ema2.ewm(span=self.period, adjust=False).mean()
+        ema3 = _ewm(ema2, alpha)
 
         # Calculate TEMA
-        tema = 3 * ema1 - 3 * ema2 + ema3
-
-        return tema.values
+        return 3 * ema1 - 3 * ema2 + ema3
 
 class DEMA(Indicator):
     """
@@ -81,19 +75,16 @@ class DEMA(Indicator):
 
     def calculate(self, data: Union[pd.Series, np.ndarray]) -> np.ndarray:
         """Calculate DEMA values."""
-        if isinstance(data, pd.Series):
-            data = data.values
+        alpha = 2.0 / (self.period + 1)
 
         # Calculate first EMA
-        ema1 = pd.Series(data).ewm(span=self.period, adjust=False).mean()
+        ema1 = _ewm(np.ascontiguousarray(data, dtype=np.float64), alpha)
 
         # Calculate second EMA
-        ema2 = ema1.ewm(span=self.period, adjust=False).mean()
+        ema2 = _ewm(ema1, alpha)
 
         # Calculate DEMA
-        dema = 2 * ema1 - ema2
-
-        return dema.values
+        return 2 * ema1 - ema2
 
 class WMA(Indicator):
     """
@@ -2,7 +2,7 @@ from typing import Optional, Union, Tuple
 import numpy as np
 import pandas as pd
 
-from .base import Indicator
+from .base import Indicator, _rolling, _ewm
 
 class ATR(Indicator):
     """
@@ -18,9 +18,9 @@ class ATR(Indicator):
 
     def calculate(self, data: pd.DataFrame) -> np.ndarray:
         """Calculate ATR values."""
-        high = data['High'].values
-        low = data['Low'].values
-        close = data['Close'].values
+        high = data['High'].to_numpy(dtype=np.float64)
+        low = data['Low'].to_numpy(dtype=np.float64)
+        close = data['Close'].to_numpy(dtype=np.float64)
 
         # Calculate True Range
         tr1 = high - low
@@ -30,12 +30,12 @@ class ATR(Indicator):
         tr = np.maximum(tr1, np.maximum(tr2, tr3))
 
         # Calculate ATR
-        atr = pd.Series(tr).ewm(span=self.period, adjust=False).mean()
+        atr = _ewm(tr, 2.0 / (self.period + 1))
 
         # Set first value to nan
-        atr.iloc[0] = np.nan
+        atr[0] = np.nan
 
-        return atr.values
+        return atr
 
 class Bollinger(Indicator):
     """
@@ -55,20 +55,19 @@ class Bollinger(Indicator):
 
     def calculate(self, data: Union[pd.Series, np.ndarray]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """Calculate Bollinger Bands values."""
-        if isinstance(data, pd.Series):
-            data = data.values
+        data = np.asarray(data, dtype=np.float64)
 
         # Calculate middle band (SMA)
-        middle = pd.Series(data).rolling(window=self.period).mean()
+        middle = _rolling(data, self.period, 'mean')
 
         # Calculate standard deviation
-        std = pd.Series(data).rolling(window=self.period).std()
+        std = _rolling(data, self.period, 'std', ddof=1)
 
         # Calculate upper and lower bands
         upper = middle + (std * self.multiplier)
         lower = middle - (std * self.multiplier)
 
-        return middle.values, upper.values, lower.values
+        return middle, upper, lower
 
 
 class Keltner(Indicator):
@@ -91,10 +90,10 @@ class Keltner(Indicator):
 
     def calculate(self, data: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """Calculate Keltner Channels values."""
-        close = data['Close'].values
+        close = data['Close'].to_numpy(dtype=np.float64)
 
         # Calculate middle line (EMA)
-        middle = pd.Series(close).ewm(span=self.period, adjust=False).mean()
+        middle = _ewm(close, 2.0 / (self.period + 1))
 
         # Calculate ATR
         atr = ATR(period=self.atr_period).calculate(data)
@@ -103,7 +102,7 @@ class Keltner(Indicator):
         upper = middle + (self.multiplier * atr)
         lower = middle - (self.multiplier * atr)
 
-        return middle.values, upper.values, lower.values
+        return middle, upper, lower
 
 class StandardDev(Indicator):
     """
@@ -119,10 +118,7 @@ class StandardDev(Indicator):
 
     def calculate(self, data: Union[pd.Series, np.ndarray]) -> np.ndarray:
         """Calculate Standard Deviation values."""
-        if isinstance(data, pd.Series):
-            data = data.values
-
-        return pd.Series(data).rolling(window=self.period).std().values
+        return _rolling(np.asarray(data, dtype=np.float64), self.period, 'std', ddof=1)
 
 class ParabolicSAR(Indicator):
     """
@@ -22,8 +22,201 @@ import numpy as np
 from datetime import datetime, timedelta
 
 from .base import StrategyBase, Order, Position
+from ._jit import njit, NUMBA_AVAILABLE
+from .indicators.base import Indicator, _rolling
 from ..core.data import MarketData
-from ..indicators import SMA, RSI, ATR, MACD
+from .indicators import SMA, RSI, ATR, MACD, Bollinger
+
+@njit(cache=True)
+def _rolling_extreme(values: np.ndarray, period: int, maximum: bool) -> np.ndarray:
+    """
+    Rolling max (or min) via monotonic deque, amortized O(1) per bar.
+
+    The deque holds indices of values that can still become the window
+    extreme, best first, in a ring buffer of ``period`` slots.
+
+    Returns:
+        Window extremes (NaN until first full window or for windows
+        containing NaN)
+    """
+    n = values.shape[0]
+    out = np.full(n, np.nan)
+    ring = np.empty(period, dtype=np.int64)
+    head = 0
+    size = 0
+    sign = 1.0 if maximum else -1.0
+    last_nan = -period
+
+    for i in range(n):
+        # Drop index leaving window
+        if size > 0 and ring[head] <= i - period:
+            head = (head + 1) % period
+            size -= 1
+
+        value = values[i]
+        if value != value:
+            last_nan = i
+        else:
+            # Drop values that can no longer be the extreme
+            key = value * sign
+            while size > 0 and values[ring[(head + size - 1) % period]] * sign <= key:
+                size -= 1
+            ring[(head + size) % period] = i
+            size += 1
+
+        if i >= period - 1 and i - last_nan >= period:
+            out[i] = values[ring[head]]
+
+    return out
+
+@njit(cache=True)
+def _mean_reversion_indicators(close: np.ndarray,
+                               rsi_period: int,
+                               bb_period: int,
+                               bb_std: float):
+    """
+    Compute RSI and Bollinger Bands in one pass over close prices.
+
+    RSI uses Wilder smoothing (as ``RSI``); bands use the rolling mean
+    and sample standard deviation (as ``Bollinger``), kept as running
+    sums of values shifted by the first close to limit cancellation.
+
+    Returns:
+        (rsi, upper band, middle band, lower band)
+    """
+    n = close.shape[0]
+    rsi = np.full(n, np.nan)
+    upper = np.full(n, np.nan)
+    middle = np.full(n, np.nan)
+    lower = np.full(n, np.nan)
+    if n == 0:
+        return rsi, upper, middle, lower
+
+    shift = close[0]
+    total = 0.0
+    total_sq = 0.0
+    last_nan = -bb_period
+    avg_gain = 0.0
+    avg_loss = 0.0
+
+    for i in range(n):
+        # RSI
+        if i > 0:
+            change = close[i] - close[i - 1]
+            gain = change if change > 0 else 0.0
+            loss = -change if change < 0 else 0.0
+            if i <= rsi_period:
+                # Seed with simple average of first changes
+                avg_gain += gain / rsi_period
+                avg_loss += loss / rsi_period
+            else:
+                avg_gain = (avg_gain * (rsi_period - 1) + gain) / rsi_period
+                avg_loss = (avg_loss * (rsi_period - 1) + loss) / rsi_period
+            if i >= rsi_period:
+                if avg_loss == 0.0:
+                    rsi[i] = 100.0
+                else:
+                    rsi[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+        # Bollinger Bands
+        value = close[i] - shift
+        if value != value:
+            last_nan = i
+        else:
+            total += value
+            total_sq += value * value
+        if i >= bb_period:
+            old = close[i - bb_period] - shift
+            if old == old:
+                total -= old
+                total_sq -= old * old
+
+        if i >= bb_period - 1 and i - last_nan >= bb_period:
+            mean = total / bb_period
+            if bb_period > 1:
+                var = (total_sq - total * mean) / (bb_period - 1)
+                std = np.sqrt(var) if var > 0.0 else 0.0
+            else:
+                std = np.nan
+            middle[i] = mean + shift
+            upper[i] = middle[i] + std * bb_std
+            lower[i] = middle[i] - std * bb_std
+
+    return rsi, upper, middle, lower
+
+class _RollingLevel(Indicator):
+    """Highest (or lowest) value of a column over trailing period."""
+
+    def __init__(self, column: str, period: int, maximum: bool = True):
+        self.column = column
+        self.period = period
+        self.maximum = maximum
+
+    def calculate(self, data: pd.DataFrame) -> np.ndarray:
+        """
+        Calculate rolling extreme (NaN until first full window).
+
+        Uses the deque kernel when numba is installed, otherwise
+        bottleneck or strided NumPy windows.
+        """
+        values = data[self.column].to_numpy(dtype=np.float64)
+        if NUMBA_AVAILABLE:
+            return _rolling_extreme(values, self.period, self.maximum)
+        return _rolling(values, self.period, 'max' if self.maximum else 'min')
+
+@njit(cache=True)
+def _trend_signals(close: np.ndarray,
+                   sma: np.ndarray,
+                   atr: np.ndarray,
+                   entry_threshold: float,
+                   exit_threshold: float,
+                   stop_loss: float,
+                   take_profit: float):
+    """
+    Compute trend strength signals for every bar.
+
+    Trend strength is ``(close - sma) / atr``; bars with NaN inputs or
+    zero ATR give no signal.
+
+    Returns:
+        (strength, entries, exits, stop levels, take-profit levels) per
+        bar; strength is NaN where it's undefined
+    """
+    n = close.shape[0]
+    strength = np.full(n, np.nan)
+    entries = np.zeros(n, dtype=np.bool_)
+    exits = np.zeros(n, dtype=np.bool_)
+    sl = np.empty(n)
+    tp = np.empty(n)
+
+    for i in range(n):
+        sl[i] = close[i] * (1.0 - stop_loss)
+        tp[i] = close[i] * (1.0 + take_profit)
+        if atr[i] != 0.0:
+            strength[i] = (close[i] - sma[i]) / atr[i]
+            entries[i] = strength[i] > entry_threshold
+            exits[i] = strength[i] < exit_threshold
+
+    return strength, entries, exits, sl, tp
+
+def _trend_signals_numpy(close: np.ndarray,
+                         sma: np.ndarray,
+                         atr: np.ndarray,
+                         entry_threshold: float,
+                         exit_threshold: float,
+                         stop_loss: float,
+                         take_profit: float):
+    """NumPy version of ``_trend_signals``, used without numba."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        strength = np.where(atr != 0.0, (close - sma) / atr, np.nan)
+
+    return (
+        strength,
+        strength > entry_threshold,
+        strength < exit_threshold,
+        close * (1.0 - stop_loss),
+        close * (1.0 + take_profit)
+    )
 
 class TrendStrategy(StrategyBase):
     """
@@ -68,6 +261,21 @@ class TrendStrategy(StrategyBase):
         self.sma = self.add_indicator('SMA', SMA, self.data.Close, period)
         self.atr = self.add_indicator('ATR', ATR, self.data, period)
 
+        # Precompute trend strength and signals for every bar; next()
+        # replays them by bar index
+        params = self.config.parameters
+        self._period = period
+        signals = _trend_signals if NUMBA_AVAILABLE else _trend_signals_numpy
+        self.trend_strength, self._entries, self._exits, self._sl, self._tp = signals(
+            np.asarray(self.data.Close, dtype=np.float64),
+            np.asarray(self.sma, dtype=np.float64),
+            np.asarray(self.atr, dtype=np.float64),
+            float(params['entry_threshold']),
+            float(params['exit_threshold']),
+            float(params['stop_loss']),
+            float(params['take_profit'])
+        )
+
         # Add visualization settings
         self.plot_settings = {
             'SMA': {'color': 'blue', 'width': 2},
@@ -76,25 +284,20 @@ class TrendStrategy(StrategyBase):
 
     def next(self) -> None:
         """Generate trading signals."""
-        if len(self.data) < self.config.parameters['trend_period']:
+        bars = len(self.data)
+        if bars < self._period:
             return
 
-        current_price = self.data.Close[-1]
-
-        # Calculate trend signals
-        trend_strength = (current_price - self.sma[-1]) / self.atr[-1]
+        i = bars - 1
 
         # Check entry conditions
         if not self.position.is_open:
-            if trend_strength > self.config.parameters['entry_threshold']:
-                self.buy(
-                    sl=current_price * (1 - self.config.parameters['stop_loss']),
-                    tp=current_price * (1 + self.config.parameters['take_profit'])
-                )
+            if self._entries[i]:
+                self.buy(sl=self._sl[i], tp=self._tp[i])
 
         # Check exit conditions
         else:
-            if trend_strength < self.config.parameters['exit_threshold']:
+            if self._exits[i]:
                 self.close()
 
     @classmethod
@@ -157,9 +360,21 @@ class MeanReversionStrategy(StrategyBase):
         bb_period = self.config.parameters.get('bb_period', 20)
         bb_std = self.config.parameters.get('bb_std', 2.0)
 
-        # Calculate indicators
-        self.rsi = self.add_indicator('RSI', RSI, self.data.Close, rsi_period)
-        self.bb_upper, self.bb_lower = self.calculate_bands(bb_period, bb_std)
+        # Calculate RSI and bands, in one pass over closes with numba
+        close = np.asarray(self.data.Close, dtype=np.float64)
+        if NUMBA_AVAILABLE:
+            indicators = _mean_reversion_indicators(
+                close,
+                int(rsi_period),
+                int(bb_period),
+                float(bb_std)
+            )
+            self.rsi, self.bb_upper, self.bb_middle, self.bb_lower = indicators
+        else:
+            self.rsi = RSI(int(rsi_period)).calculate(close)
+            self.bb_middle, self.bb_upper, self.bb_lower = Bollinger(
+                int(bb_period), float(bb_std)
+            ).calculate(close)
 
         # Add visualization
         self.plot_settings = {
@@ -219,8 +434,10 @@ class BreakoutStrategy(StrategyBase):
         atr_period = self.config.parameters.get('atr_period', 14)
 
         # Calculate levels
-        self.highs = self.add_indicator('Highs', pd.Series.rolling, self.data.High, period, lambda x: x.max())
-        self.lows = self.add_indicator('Lows', pd.Series.rolling, self.data.Low, period, lambda x: x.min())
+        self.highs = self.add_indicator('Highs',
+                                        _RollingLevel('High', period, maximum=True))
+        self.lows = self.add_indicator('Lows',
+                                       _RollingLevel('Low', period, maximum=False))
         self.atr = self.add_indicator('ATR', ATR, self.data, atr_period)
 
         self.plot_settings = {
@@ -1,14 +1,39 @@
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Any, Type
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Tuple, Type
 import pandas as pd
 import numpy as np
 from datetime import datetime
+import inspect
 import logging
+import re
 
 from .base import StrategyBase
 
 logger = logging.getLogger(__name__)
 
+# Risk check name and source term looked for by risk validation
+_RISK_TERMS = (
+    ('stop_loss', 'stop_loss'),
+    ('take_profit', 'take_profit'),
+    ('position_sizing', 'position_size')
+)
+_RISK_PATTERN = re.compile('|'.join(re.escape(term) for _, term in _RISK_TERMS))
+
+@lru_cache(maxsize=256)
+def _risk_flags(strategy_class: type) -> Tuple[bool, ...]:
+    """
+    Check which risk terms appear in strategy source.
+
+    Cached per class, since sweeps validate the same class many times.
+    The source is scanned once for all terms.
+
+    Returns:
+        Flag per ``_RISK_TERMS`` entry
+    """
+    found = set(_RISK_PATTERN.findall(inspect.getsource(strategy_class)))
+    return tuple(term in found for _, term in _RISK_TERMS)
+
 @dataclass
 class ValidationResult:
     """Result of a single validation check."""
@@ -246,20 +271,12 @@ class StrategyValidator:
                     message="Missing position management"
                 )
 
-            # Check stop loss / take profit
+            # Check stop loss / take profit / position sizing in source
             risk_checks = {
-                'stop_loss': False,
-                'take_profit': False,
-                'position_sizing': False
+                name: flag
+                for (name, _), flag in zip(_RISK_TERMS, _risk_flags(strategy_class))
             }
 
-            # Analyze source code
-            import inspect
-            source = inspect.getsource(strategy_class)
-            risk_checks['stop_loss'] = 'stop_loss' in source
-            risk_checks['take_profit'] = 'take_profit' in source
-            risk_checks['position_sizing'] = 'position_size' in source
-
             missing = [k for k, v in risk_checks.items() if not v]
 
             if missing and self.strict_mode:
@@ -8,6 +8,12 @@ from .parser import PineParser
 
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns used on every conversion
+_ARRAY_INDEX_RE = re.compile(r'\[(\d+)\]')
+_LINE_COMMENT_RE = re.compile(r'//.*$', flags=re.MULTILINE)
+_BLOCK_COMMENT_RE = re.compile(r'/\*.*?\*/', flags=re.DOTALL)
+_VERSION_RE = re.compile(r'//@version=\d+')
+
 
 class PineConverter:
     """
@@ -59,10 +65,17 @@ class PineConverter:
         '%': '%',
     }
 
+    # Operators that actually change when translated
+    _OPERATOR_REPLACEMENTS = [
+        (pine_op, py_op) for pine_op, py_op in OPERATORS.items()
+        if pine_op != py_op
+    ]
+
     def __init__(self):
         """Initialize converter."""
         self.parser = PineParser()
         self.translations: Dict[str, str] = {}
+        self._name_pattern: Optional[re.Pattern] = None
         self.imported_modules: Set[str] = set()
         self.strategy_vars: Dict[str, Any] = {}
         self.indicators: Dict[str, Any] = {}
@@ -140,6 +153,39 @@ class PineConverter:
         # Add common PineScript functions
         self._add_common_translations()
 
+        # Compile name lookup for translation passes
+        self._compile_translations()
+
+    def _compile_translations(self):
+        """
+        Compile all name translations into a single pattern.
+
+        Lets expressions be translated in one regex pass instead of
+        one re.sub per known name. Longer names are tried first so
+        e.g. 'ta.sma' wins over 'ta'.
+        """
+        names = [
+            name for name, translation in self.translations.items()
+            if isinstance(translation, str)
+        ]
+        if not names:
+            self._name_pattern = None
+            return
+
+        names.sort(key=len, reverse=True)
+        self._name_pattern = re.compile(
+            r'\b(?:' + '|'.join(map(re.escape, names)) + r')\b'
+        )
+
+    def _apply_translations(self, text: str) -> str:
+        """Replace known names in text with their translations."""
+        if self._name_pattern is None:
+            return text
+        return self._name_pattern.sub(
+            lambda m: self.translations[m.group(0)],
+            text
+        )
+
     def _generate_builtin_call(self, name: str, func: Any) -> str:
         """Generate code for built-in function call."""
         if name not in self.BUILT_IN_FUNCS:
@@ -170,10 +216,9 @@ class PineConverter:
             else:
                 params.append(param)
 
-        # Convert body
-        body = func.body
-        for old, new in self.translations.items():
-            body = re.sub(r'\b' + old + r'\b', new, body)
+        # Convert body using translations known so far
+        self._compile_translations()
+        body = self._apply_translations(func.body)
 
         # Generate function
         return f"""
@@ -288,15 +333,14 @@ class PineConverter:
         - Common patterns
         """
         # Replace operators
-        for pine_op, py_op in self.OPERATORS.items():
+        for pine_op, py_op in self._OPERATOR_REPLACEMENTS:
             expr = expr.replace(pine_op, py_op)
 
         # Replace variables
-        for name, translation in self.translations.items():
-            expr = re.sub(r'\b' + name + r'\b', translation, expr)
+        expr = self._apply_translations(expr)
 
         # Handle array indexing
-        expr = re.sub(r'\[(\d+)\]', lambda m: f'[-{int(m.group(1))+1}]', expr)
+        expr = _ARRAY_INDEX_RE.sub(lambda m: f'[-{int(m.group(1))+1}]', expr)
 
         # Handle common patterns
         expr = expr.replace('strategy.position_size', 'self.position.size')
@@ -404,12 +448,15 @@ class PineScriptConverter:
             'max_history': 100
         }
 
-    def convert(self, pine_code: str) -> ConversionResult:
+    def convert(self,
+               pine_code: str,
+               template: Optional[str] = None) -> ConversionResult:
         """
         Convert PineScript code to Python.
 
         Args:
             pine_code: Raw PineScript code
+            template: Optional name of template the code was built from
 
         Returns:
             ConversionResult containing:
@@ -441,7 +488,8 @@ class PineScriptConverter:
                 'pine_version': str(self.converter.parser.version),
                 'strategy_name': self.converter.parsed['strategy'].get('title', 'PineStrategy'),
                 'num_indicators': len(self.converter.indicators),
-                'num_variables': len(self.converter.strategy_vars)
+                'num_variables': len(self.converter.strategy_vars),
+                'template': template
             }
 
             # Create result
@@ -562,14 +610,14 @@ class PineScriptConverter:
     def _preprocess_code(self, code: str) -> str:
         """Pre-process PineScript code."""
         # Remove comments
-        code = re.sub(r'//.*$', '', code, flags=re.MULTILINE)
-        code = re.sub(r'/\*.*?\*/', '', code, flags=re.DOTALL)
+        code = _LINE_COMMENT_RE.sub('', code)
+        code = _BLOCK_COMMENT_RE.sub('', code)
 
         # Normalize whitespace
         code = code.strip()
 
         # Add version if missing
-        if not re.search(r'//@version=\d+', code):
+        if not _VERSION_RE.search(code):
             code = "//@version=5\n" + code
 
         return code
@@ -592,6 +640,15 @@ class PineScriptConverter:
 
         return code
 
+    def warmup(self):
+        """
+        Load lazily imported dependencies ahead of first conversion.
+
+        Safe to call from a background thread.
+        """
+        if self.settings['auto_format']:
+            self._format_code('')
+
     def _format_code(self, code: str) -> str:
         """Format Python code."""
         try:
@@ -8,6 +8,9 @@ from algame.strategy.indicators import (
     EMA,
     RSI,
     MACD,
+    Stochastic,
+    ROC,
+    MFI,
     Bollinger,
     ATR
 )
@@ -59,6 +62,21 @@ def test_sma_indicator(prices):
     expected = prices.rolling(window=20).mean().values
     np.testing.assert_array_almost_equal(result, expected)
 
+@pytest.mark.parametrize('period', [5, 50])
+def test_rolling_without_bottleneck(monkeypatch, prices, period):
+    """Test strided (small) and pandas (large) rolling windows."""
+    from algame.strategy.indicators import base
+    monkeypatch.setattr(base, 'bn', None)
+
+    prices = prices.copy()
+    prices.iloc[60] = np.nan
+    middle, upper, _ = Bollinger(period, 2.0).calculate(prices)
+
+    rolling = prices.rolling(period)
+    sma = SMA(period=period).calculate(prices)
+    np.testing.assert_array_almost_equal(sma, rolling.mean())
+    np.testing.assert_array_almost_equal(upper, rolling.mean() + 2.0 * rolling.std())
+
 def test_ema_indicator(prices):
     """Test Exponential Moving Average."""
     ema = EMA(period=20)
@@ -71,6 +89,18 @@ def test_ema_indicator(prices):
     expected = prices.ewm(span=20, adjust=False).mean().values
     np.testing.assert_array_almost_equal(result, expected)
 
+def test_ema_without_numba(monkeypatch, prices):
+    """Test EMA falls back to pandas without numba."""
+    from algame.strategy.indicators import base
+    monkeypatch.setattr(base, 'NUMBA_AVAILABLE', False)
+
+    prices = prices.copy()
+    prices.iloc[[0, 30, 31]] = np.nan
+    result = EMA(period=20).calculate(prices)
+
+    expected = prices.ewm(span=20, adjust=False).mean().values
+    np.testing.assert_array_almost_equal(result, expected)
+
 def test_rsi_indicator(prices):
     """Test Relative Strength Index."""
     rsi = RSI(period=14)
@@ -80,6 +110,101 @@ def test_rsi_indicator(prices):
     assert len(result) == len(prices)
     assert np.all((result >= 0) & (result <= 100))  # RSI should be between 0 and 100
 
+def test_rsi_wilder_smoothing(prices):
+    """Test RSI uses Wilder-smoothed averages."""
+    period = 14
+    result = RSI(period=period).calculate(prices)
+
+    changes = np.diff(prices.values)
+    gains = np.where(changes > 0, changes, 0.0)
+    losses = np.where(changes < 0, -changes, 0.0)
+
+    # Seed with simple average, then smooth
+    avg_gain, avg_loss = gains[:period].mean(), losses[:period].mean()
+    expected = [100 - 100 / (1 + avg_gain / avg_loss)]
+    for gain, loss in zip(gains[period:], losses[period:]):
+        avg_gain = (avg_gain * (period - 1) + gain) / period
+        avg_loss = (avg_loss * (period - 1) + loss) / period
+        expected.append(100 - 100 / (1 + avg_gain / avg_loss))
+
+    assert np.all(np.isnan(result[:period]))
+    np.testing.assert_array_almost_equal(result[period:], expected)
+
+def test_builder_kernels_match_indicators(prices):
+    """Test builder kernels match indicator classes on data with gaps."""
+    from algame.strategy.builder.kernels import KERNELS
+    from algame.strategy.indicators import WMA
+
+    prices = prices.copy()
+    prices.iloc[[0, 10, 40, 41]] = np.nan
+    values = prices.to_numpy()
+
+    for indicator_class in (SMA, EMA, WMA, RSI):
+        expected = indicator_class(period=5).calculate(prices)
+        result = KERNELS[indicator_class.__name__](values, 5)
+        np.testing.assert_array_almost_equal(result, expected)
+
+def test_momentum_without_numba(monkeypatch, prices, ohlcv_data):
+    """Test NumPy paths used without numba match kernels."""
+    from algame.strategy.indicators import momentum
+    closes = pd.DataFrame({'A': prices, 'B': prices * 2})
+
+    indicators = [
+        (RSI(period=14), prices),
+        (MACD(), prices),
+        (MFI(), ohlcv_data.astype(float)),
+        (RSI(period=14), closes),
+        (MACD(), closes)
+    ]
+    expected = [indicator.calculate(data) for indicator, data in indicators]
+
+    monkeypatch.setattr(momentum, 'NUMBA_AVAILABLE', False)
+
+    for (indicator, data), kernel in zip(indicators, expected):
+        result = np.asarray(indicator.calculate(data))
+        np.testing.assert_array_almost_equal(result, np.asarray(kernel))
+
+def test_streaming_updates(prices, ohlcv_data):
+    """Test streaming updates match full calculation."""
+    # Single-price indicators
+    for indicator in (RSI(period=14), ROC(period=10)):
+        expected = indicator.calculate(prices)
+        streamed = [indicator.update(price) for price in prices]
+        np.testing.assert_array_almost_equal(streamed, expected)
+
+    macd = MACD()
+    expected = np.column_stack(macd.calculate(prices))
+    streamed = [macd.update(price) for price in prices]
+    np.testing.assert_array_almost_equal(streamed, expected)
+
+    # Bar indicators
+    bars = ohlcv_data.astype(float)
+    stoch = Stochastic()
+    expected = np.column_stack(stoch.calculate(bars))
+    streamed = [stoch.update(bar.High, bar.Low, bar.Close) for bar in bars.itertuples()]
+    np.testing.assert_array_almost_equal(streamed, expected)
+
+    mfi = MFI()
+    expected = mfi.calculate(bars)
+    streamed = [mfi.update(bar.High, bar.Low, bar.Close, bar.Volume)
+                for bar in bars.itertuples()]
+    np.testing.assert_array_almost_equal(streamed, expected)
+
+def test_multi_symbol_calculation(prices):
+    """Test 2D input is calculated per symbol."""
+    closes = pd.DataFrame({'A': prices, 'B': prices * 2, 'C': prices[::-1].values})
+
+    for indicator in (RSI(period=14), ROC(period=10)):
+        result = indicator.calculate(closes)
+        assert result.shape == closes.shape
+        for i, symbol in enumerate(closes):
+            expected = indicator.calculate(closes[symbol])
+            np.testing.assert_array_almost_equal(result[:, i], expected)
+
+    macd = MACD()
+    for batch, single in zip(macd.calculate(closes), macd.calculate(closes['C'])):
+        np.testing.assert_array_almost_equal(batch[:, 2], single)
+
 def test_macd_indicator(prices):
     """Test MACD indicator."""
     macd = MACD(fast_period=12, slow_period=26, signal_period=9)
@@ -144,6 +269,22 @@ def test_indicator_metadata():
     assert 'period' in params
     assert params['period']['type'] == 'int'
 
+def test_indicator_registry():
+    """Test built-in indicator listing and lookup."""
+    from algame.strategy.indicators import (
+        get_indicator,
+        list_indicators,
+        list_indicator_categories
+    )
+
+    names = {info['name'] for info in list_indicators()}
+    assert {'SMA', 'RSI', 'Bollinger'} <= names
+    assert list_indicator_categories() == ['Momentum', 'Trend', 'Volatility']
+    assert get_indicator('RSI') is RSI
+
+    with pytest.raises(ValueError):
+        get_indicator('OBV')
+
 def test_indicator_chaining():
     """Test using one indicator's output as another's input."""
     prices = pd.Series(np.random.randn(100).cumsum() + 100)
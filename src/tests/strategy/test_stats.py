@@ -0,0 +1,116 @@
+import pytest
+import numpy as np
+import pandas as pd
+
+from algame.strategy import _stats
+from algame.strategy._stats import (
+    moments4,
+    equity_stats,
+    sharpe_ratio,
+    sortino_ratio,
+    calmar_ratio,
+    recovery_factor,
+    max_drawdown_duration
+)
+
+@pytest.fixture
+def returns():
+    """Generate sample return series."""
+    rng = np.random.default_rng(42)
+    return pd.Series(rng.normal(0.0005, 0.01, 500))
+
+@pytest.fixture
+def equity(returns):
+    """Generate sample equity curve."""
+    return (1 + returns).cumprod() * 100000
+
+def test_moments4(returns):
+    """Test fused moments match pandas."""
+    mean, std, skew, kurt = moments4(returns.to_numpy())
+
+    assert mean == pytest.approx(returns.mean())
+    assert std == pytest.approx(returns.std())
+    assert skew == pytest.approx(returns.skew())
+    assert kurt == pytest.approx(returns.kurt())
+
+def test_equity_stats(equity):
+    """Test single-pass returns and drawdowns match pandas."""
+    equity = equity.copy()
+    equity.iloc[10] = np.nan
+
+    returns, running_max, drawdowns = equity_stats(equity.to_numpy())
+
+    peak = equity.expanding().max()
+    expected = equity.pct_change(fill_method=None)
+    np.testing.assert_allclose(returns, expected, equal_nan=True)
+    np.testing.assert_allclose(running_max, peak, equal_nan=True)
+    np.testing.assert_allclose(drawdowns, (equity - peak) / peak * 100, equal_nan=True)
+
+def test_numpy_fallback(monkeypatch, returns, equity):
+    """Test NumPy paths used without numba match kernels."""
+    equity = equity.to_numpy().copy()
+    equity[10] = np.nan
+    expected = (moments4(returns.to_numpy()), equity_stats(equity))
+
+    monkeypatch.setattr(_stats, 'NUMBA_AVAILABLE', False)
+
+    np.testing.assert_allclose(moments4(returns.to_numpy()), expected[0])
+    for actual, kernel in zip(equity_stats(equity), expected[1]):
+        np.testing.assert_allclose(actual, kernel, equal_nan=True)
+
+def test_ratios_numpy_fallback(monkeypatch, returns, equity):
+    """Test ratios without numba match kernels."""
+    values = returns.to_numpy()
+    curve = equity.to_numpy()
+    funcs = (
+        lambda: sharpe_ratio(values, 0.02),
+        lambda: sortino_ratio(values, 0.02),
+        lambda: calmar_ratio(curve),
+        lambda: recovery_factor(curve),
+        lambda: max_drawdown_duration(curve)
+    )
+    expected = [f() for f in funcs]
+
+    monkeypatch.setattr(_stats, 'NUMBA_AVAILABLE', False)
+
+    assert [f() for f in funcs] == pytest.approx(expected)
+
+def test_ratios(returns, equity):
+    """Test Sharpe, Sortino and Calmar ratios."""
+    excess = returns - 0.02 / 252
+    downside = np.sqrt((np.minimum(excess, 0) ** 2).mean())
+
+    assert sharpe_ratio(returns.to_numpy(), 0.02) == pytest.approx(
+        excess.mean() / excess.std() * np.sqrt(252)
+    )
+    assert sortino_ratio(returns.to_numpy(), 0.02) == pytest.approx(
+        excess.mean() / downside * np.sqrt(252)
+    )
+
+    peak = equity.cummax()
+    annual = (equity.iloc[-1] / equity.iloc[0]) ** (252 / (len(equity) - 1)) - 1
+    assert calmar_ratio(equity.to_numpy()) == pytest.approx(
+        annual / ((peak - equity) / peak).max()
+    )
+    assert recovery_factor(equity.to_numpy()) == pytest.approx(
+        (equity.iloc[-1] - equity.iloc[0]) / (peak - equity).max()
+    )
+
+def test_max_drawdown_duration():
+    """Test longest drawdown in bars."""
+    equity = np.array([100, 90, 95, 101, 100, 99, 98, 102, 101])
+    assert max_drawdown_duration(equity) == 3
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(_stats, 'NUMBA_AVAILABLE', False)
+        assert max_drawdown_duration(equity) == 3
+
+def test_empty_inputs():
+    """Test undefined ratios return 0."""
+    empty = np.array([])
+
+    assert sharpe_ratio(empty) == 0
+    assert sortino_ratio(empty) == 0
+    assert calmar_ratio(empty) == 0
+    assert recovery_factor(empty) == 0
+    assert max_drawdown_duration(empty) == 0
@@ -330,6 +330,28 @@ def test_strategy_templates():
     mean_rev = MeanReversionStrategy({'lookback': 20})
     assert hasattr(mean_rev, 'lookback')
 
+@pytest.mark.parametrize('numba', [True, False])
+def test_breakout_levels(monkeypatch, sample_data, numba):
+    """Test breakout levels match pandas rolling max/min."""
+    from algame.strategy import template
+    monkeypatch.setattr(template, 'NUMBA_AVAILABLE', numba)
+
+    data = sample_data.copy()
+    data.iloc[30, data.columns.get_loc('High')] = np.nan
+
+    for column, maximum in (('High', True), ('Low', False)):
+        rolling = data[column].rolling(20)
+        expected = rolling.max() if maximum else rolling.min()
+
+        levels = template._RollingLevel(column, 20, maximum).calculate(data)
+        np.testing.assert_allclose(levels, expected, equal_nan=True)
+
+        # Kernel directly, compiled or not
+        values = data[column].to_numpy(dtype=np.float64)
+        np.testing.assert_allclose(
+            template._rolling_extreme(values, 20, maximum), expected, equal_nan=True
+        )
+
 def test_strategy_optimization_results(strategy, sample_data):
     """Test handling optimization results."""
     # Create optimization results
@@ -361,5 +383,103 @@ def test_strategy_position_analysis(strategy, sample_data):
     assert position_info['cost_basis'] == 100.0
     assert position_info['market_value'] == position_info['size'] * sample_data['Close'][-1]
 
+def test_position_pnls_array():
+    """Test vectorized trade P&L matches trade records."""
+    position = Position()
+    time = datetime(2020, 1, 1)
+
+    position.add_order(Order(type='buy', size=10))
+    position.update(100.0, time)
+    position.add_order(Order(type='sell', size=20))  # Reverse to short
+    position.update(110.0, time)
+    position.add_order(Order(type='buy', size=10))
+    position.update(105.0, time)
+
+    pnls = position.pnls_array()
+    assert np.allclose(pnls, [t.pnl for t in position.trades])
+    assert np.allclose(pnls, [100.0, 50.0])
+
+@pytest.mark.parametrize('n_orders', [4, 20])
+def test_position_update_vectorized(n_orders):
+    """Test vectorized trigger bars match per-bar update fills."""
+    rng = np.random.default_rng(0)
+    prices = 100 + rng.normal(0, 1, 200).cumsum()
+    prices[50] = np.nan
+
+    position = Position()
+    orders = [
+        Order(
+            type='buy' if i % 2 else 'sell',
+            size=1,
+            price=None if i % 5 == 0 else 100 + rng.normal(0, 5)
+        )
+        for i in range(n_orders)
+    ]
+    for order in orders:
+        position.add_order(order)
+
+    triggers = position.update_vectorized(prices)
+
+    # Record bar each order fills on with per-bar updates
+    filled = {}
+    for bar, price in enumerate(prices):
+        position.update(price, datetime(2020, 1, 1))
+        for order in orders:
+            if order.status == 'filled':
+                filled.setdefault(id(order), bar)
+
+    expected = [filled.get(id(order), -1) for order in orders]
+    np.testing.assert_array_equal(triggers, expected)
+
+def test_position_fill_triggered_stops():
+    """Test batch fills stop out between fills like per-bar updates."""
+    prices = np.array([100.0, 99.0, 94.0, 97.0, 90.0, 92.0])
+    times = pd.date_range('2020-01-01', periods=len(prices), freq='D')
+
+    positions = (Position(), Position())
+    for position in positions:
+        position.add_order(Order(type='buy', size=1, stop_loss=95.0))
+        position.add_order(Order(type='buy', size=1, price=91.0))
+
+    positions[0].fill_triggered(prices, times)
+    for price, time in zip(prices, times):
+        positions[1].update(price, time)
+
+    for position in positions:
+        # Stopped out at bar 2, before the limit order fills at bar 4
+        exits = [(t.exit_price, t.exit_time) for t in position.trades]
+        assert exits == [(94.0, times[2])]
+        assert position.size == 1
+        assert position.entry_price == 90.0
+        assert position.last_price == 92.0
+        assert position.last_update == times[-1]
+
+def test_order_side_follows_type():
+    """Test order and trade type stay in sync with side."""
+    order = Order(type='buy', size=10, price=100.0)
+    assert order.side == 1 and order.type == 'buy'
+    assert order.is_triggered(99.0)
+
+    order.type = 'sell'
+    assert order.side == -1 and order.type == 'sell'
+    assert not order.is_triggered(99.0)
+
+    trade = Trade(entry_time=datetime(2020, 1, 1), entry_price=100.0, size=1,
+                  type='short')
+    assert trade.side == -1 and trade.type == 'short'
+
+def test_indicator_cache_key(sample_data):
+    """Test equal indicator parameters share a cache key."""
+    from algame.strategy.base import _indicator_key
+    from algame.strategy.indicators import RSI, Stochastic, ROC, MFI
+
+    for indicator_class in (RSI, Stochastic, ROC, MFI):
+        key = _indicator_key(indicator_class(), sample_data, np.float64)
+        assert key is not None
+        assert key == _indicator_key(indicator_class(), sample_data, np.float64)
+
+    assert (_indicator_key(RSI(period=14), sample_data, np.float64) !=
+            _indicator_key(RSI(period=10), sample_data, np.float64))
+
 if __name__ == '__main__':
     pytest.main([__file__])